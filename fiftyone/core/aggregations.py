@@ -8,10 +8,15 @@ Aggregations.
 from collections import defaultdict, OrderedDict
 from copy import deepcopy
 from datetime import date, datetime
+import functools
 import inspect
+import itertools
 import reprlib
+import struct
 import uuid
 
+import bson
+from bson.raw_bson import RawBSONDocument
 import numpy as np
 
 import eta.core.utils as etau
@@ -23,8 +28,11 @@ from fiftyone.core.expressions import ViewField as F
 import fiftyone.core.fields as fof
 import fiftyone.core.labels as fol
 import fiftyone.core.media as fom
+import fiftyone.core.odm as foo
 import fiftyone.core.utils as fou
 
+pa = fou.lazy_import("pyarrow", callback=lambda: fou.ensure_package("pyarrow"))
+
 
 class Aggregation(object):
     """Abstract base class for all aggregations.
@@ -124,6 +132,16 @@ class Aggregation(object):
         """
         return False
 
+    @property
+    def _has_raw_result(self):
+        """Whether the aggregation has big results that are parsed from raw
+        BSON batches rather than from decoded documents.
+
+        :class:`Aggregation` classes for which :meth:`_has_raw_result` may be
+        ``True`` must implement :meth:`_parse_raw_result`.
+        """
+        return False
+
     def to_mongo(self, sample_collection, context=None):
         """Returns the MongoDB aggregation pipeline for this aggregation.
 
@@ -150,6 +168,23 @@ class Aggregation(object):
         """
         raise NotImplementedError("subclasses must implement parse_result()")
 
+    def _parse_raw_result(self, batches, codec_options):
+        """Parses the output of :meth:`to_mongo` when
+        :meth:`_has_raw_result` is True.
+
+        Args:
+            batches: a list of raw BSON batches, each of which contains
+                concatenated result documents
+            codec_options: the ``bson.codec_options.CodecOptions`` with which
+                to decode documents, if necessary
+
+        Returns:
+            the aggregation result
+        """
+        raise NotImplementedError(
+            "subclasses must implement _parse_raw_result()"
+        )
+
     def default_result(self):
         """Returns the default result for this aggregation.
 
@@ -2307,6 +2342,12 @@ class Values(Aggregation):
         unwind (False): whether to automatically unwind all recognized list
             fields (True) or unwind all list fields except the top-level sample
             field (-1)
+        columnar (False): whether to return the values in columnar format.
+            Supported values are:
+
+            -   ``False``: return (nested) lists of values
+            -   ``True`` or ``"numpy"``: return a :class:`ColumnarValues`
+            -   ``"arrow"``: return a ``pyarrow.Array``
     """
 
     def __init__(
@@ -2315,6 +2356,7 @@ class Values(Aggregation):
         expr=None,
         missing_value=None,
         unwind=False,
+        columnar=False,
         _allow_missing=False,
         _big_result=True,
         _raw=False,
@@ -2323,6 +2365,7 @@ class Values(Aggregation):
         super().__init__(field_or_expr, expr=expr)
         self._missing_value = missing_value
         self._unwind = unwind
+        self._columnar = columnar
         self._allow_missing = _allow_missing
         self._big_result = _big_result
         self._raw = _raw
@@ -2338,6 +2381,7 @@ class Values(Aggregation):
             ["expr", self._expr],
             ["missing_value", self._missing_value],
             ["unwind", self._unwind],
+            ["columnar", self._columnar],
             ["_allow_missing", self._allow_missing],
             ["_big_result", self._big_result],
             ["_raw", self._raw],
@@ -2351,18 +2395,26 @@ class Values(Aggregation):
     def _is_big_batchable(self):
         return (
             self._big_result
+            and not self._columnar
             and not self._unwind
             and self._expr is None
             and self._field_name is not None
             and "[]" not in self._field_name
         )
 
+    @property
+    def _has_raw_result(self):
+        return self._big_result and bool(self._columnar)
+
     def default_result(self):
         """Returns the default result for this aggregation.
 
         Returns:
-            ``[]``
+            ``[]``, or an empty columnar result if ``columnar`` is specified
         """
+        if self._columnar:
+            return self._parse_columnar([])
+
         return []
 
     def parse_result(self, d):
@@ -2372,13 +2424,22 @@ class Values(Aggregation):
             d: the result dict
 
         Returns:
-            the list of field values
+            the list of field values, or the columnar values if ``columnar``
+            is specified
         """
         if self._big_result:
             values = [di[self._big_field] for di in d]
         else:
             values = d["values"]
 
+        if self._columnar:
+            if not self._has_raw_columnar_values:
+                fcn = self._field.to_python
+                level = 1 + self._num_list_fields
+                values = _transform_values(values, fcn, level=level)
+
+            return self._parse_columnar(values)
+
         if self._raw:
             return values
 
@@ -2390,6 +2451,54 @@ class Values(Aggregation):
 
         return values
 
+    def _parse_raw_result(self, batches, codec_options):
+        values = None
+
+        # Numeric and boolean values are decoded directly from the raw BSON.
+        # Other values are decoded into documents by the driver
+        if self._has_raw_columnar_values:
+            values = _decode_columnar_values(
+                batches, self._big_field, self._num_list_fields
+            )
+
+        if values is None:
+            docs = []
+            for batch in batches:
+                docs.extend(bson.decode_all(batch, codec_options))
+
+            if not docs:
+                return self.default_result()
+
+            return self.parse_result(docs)
+
+        return self._parse_columnar(values)
+
+    @property
+    def _has_raw_columnar_values(self):
+        # Arrow output is built from the raw values
+        return (
+            self._columnar == "arrow"
+            or self._raw
+            or self._field is None
+            or _is_columnar_primitive(self._field)
+        )
+
+    def _parse_columnar(self, values):
+        if self._columnar not in (True, "numpy", "arrow"):
+            raise ValueError(
+                "Unsupported columnar format '%s'" % self._columnar
+            )
+
+        if not isinstance(values, ColumnarValues):
+            values = ColumnarValues.from_lists(
+                values, num_list_fields=self._num_list_fields or 0
+            )
+
+        if self._columnar == "arrow":
+            return values.to_arrow()
+
+        return values
+
     def to_mongo(self, sample_collection, big_field="values", context=None):
         (
             path,
@@ -2424,6 +2533,716 @@ class Values(Aggregation):
         return pipeline
 
 
+class ColumnarValues(object):
+    """Columnar representation of the potentially-nested lists of values
+    returned by :class:`Values`.
+
+    The leaf values are stored in a single contiguous array, and the nested
+    list structure is encoded via one offsets array per list level, in the
+    same format used by Apache Arrow list arrays. That is, the ``i``th element
+    of the outermost list spans ``offsets[0][i]:offsets[0][i + 1]`` of the
+    next list level, and so on down to the leaf values.
+
+    Leaf values that are themselves lists, such as bounding boxes, are stored
+    as additional dimensions of ``values`` when they all have the same length,
+    and as an additional list level otherwise. Missing float values are
+    represented as ``nan``. Leaves of any other type that contain missing
+    values, and list levels that contain missing lists, are stored as object
+    arrays so that :meth:`tolist` returns the original values.
+
+    Fields that are not numeric, string, or boolean, such as embedded
+    documents or dates, are converted via their ``to_python()`` methods and
+    stored as object arrays. Arrow output is built from the raw database
+    values.
+
+    Numeric and boolean values are decoded directly from the raw BSON batches
+    returned by the database, and passing them to
+    :meth:`set_values() <fiftyone.core.collections.SampleCollection.set_values>`
+    writes existing numeric and boolean sample fields directly from the
+    arrays. Other values are converted to and from lists.
+
+    Examples::
+
+        import fiftyone as fo
+        import fiftyone.zoo as foz
+
+        dataset = foz.load_zoo_dataset("quickstart")
+
+        values = dataset.values(
+            "ground_truth.detections.bounding_box", columnar=True
+        )
+
+        print(values.values.shape)  # (num_objects, 4)
+        print(values.offsets[0])  # objects in sample i: offsets[i]:offsets[i + 1]
+
+        dataset.set_values("ground_truth.detections.bounding_box", values)
+
+    Args:
+        values: a numpy array of leaf values
+        offsets (None): a list of int64 numpy offsets arrays, one per list
+            level, outermost first
+    """
+
+    def __init__(self, values, offsets=None):
+        self.values = values
+        self.offsets = list(offsets) if offsets else []
+
+    def __len__(self):
+        if self.offsets:
+            return len(self.offsets[0]) - 1
+
+        return len(self.values)
+
+    def __repr__(self):
+        return "<%s: len=%d, values.shape=%s, num_list_fields=%d>" % (
+            self.__class__.__name__,
+            len(self),
+            self.values.shape,
+            len(self.offsets),
+        )
+
+    @classmethod
+    def from_lists(cls, values, num_list_fields=0):
+        """Builds a :class:`ColumnarValues` from potentially-nested lists of
+        values.
+
+        Args:
+            values: a list of values
+            num_list_fields (0): the number of nested list levels in
+                ``values``, excluding the outermost list
+
+        Returns:
+            a :class:`ColumnarValues`
+        """
+        offsets = []
+        for _ in range(num_list_fields):
+            if any(v is None for v in values):
+                # Missing lists can't be represented by offsets
+                return cls(_to_object_array(values), offsets=offsets)
+
+            offsets.append(_get_offsets(values))
+            values = list(itertools.chain.from_iterable(values))
+
+        while True:
+            arr = _to_array(values)
+            if arr is not None:
+                break
+
+            offsets.append(_get_offsets(values))
+            values = list(itertools.chain.from_iterable(values))
+
+        return cls(arr, offsets=offsets)
+
+    @classmethod
+    def from_arrow(cls, arr):
+        """Builds a :class:`ColumnarValues` from a ``pyarrow.Array`` or
+        ``pyarrow.ChunkedArray`` of potentially-nested lists of values, such
+        as those returned by :meth:`to_arrow`.
+
+        Args:
+            arr: a ``pyarrow.Array`` or ``pyarrow.ChunkedArray``
+
+        Returns:
+            a :class:`ColumnarValues`
+        """
+        if isinstance(arr, pa.ChunkedArray):
+            arr = arr.combine_chunks()
+
+        offsets = []
+        while pa.types.is_list(arr.type) or pa.types.is_large_list(arr.type):
+            if arr.null_count > 0:
+                # Missing lists can't be represented by offsets
+                return cls(_to_object_array(arr.to_pylist()), offsets=offsets)
+
+            _offsets = arr.offsets.to_numpy().astype(np.int64)
+            offsets.append(_offsets - _offsets[0])
+            arr = arr.flatten()
+
+        return cls(_from_arrow_array(arr), offsets=offsets)
+
+    def tolist(self):
+        """Returns the values as potentially-nested lists, in the format
+        accepted by
+        :meth:`set_values() <fiftyone.core.collections.SampleCollection.set_values>`.
+
+        Returns:
+            a list of values
+        """
+        values = self.values
+        if values.dtype.kind == "f":
+            values = values.astype(object)
+            values[np.isnan(self.values)] = None
+
+        values = values.tolist()
+        for offsets in reversed(self.offsets):
+            values = [
+                values[start:end] for start, end in zip(offsets, offsets[1:])
+            ]
+
+        return values
+
+    def to_arrow(self):
+        """Returns the values as a ``pyarrow.Array``.
+
+        Returns:
+            a ``pyarrow.Array``
+        """
+        arr = _to_arrow_array(self.values)
+        for offsets in reversed(self.offsets):
+            arr = pa.LargeListArray.from_arrays(pa.array(offsets), arr)
+
+        return arr
+
+
+def _get_offsets(values):
+    lengths = np.fromiter(
+        (len(v) for v in values), dtype=np.int64, count=len(values)
+    )
+    offsets = np.zeros(len(values) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+def _to_array(values):
+    try:
+        arr = np.asarray(values)
+    except ValueError:
+        arr = None
+
+    if arr is not None and arr.ndim == 1 and arr.dtype != object:
+        # Numeric, string, or boolean values
+        return arr
+
+    num_lists = sum(isinstance(v, (list, tuple)) for v in values)
+    num_none = sum(v is None for v in values)
+    if num_lists > 0 and num_lists + num_none == len(values):
+        if num_lists < len(values):
+            # Missing lists can't be represented by offsets
+            return _to_object_array(values)
+
+        if len(set(len(v) for v in values)) > 1:
+            # Ragged lists must be stored as another list level
+            return None
+
+    if any(
+        isinstance(v, (np.ndarray, foo.SerializableDocument)) for v in values
+    ):
+        # Arrays, eg from vector fields, and documents are returned as-is
+        return _to_object_array(values)
+
+    if arr is None:
+        return _to_object_array(values)
+
+    if arr.dtype == object and all(
+        v is None or isinstance(v, float) for v in arr.ravel()
+    ):
+        # Missing floats are represented as `nan`
+        arr = arr.astype(float)
+
+    return arr
+
+
+def _is_columnar_primitive(field):
+    while isinstance(field, fof.ListField):
+        field = field.field
+
+    return field is None or isinstance(
+        field,
+        (
+            fof.BooleanField,
+            fof.IntField,
+            fof.FloatField,
+            fof.StringField,
+            fof.ObjectIdField,
+        ),
+    )
+
+
+def _to_object_array(values):
+    # Elements are assigned individually so that lists are not broadcast
+    arr = np.empty(len(values), dtype=object)
+    for idx, value in enumerate(values):
+        arr[idx] = value
+
+    return arr
+
+
+def _to_arrow_array(values):
+    if values.ndim > 1:
+        inner = _to_arrow_array(values.reshape(-1, *values.shape[2:]))
+        return pa.FixedSizeListArray.from_arrays(inner, values.shape[1])
+
+    if values.dtype == object:
+        return pa.array(values.tolist())
+
+    return pa.array(values, from_pandas=True)
+
+
+def _from_arrow_array(arr):
+    if pa.types.is_fixed_size_list(arr.type) and arr.null_count == 0:
+        size = arr.type.list_size
+        inner = _from_arrow_array(arr.flatten())
+        if inner.dtype != object:
+            return inner.reshape(-1, size, *inner.shape[1:])
+
+    if arr.null_count > 0 and not pa.types.is_floating(arr.type):
+        return _to_object_array(arr.to_pylist())
+
+    if pa.types.is_nested(arr.type) or pa.types.is_dictionary(arr.type):
+        return _to_object_array(arr.to_pylist())
+
+    return arr.to_numpy(zero_copy_only=False)
+
+
+def _is_arrow_array(values):
+    try:
+        import pyarrow
+    except ImportError:
+        return False
+
+    return isinstance(values, (pyarrow.Array, pyarrow.ChunkedArray))
+
+
+# BSON element types
+_BSON_DOUBLE = 1
+_BSON_STRING = 2
+_BSON_DOCUMENT = 3
+_BSON_ARRAY = 4
+_BSON_BINARY = 5
+_BSON_OBJECT_ID = 7
+_BSON_BOOL = 8
+_BSON_NULL = 10
+_BSON_INT32 = 16
+_BSON_INT64 = 18
+
+# Sizes of the BSON element types whose values have a fixed size
+_BSON_FIXED_SIZES = {
+    _BSON_DOUBLE: 8,
+    6: 0,  # undefined
+    _BSON_OBJECT_ID: 12,
+    _BSON_BOOL: 1,
+    9: 8,  # datetime
+    _BSON_NULL: 0,
+    16: 4,  # int32
+    17: 8,  # timestamp
+    18: 8,  # int64
+    19: 16,  # decimal128
+    127: 0,  # max key
+    255: 0,  # min key
+}
+
+# The numeric and boolean BSON element types that are decoded into arrays
+_BSON_SCALAR_DTYPES = {
+    _BSON_DOUBLE: np.dtype("<f8"),
+    _BSON_BOOL: np.dtype("u1"),
+    _BSON_INT32: np.dtype("<i4"),
+    _BSON_INT64: np.dtype("<i8"),
+}
+
+# The BSON element types that can be decoded into columnar values
+_BSON_COLUMNAR_TYPES = set(_BSON_SCALAR_DTYPES.keys()) | {
+    _BSON_ARRAY,
+    _BSON_NULL,
+}
+
+_unpack_int32 = struct.Struct("<i").unpack_from
+
+
+def _decode_columnar_values(batches, field, num_list_fields):
+    # Decodes the numeric or boolean values of `field` from raw BSON batches
+    # of result documents into a `ColumnarValues` without decoding the
+    # documents themselves. The documents are traversed one list level at a
+    # time, and arrays whose elements all have the same fixed-size type are
+    # decoded via numpy rather than element-by-element. Returns None if the
+    # values have any other structure, in which case they must be decoded
+    # into lists
+    buf = b"".join(batches)
+    key = field.encode()
+
+    # The value of `field` in each document
+    types = []
+    positions = []
+    pos = 0
+    while pos < len(buf):
+        end = pos + _unpack_int32(buf, pos)[0]
+        pos += 4
+        while pos < end - 1:
+            elem_type = buf[pos]
+            key_end = buf.index(0, pos + 1)
+            if buf[pos + 1 : key_end] == key:
+                if elem_type not in _BSON_COLUMNAR_TYPES:
+                    return None
+
+                types.append(elem_type)
+                positions.append(key_end + 1)
+                break
+
+            size = _BSON_FIXED_SIZES.get(elem_type, None)
+            if size is None:
+                size = _get_bson_size(buf, elem_type, key_end + 1)
+                if size is None:
+                    return None
+
+            pos = key_end + 1 + size
+        else:
+            # Missing values are decoded as lists
+            return None
+
+        pos = end
+
+    data = np.frombuffer(buf, dtype=np.uint8)
+    types = np.array(types, dtype=np.uint8)
+    positions = np.array(positions, dtype=np.int64)
+
+    # The lengths of the arrays at each list level
+    lengths = []
+    while types.size > 0:
+        is_array = types == _BSON_ARRAY
+        if not is_array.all():
+            if is_array.any() or len(lengths) < num_list_fields:
+                return None
+
+            break
+
+        counts, types, positions = _decode_bson_arrays(buf, data, positions)
+        if counts is None:
+            return None
+
+        lengths.append(counts)
+
+    if types.size > 0:
+        values = _decode_bson_scalars(data, types, positions)
+        if values is None:
+            return None
+    else:
+        values = np.array([], dtype=float)
+
+    return _make_columnar_values(values, lengths, num_list_fields)
+
+
+def _decode_bson_arrays(buf, data, positions):
+    # Returns the number of elements in each array and the types and
+    # positions of their elements, in order
+    counts = []
+    elem_types = []
+    elem_positions = []
+    elem_indexes = []
+    runs = defaultdict(list)
+
+    num_elems = 0
+    for pos in positions.tolist():
+        end = pos + _unpack_int32(buf, pos)[0] - 1
+        pos += 4
+        if pos >= end:
+            counts.append(0)
+            continue
+
+        # Arrays of fixed-size elements of the same type are decoded via numpy
+        elem_type = buf[pos]
+        if elem_type in _BSON_SCALAR_DTYPES:
+            size = _BSON_FIXED_SIZES[elem_type]
+            count = _get_bson_array_count(end - pos, size)
+            if count is not None:
+                runs[elem_type].append((num_elems, pos, count))
+                counts.append(count)
+                num_elems += count
+                continue
+
+        count = 0
+        while pos < end:
+            elem_type = buf[pos]
+            if elem_type not in _BSON_COLUMNAR_TYPES:
+                return None, None, None
+
+            key_end = buf.index(0, pos + 1)
+            size = _get_bson_size(buf, elem_type, key_end + 1)
+            if size is None:
+                return None, None, None
+
+            elem_types.append(elem_type)
+            elem_positions.append(key_end + 1)
+            elem_indexes.append(num_elems + count)
+
+            pos = key_end + 1 + size
+            count += 1
+
+        counts.append(count)
+        num_elems += count
+
+    types = np.empty(num_elems, dtype=np.uint8)
+    positions = np.empty(num_elems, dtype=np.int64)
+
+    if elem_indexes:
+        types[elem_indexes] = elem_types
+        positions[elem_indexes] = elem_positions
+
+    for elem_type, elem_runs in runs.items():
+        starts, pos, count = np.array(elem_runs, dtype=np.int64).T
+        size = _BSON_FIXED_SIZES[elem_type]
+        offsets, key_lengths = _get_bson_array_offsets(size, count.max())
+
+        # The index of each element within its array
+        idx = np.arange(count.sum()) - np.repeat(
+            np.cumsum(count) - count, count
+        )
+
+        headers = np.repeat(pos, count) + offsets[idx]
+        if (data[headers] != elem_type).any():
+            return None, None, None
+
+        elem_indexes = np.repeat(starts, count) + idx
+        types[elem_indexes] = elem_type
+        positions[elem_indexes] = headers + key_lengths[idx] + 2
+
+    return np.array(counts, dtype=np.int64), types, positions
+
+
+def _decode_bson_scalars(data, types, positions):
+    elem_types = set(np.unique(types).tolist())
+    if not elem_types.issubset(_BSON_SCALAR_DTYPES.keys() | {_BSON_NULL}):
+        return None
+
+    is_float = _BSON_DOUBLE in elem_types
+    is_int = bool(elem_types & {_BSON_INT32, _BSON_INT64})
+    is_bool = _BSON_BOOL in elem_types
+
+    # Consistent with `np.asarray()`, only float values may be missing, in
+    # which case they are represented as `nan`
+    if is_bool and (is_float or is_int or _BSON_NULL in elem_types):
+        return None
+
+    if is_int and _BSON_NULL in elem_types:
+        return None
+
+    if is_bool:
+        dtype = bool
+    elif is_int and not is_float:
+        dtype = np.int64
+    else:
+        dtype = float
+
+    values = np.full(len(types), np.nan if dtype is float else 0, dtype=dtype)
+    for elem_type in elem_types - {_BSON_NULL}:
+        dtype = _BSON_SCALAR_DTYPES[elem_type]
+        mask = types == elem_type
+        idx = positions[mask, None] + np.arange(dtype.itemsize)
+        values[mask] = data[idx].view(dtype).ravel()
+
+    return values
+
+
+def _make_columnar_values(values, lengths, num_list_fields):
+    # Consistent with `ColumnarValues.from_lists()`, list levels beyond
+    # `num_list_fields` become additional dimensions of the leaf values if
+    # all of their lists have the same length
+    offsets = [_lengths_to_offsets(l) for l in lengths[:num_list_fields]]
+
+    # List levels that contain no lists
+    while len(offsets) < num_list_fields:
+        offsets.append(np.zeros(1, dtype=np.int64))
+
+    for idx in range(num_list_fields, len(lengths)):
+        counts = lengths[idx]
+        if (counts != counts[0]).any():
+            offsets.append(_lengths_to_offsets(counts))
+            continue
+
+        shape = [counts.size]
+        for counts in lengths[idx:]:
+            if (counts != counts[0]).any():
+                # Ragged lists would be stored as an object array
+                return None
+
+            shape.append(counts[0])
+
+        return ColumnarValues(values.reshape(shape), offsets=offsets)
+
+    return ColumnarValues(values, offsets=offsets)
+
+
+def _lengths_to_offsets(lengths):
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+def _get_bson_size(buf, elem_type, pos):
+    # Returns the size of the BSON value of the given type at `pos`
+    size = _BSON_FIXED_SIZES.get(elem_type, None)
+    if size is not None:
+        return size
+
+    if elem_type in (_BSON_STRING, 13, 14):  # string, code, symbol
+        return 4 + _unpack_int32(buf, pos)[0]
+
+    if elem_type in (_BSON_DOCUMENT, _BSON_ARRAY):
+        return _unpack_int32(buf, pos)[0]
+
+    if elem_type == _BSON_BINARY:
+        return 5 + _unpack_int32(buf, pos)[0]
+
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_bson_array_count(num_bytes, size):
+    # Returns the number of elements of the given size that are encoded by
+    # `num_bytes` bytes of BSON array elements, if any. The key of the ith
+    # element is `str(i)`
+    count = 0
+    num_keys = 10
+    elem_size = size + 3
+    while num_bytes > num_keys * elem_size:
+        num_bytes -= num_keys * elem_size
+        count += num_keys
+        num_keys *= 10 if count > 10 else 9
+        elem_size += 1
+
+    if num_bytes % elem_size:
+        return None
+
+    return count + num_bytes // elem_size
+
+
+_BSON_ARRAY_OFFSETS = {}
+
+
+def _get_bson_array_offsets(size, count):
+    # Returns the offsets of the first `count` elements of the given size
+    # within the bytes of a BSON array, and the lengths of their keys
+    offsets, key_lengths = _BSON_ARRAY_OFFSETS.get(size, (None, None))
+    if offsets is None or len(offsets) < count:
+        key_lengths = np.array(
+            [len(str(i)) for i in range(max(count, 1024))], dtype=np.int64
+        )
+        offsets = np.zeros(len(key_lengths), dtype=np.int64)
+        np.cumsum(key_lengths[:-1] + size + 2, out=offsets[1:])
+        _BSON_ARRAY_OFFSETS[size] = (offsets, key_lengths)
+
+    return offsets, key_lengths
+
+
+def _encode_columnar_updates(
+    path, values, ids, elem_id_path=None, elem_ids=None
+):
+    # Encodes update statements that set `path` to the rows of `values` in
+    # the documents with the given IDs, and, optionally, whose `elem_id_path`
+    # matches the given element IDs. The statements are built directly from
+    # the bytes of the arrays rather than by encoding a dict per document.
+    # Missing float values (nan) are set to null
+    query = [("_id", _BSON_OBJECT_ID, 12)]
+    id_arrays = [_to_object_id_array(ids)]
+    if elem_id_path is not None:
+        query.append((elem_id_path, _BSON_OBJECT_ID, 12))
+        id_arrays.append(_to_object_id_array(elem_ids))
+
+    if values.ndim == 1 and values.dtype.kind == "f":
+        missing = np.isnan(values)
+    else:
+        missing = None
+
+    if missing is None or not missing.any():
+        return _encode_updates(path, values, query, id_arrays)
+
+    found = ~missing
+    return _encode_updates(
+        path, values[found], query, [a[found] for a in id_arrays]
+    ) + _encode_updates(path, None, query, [a[missing] for a in id_arrays])
+
+
+def _encode_updates(path, values, query, id_arrays):
+    num_updates = len(id_arrays[0])
+    if num_updates == 0:
+        return []
+
+    if values is None:
+        value = (path, _BSON_NULL, 0)
+    else:
+        elem_type, dtype = _get_bson_value_type(values)
+        if values.ndim > 1:
+            elems = [
+                (str(i), elem_type, dtype.itemsize)
+                for i in range(values.shape[1])
+            ]
+            value = (path, _BSON_ARRAY, elems)
+        else:
+            value = (path, elem_type, dtype.itemsize)
+
+    template, slots = _make_bson_template(
+        [
+            ("q", _BSON_DOCUMENT, query),
+            ("u", _BSON_DOCUMENT, [("$set", _BSON_DOCUMENT, [value])]),
+        ]
+    )
+
+    data = np.empty((num_updates, len(template)), dtype=np.uint8)
+    data[:] = np.frombuffer(template, dtype=np.uint8)
+    for slot, ids in zip(slots, id_arrays):
+        data[:, slot : slot + 12] = ids
+
+    if values is not None:
+        values = np.ascontiguousarray(values, dtype=dtype)
+        if values.ndim == 1:
+            values = values[:, None]
+
+        values = values.view(np.uint8)
+        size = dtype.itemsize
+        for idx, slot in enumerate(slots[len(id_arrays) :]):
+            data[:, slot : slot + size] = values[
+                :, idx * size : (idx + 1) * size
+            ]
+
+    size = len(template)
+    data = data.tobytes()
+    return [
+        RawBSONDocument(data[start : start + size])
+        for start in range(0, len(data), size)
+    ]
+
+
+def _get_bson_value_type(values):
+    kind = values.dtype.kind
+    if kind == "b":
+        return _BSON_BOOL, np.dtype("u1")
+
+    if kind == "f":
+        return _BSON_DOUBLE, np.dtype("<f8")
+
+    if values.size == 0 or (
+        values.min() >= -(2**31) and values.max() < 2**31
+    ):
+        return _BSON_INT32, np.dtype("<i4")
+
+    return _BSON_INT64, np.dtype("<i8")
+
+
+def _make_bson_template(elements):
+    # Encodes a BSON document whose elements are `(key, type, value)` tuples,
+    # where `value` is either a list of the elements of an embedded document
+    # or array, or the size of a value whose bytes are left as zeros. Returns
+    # the bytes and the offsets of the values of the latter elements
+    data = bytearray(4)
+    slots = []
+    for key, elem_type, value in elements:
+        data += bytes([elem_type]) + key.encode() + b"\0"
+        if isinstance(value, list):
+            _data, _slots = _make_bson_template(value)
+            slots.extend(len(data) + slot for slot in _slots)
+            data += _data
+        else:
+            slots.append(len(data))
+            data += bytes(value)
+
+    data += b"\0"
+    data[:4] = struct.pack("<i", len(data))
+    return bytes(data), slots
+
+
+def _to_object_id_array(ids):
+    data = b"".join(bson.ObjectId(_id).binary for _id in ids)
+    return np.frombuffer(data, dtype=np.uint8).reshape(-1, 12)
+
+
 class _AggregationRepr(reprlib.Repr):
     def repr_ViewExpression(self, expr, level):
         return self.repr1(expr.to_mongo(), level=level - 1)
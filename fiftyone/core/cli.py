@@ -2721,6 +2721,9 @@ class ComputeMetadataCommand(Command):
 
         # (Re)-populate the `metadata` field for all samples
         fiftyone utils compute-metadata <dataset-name> --overwrite
+
+        # Populate missing metadata and refresh metadata of modified media
+        fiftyone utils compute-metadata <dataset-name> --refresh-stale
     """
 
     @staticmethod
@@ -2753,6 +2756,15 @@ class ComputeMetadataCommand(Command):
                 "metadata cannot be computed for a sample"
             ),
         )
+        parser.add_argument(
+            "-r",
+            "--refresh-stale",
+            action="store_true",
+            help=(
+                "whether to recompute existing metadata for samples whose "
+                "media's size on disk no longer matches its `size_bytes`"
+            ),
+        )
 
     @staticmethod
     def execute(parser, args):
@@ -2761,6 +2773,7 @@ class ComputeMetadataCommand(Command):
             overwrite=args.overwrite,
             num_workers=args.num_workers,
             skip_failures=args.skip_failures,
+            refresh_stale=args.refresh_stale,
         )
 
 
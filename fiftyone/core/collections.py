@@ -7,9 +7,11 @@ Interface for sample collections.
 """
 from collections import defaultdict
 from copy import copy
+from datetime import datetime
 import fnmatch
 import itertools
 import logging
+from multiprocessing.pool import ThreadPool
 import numbers
 import os
 import random
@@ -17,8 +19,12 @@ import string
 import timeit
 import warnings
 
+import bson
 from bson import ObjectId
+from bson.raw_bson import RawBSONDocument
+import numpy as np
 from pymongo import InsertOne, UpdateOne, UpdateMany
+from pymongo.errors import CursorNotFound
 
 import eta.core.serial as etas
 import eta.core.utils as etau
@@ -49,6 +55,11 @@ foue = fou.lazy_import("fiftyone.utils.eval")
 
 logger = logging.getLogger(__name__)
 
+_MAX_SAVE_BATCH_BYTES = 32 * 1024**2
+_SIZE_SAMPLE_INTERVAL = 16
+_DEFAULT_OP_BYTES = 1024
+_ID_BYTES = 16
+
 
 def _make_registrar():
     registry = {}
@@ -74,42 +85,87 @@ class SaveContext(object):
     """Context that saves samples from a collection according to a configurable
     batching strategy.
 
+    Updates that apply identical changes to multiple samples are coalesced
+    into a single ``UpdateMany`` operation, and batches are written to the
+    database by a background thread so that the calling loop is not blocked.
+
+    In addition to ``batch_size``, a batch is always flushed when the
+    approximate size of its pending operations exceeds ``max_batch_bytes``.
+
     Args:
         sample_collection: a
             :class:`fiftyone.core.collections.SampleCollection`
         batch_size (None): the batching strategy to use. Can either be an
             integer specifying the number of samples to save in a batch, or a
             float number of seconds between batched saves
+        max_batch_bytes (None): the maximum approximate size, in bytes, of the
+            pending operations in a batch. By default, 32MB is used
+        async_writes (True): whether to write batches in a background thread.
+            Any errors that occur while writing are raised when the next batch
+            is flushed or when the context exits
     """
 
-    def __init__(self, sample_collection, batch_size=None):
+    def __init__(
+        self,
+        sample_collection,
+        batch_size=None,
+        max_batch_bytes=None,
+        async_writes=True,
+    ):
         if batch_size is None:
             batch_size = 0.2
 
+        if max_batch_bytes is None:
+            max_batch_bytes = _MAX_SAVE_BATCH_BYTES
+
         self.sample_collection = sample_collection
         self.batch_size = batch_size
+        self.max_batch_bytes = max_batch_bytes
+        self.async_writes = async_writes
 
         self._dataset = sample_collection._dataset
         self._sample_coll = sample_collection._dataset._sample_collection
         self._frame_coll = sample_collection._dataset._frame_collection
 
         self._sample_ops = []
+        self._sample_updates = {}
         self._frame_ops = []
+        self._frame_updates = {}
         self._reload_parents = []
+        self._batch_ids = set()
 
         self._curr_batch_size = None
+        self._curr_batch_bytes = None
+        self._num_updates = 0
+        self._num_sampled = 0
+        self._sampled_bytes = 0
         self._dynamic_batches = not isinstance(batch_size, numbers.Integral)
         self._last_time = None
 
+        self._pool = None
+        self._write_result = None
+        self._pending_reload_parents = []
+
     def __enter__(self):
         if self._dynamic_batches:
             self._last_time = timeit.default_timer()
 
+        if self.async_writes:
+            self._pool = ThreadPool(processes=1)
+
         self._curr_batch_size = 0
+        self._curr_batch_bytes = 0
         return self
 
     def __exit__(self, *args):
-        self._save_batch()
+        try:
+            self._save_batch()
+            self._wait_for_write()
+        finally:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool.join()
+                self._pool = None
 
     def save(self, sample):
         """Registers the sample for saving in the next batch.
@@ -124,43 +180,167 @@ class SaveContext(object):
                 % (self._dataset.name, sample._dataset.name)
             )
 
+        # Coalesced updates are not ordered, so a sample that is saved again
+        # must be written in a separate batch
+        if sample.id is not None and sample.id in self._batch_ids:
+            self._save_batch()
+
         sample_ops, frame_ops = sample._save(deferred=True)
         updated = sample_ops or frame_ops
 
         self._curr_batch_size += 1
+        self._batch_ids.add(sample.id)
 
         if sample_ops:
-            self._sample_ops.extend(sample_ops)
+            self._add_ops(sample_ops, self._sample_ops, self._sample_updates)
 
         if frame_ops:
-            self._frame_ops.extend(frame_ops)
+            self._add_ops(frame_ops, self._frame_ops, self._frame_updates)
 
         if updated and isinstance(sample, fosa.SampleView):
             self._reload_parents.append(sample)
 
-        if self._dynamic_batches:
+        if self._curr_batch_bytes >= self.max_batch_bytes:
+            self._save_batch()
+            if self._dynamic_batches:
+                self._last_time = timeit.default_timer()
+        elif self._dynamic_batches:
             if timeit.default_timer() - self._last_time >= self.batch_size:
                 self._save_batch()
                 self._last_time = timeit.default_timer()
         elif self._curr_batch_size >= self.batch_size:
             self._save_batch()
 
+    def _add_ops(self, ops, other_ops, updates):
+        for op in ops:
+            if not isinstance(op, foo.DeferredUpdate):
+                other_ops.append(op)
+                self._curr_batch_bytes += self._estimate_bytes()
+                continue
+
+            key = _get_update_key(op.update)
+            if key is None:
+                other_ops.append(op.to_op())
+            elif key in updates:
+                updates[key][1].append(op.id)
+                self._curr_batch_bytes += _ID_BYTES
+                continue
+            else:
+                updates[key] = (op.update, [op.id])
+
+            self._curr_batch_bytes += self._estimate_bytes(update=op.update)
+
+    def _estimate_bytes(self, update=None):
+        # Encoding every update on the calling thread is expensive, so the
+        # size of the pending ops is extrapolated from a sample of updates
+        if update is not None:
+            if self._num_updates % _SIZE_SAMPLE_INTERVAL == 0:
+                self._sampled_bytes += len(bson.encode(update))
+                self._num_sampled += 1
+
+            self._num_updates += 1
+
+        if self._num_sampled == 0:
+            return _DEFAULT_OP_BYTES
+
+        return self._sampled_bytes // self._num_sampled
+
     def _save_batch(self):
         self._curr_batch_size = 0
+        self._curr_batch_bytes = 0
 
-        if self._sample_ops:
-            foo.bulk_write(self._sample_ops, self._sample_coll, ordered=False)
-            self._sample_ops.clear()
+        sample_ops = self._sample_ops + _coalesce_updates(self._sample_updates)
+        frame_ops = self._frame_ops + _coalesce_updates(self._frame_updates)
+        reload_parents = self._reload_parents
 
-        if self._frame_ops:
-            foo.bulk_write(self._frame_ops, self._frame_coll, ordered=False)
-            self._frame_ops.clear()
+        self._sample_ops = []
+        self._sample_updates = {}
+        self._frame_ops = []
+        self._frame_updates = {}
+        self._reload_parents = []
+        self._batch_ids = set()
+
+        # Only one batch may be in flight at a time
+        self._wait_for_write()
+
+        if not sample_ops and not frame_ops:
+            return
+
+        if self._pool is not None:
+            self._pending_reload_parents = reload_parents
+            self._write_result = self._pool.apply_async(
+                self._write_batch, (sample_ops, frame_ops)
+            )
+        else:
+            self._write_batch(sample_ops, frame_ops)
+            _reload_parents(reload_parents)
+
+    def _write_batch(self, sample_ops, frame_ops):
+        if sample_ops:
+            foo.bulk_write(sample_ops, self._sample_coll, ordered=False)
+
+        if frame_ops:
+            foo.bulk_write(frame_ops, self._frame_coll, ordered=False)
+
+    def _wait_for_write(self):
+        if self._write_result is None:
+            return
+
+        write_result = self._write_result
+        reload_parents = self._pending_reload_parents
 
-        if self._reload_parents:
-            for sample in self._reload_parents:
-                sample._reload_parents()
+        self._write_result = None
+        self._pending_reload_parents = []
 
-            self._reload_parents.clear()
+        write_result.get()
+        _reload_parents(reload_parents)
+
+
+def _get_update_key(update):
+    # Only updates that set or unset fields to primitive values are coalesced.
+    # Updates that contain embedded documents, such as labels, almost always
+    # differ by their IDs, so they are not worth hashing
+    items = []
+    for op, fields in update.items():
+        if op not in ("$set", "$unset"):
+            return None
+
+        for path, value in fields.items():
+            if isinstance(value, list):
+                if not all(_is_primitive(v) for v in value):
+                    return None
+
+                value = (list, tuple((type(v), v) for v in value))
+            elif not _is_primitive(value):
+                return None
+
+            # Types are included so that, for example, `1` and `1.0` and
+            # `True` are not coalesced
+            items.append((op, path, type(value), value))
+
+    return tuple(items)
+
+
+def _is_primitive(value):
+    return value is None or isinstance(
+        value, (bool, numbers.Number, str, ObjectId, datetime)
+    )
+
+
+def _coalesce_updates(updates):
+    ops = []
+    for update, ids in updates.values():
+        if len(ids) == 1:
+            ops.append(UpdateOne({"_id": ids[0]}, update))
+        else:
+            ops.append(UpdateMany({"_id": {"$in": ids}}, update))
+
+    return ops
+
+
+def _reload_parents(samples):
+    for sample in samples:
+        sample._reload_parents()
 
 
 class SampleCollection(object):
@@ -815,7 +995,13 @@ class SampleCollection(object):
         """
         raise NotImplementedError("Subclass must implement view()")
 
-    def iter_samples(self, progress=False, autosave=False, batch_size=None):
+    def iter_samples(
+        self,
+        progress=False,
+        autosave=False,
+        batch_size=None,
+        lightweight=False,
+    ):
         """Returns an iterator over the samples in the collection.
 
         Args:
@@ -825,11 +1011,19 @@ class SampleCollection(object):
                 emitted by this iterator
             batch_size (None): a batch size to use when autosaving samples. Can
                 either be an integer specifying the number of samples to save
-                in a batch, or a float number of seconds between batched saves
+                in a batch, or a float number of seconds between batched saves.
+                When ``lightweight`` is True, this is instead the number of
+                samples to fetch from the database per cursor batch
+            lightweight (False): whether to emit read-only
+                :class:`fiftyone.core.sample.LightweightSample` instances
+                whose fields are lazily decoded from the raw database
+                documents. This is much faster when you only need to read a
+                few fields of each sample
 
         Returns:
-            an iterator over :class:`fiftyone.core.sample.Sample` or
-            :class:`fiftyone.core.sample.SampleView` instances
+            an iterator over :class:`fiftyone.core.sample.Sample`,
+            :class:`fiftyone.core.sample.SampleView`, or
+            :class:`fiftyone.core.sample.LightweightSample` instances
         """
         raise NotImplementedError("Subclass must implement iter_samples()")
 
@@ -1836,7 +2030,8 @@ class SampleCollection(object):
                 elements of ``values`` must be arrays of the same lengths. This
                 argument can also be a dict mapping keys to values (each value
                 as described previously), in which case the keys are used to
-                match samples by their ``key_field``
+                match samples by their ``key_field``, or columnar values as
+                returned by :meth:`values` with ``columnar`` specified
             key_field (None): a key field to use when choosing which samples to
                 update when ``values`` is a dict
             skip_none (False): whether to treat None data in ``values`` as
@@ -1855,6 +2050,21 @@ class SampleCollection(object):
                 "(found: '%s')" % field_name
             )
 
+        if foa._is_arrow_array(values):
+            values = foa.ColumnarValues.from_arrow(values)
+
+        if isinstance(values, foa.ColumnarValues):
+            if (
+                not dynamic
+                and _sample_ids is None
+                and self._set_columnar_values(
+                    field_name, values, skip_none=skip_none
+                )
+            ):
+                return
+
+            values = values.tolist()
+
         if isinstance(values, dict):
             if key_field is None:
                 raise ValueError(
@@ -2300,6 +2510,98 @@ class SampleCollection(object):
                 validate=validate,
             )
 
+    def _set_columnar_values(self, field_name, values, skip_none=False):
+        # Sets existing numeric or boolean sample fields by encoding the
+        # updates directly from the arrays of `values`. Returns False if the
+        # values must instead be set via lists
+        if self._is_frame_field(field_name):
+            return False
+
+        field = self.get_field(field_name)
+        if field is None:
+            return False
+
+        _field_name, _, list_fields, _, id_to_str = self._parse_field_name(
+            field_name, omit_terminal_lists=True
+        )
+
+        if (
+            id_to_str
+            or len(list_fields) > 1
+            or len(list_fields) != len(values.offsets)
+        ):
+            return False
+
+        _values = _get_columnar_db_values(field, values.values)
+        if _values is None:
+            return False
+
+        if not list_fields:
+            sample_ids = self.values("_id")
+            num_values = min(len(sample_ids), len(_values))
+            sample_ids = sample_ids[:num_values]
+            _values = _values[:num_values]
+
+            if skip_none and _values.ndim == 1 and _values.dtype.kind == "f":
+                found = ~np.isnan(_values)
+                sample_ids = list(itertools.compress(sample_ids, found))
+                _values = _values[found]
+
+            ops = foa._encode_columnar_updates(
+                _field_name, _values, sample_ids
+            )
+            self._dataset._bulk_write(ops, raw=True)
+            return True
+
+        root = list_fields[0]
+        leaf = _field_name[len(root) + 1 :]
+        if leaf:
+            elem = root + ".$." + leaf
+        else:
+            elem = root + ".$"
+
+        sample_ids, elem_ids = self.values(["_id", root + "._id"])
+        offsets = values.offsets[0]
+
+        if skip_none and _values.ndim == 1 and _values.dtype.kind == "f":
+            found = ~np.isnan(_values)
+        else:
+            found = None
+
+        ids = []
+        _elem_ids = []
+        inds = []
+        for idx, (_id, _eids) in enumerate(
+            zip(sample_ids, elem_ids[: len(offsets) - 1])
+        ):
+            if not _eids:
+                continue
+
+            start = offsets[idx]
+            end = min(offsets[idx + 1], start + len(_eids))
+            for _elem_id, ind in zip(_eids, range(start, end)):
+                if found is not None and not found[ind]:
+                    continue
+
+                if _elem_id is None:
+                    raise ValueError(
+                        "Can only set values of array documents with IDs"
+                    )
+
+                ids.append(_id)
+                _elem_ids.append(_elem_id)
+                inds.append(ind)
+
+        ops = foa._encode_columnar_updates(
+            elem,
+            _values[np.array(inds, dtype=np.int64)],
+            ids,
+            elem_id_path=root + "._id",
+            elem_ids=_elem_ids,
+        )
+        self._dataset._bulk_write(ops, raw=True)
+        return True
+
     def _set_frame_values(
         self,
         field_name,
@@ -2534,12 +2836,17 @@ class SampleCollection(object):
         self._dataset.delete_labels(ids=ids, fields=fields)
 
     def compute_metadata(
-        self, overwrite=False, num_workers=None, skip_failures=True
+        self,
+        overwrite=False,
+        num_workers=None,
+        skip_failures=True,
+        refresh_stale=False,
     ):
         """Populates the ``metadata`` field of all samples in the collection.
 
         Any samples with existing metadata are skipped, unless
-        ``overwrite == True``.
+        ``overwrite == True`` or ``refresh_stale == True`` and their media has
+        changed.
 
         Args:
             overwrite (False): whether to overwrite existing metadata
@@ -2547,12 +2854,16 @@ class SampleCollection(object):
                 ``multiprocessing.cpu_count()`` is used
             skip_failures (True): whether to gracefully continue without
                 raising an error if metadata cannot be computed for a sample
+            refresh_stale (False): whether to recompute existing metadata for
+                samples whose media's size on disk no longer matches its
+                ``size_bytes``
         """
         fomt.compute_metadata(
             self,
             overwrite=overwrite,
             num_workers=num_workers,
             skip_failures=skip_failures,
+            refresh_stale=refresh_stale,
         )
 
     def apply_model(
@@ -2945,6 +3256,7 @@ class SampleCollection(object):
         use_boxes=False,
         classwise=True,
         dynamic=True,
+        num_workers=None,
         **kwargs,
     ):
         """Evaluates the specified predicted detections in this collection with
@@ -3031,6 +3343,11 @@ class SampleCollection(object):
                 label (True) or allow matches between classes (False)
             dynamic (True): whether to declare the dynamic object-level
                 attributes that are populated on the dataset's schema
+            num_workers (None): an optional number of processes to use to
+                evaluate batches of samples in parallel. When provided, the
+                label fields are loaded in bulk via :meth:`values` and the
+                results are written back in bulk. By default, samples are
+                evaluated serially in the main process
             **kwargs: optional keyword arguments for the constructor of the
                 :class:`fiftyone.utils.eval.detection.DetectionEvaluationConfig`
                 being used
@@ -3051,6 +3368,7 @@ class SampleCollection(object):
             use_boxes=use_boxes,
             classwise=classwise,
             dynamic=dynamic,
+            num_workers=num_workers,
             **kwargs,
         )
 
@@ -3061,6 +3379,7 @@ class SampleCollection(object):
         eval_key=None,
         mask_targets=None,
         method="simple",
+        num_workers=None,
         **kwargs,
     ):
         """Evaluates the specified semantic segmentation masks in this
@@ -3111,6 +3430,9 @@ class SampleCollection(object):
                 labels
             method ("simple"): a string specifying the evaluation method to
                 use. Supported values are ``("simple")``
+            num_workers (None): an optional number of processes to use to
+                decode masks and compute confusion matrices in parallel. By
+                default, samples are evaluated serially in the main process
             **kwargs: optional keyword arguments for the constructor of the
                 :class:`fiftyone.utils.eval.segmentation.SegmentationEvaluationConfig`
                 being used
@@ -3125,6 +3447,7 @@ class SampleCollection(object):
             eval_key=eval_key,
             mask_targets=mask_targets,
             method=method,
+            num_workers=num_workers,
             **kwargs,
         )
 
@@ -7369,6 +7692,7 @@ class SampleCollection(object):
         expr=None,
         missing_value=None,
         unwind=False,
+        columnar=False,
         _allow_missing=False,
         _big_result=True,
         _raw=False,
@@ -7459,6 +7783,22 @@ class SampleCollection(object):
             # list of lists of detection labels
             labels = dataset.values("ground_truth.detections.label")
 
+            #
+            # Get values in columnar format
+            #
+
+            # (num_objects, 4) array of boxes + offsets of each sample's boxes
+            boxes = dataset.values(
+                "ground_truth.detections.bounding_box", columnar=True
+            )
+            print(boxes.values.shape)
+            print(boxes.offsets[0])
+
+            # `pyarrow.Array` of lists of confidences
+            confidences = dataset.values(
+                "predictions.detections.confidence", columnar="arrow"
+            )
+
         Args:
             field_or_expr: a field name, ``embedded.field.name``,
                 :class:`fiftyone.core.expressions.ViewExpression`, or
@@ -7476,15 +7816,24 @@ class SampleCollection(object):
             unwind (False): whether to automatically unwind all recognized list
                 fields (True) or unwind all list fields except the top-level
                 sample field (-1)
+            columnar (False): whether to return the values in columnar
+                format. Supported values are:
+
+                -   ``False``: return (nested) lists of values
+                -   ``True`` or ``"numpy"``: return a
+                    :class:`fiftyone.core.aggregations.ColumnarValues`
+                -   ``"arrow"``: return a ``pyarrow.Array``
 
         Returns:
-            the list of values
+            the list of values, or the columnar values if ``columnar`` is
+            specified
         """
         make = lambda field_or_expr: foa.Values(
             field_or_expr,
             expr=expr,
             missing_value=missing_value,
             unwind=unwind,
+            columnar=columnar,
             _allow_missing=_allow_missing,
             _big_result=_big_result,
             _raw=_raw,
@@ -7492,6 +7841,121 @@ class SampleCollection(object):
         )
         return self._make_and_aggregate(make, field_or_expr)
 
+    def load_vectors(self, field, dtype=None, mmap_path=None, batch_size=None):
+        """Loads the values of a vector field of the collection into a single
+        ``num_vectors x dim`` array.
+
+        Unlike ``np.stack(values(field))``, the vectors are streamed from the
+        database directly into a preallocated array, so they are never held
+        in memory twice. Samples or frames whose field is ``None`` are
+        omitted.
+
+        Examples::
+
+            import fiftyone as fo
+            import fiftyone.zoo as foz
+
+            dataset = foz.load_zoo_dataset("quickstart")
+
+            model = foz.load_zoo_model("inception-v3-imagenet-torch")
+            dataset.compute_embeddings(model, embeddings_field="embeddings")
+
+            embeddings, sample_ids = dataset.load_vectors("embeddings")
+            print(embeddings.shape)  # (200, 2048)
+
+            # Write the embeddings to a memory-mapped file on disk
+            embeddings, sample_ids = dataset.load_vectors(
+                "embeddings", mmap_path="/tmp/embeddings.npy"
+            )
+
+        Args:
+            field: the name of a :class:`fiftyone.core.fields.VectorField` of
+                the collection, or an ``embedded.field.name``. Frame-level
+                fields of video collections are also supported, in which case
+                one row is returned per frame
+            dtype (None): an optional dtype for the returned array. By
+                default, the dtype of the stored vectors is used
+            mmap_path (None): an optional ``.npy`` path on disk in which to
+                store the array, which is then returned as a memory-mapped
+                array via ``numpy.lib.format.open_memmap()``. This allows for
+                loading vectors whose total size exceeds the available memory
+            batch_size (None): an optional number of documents to fetch from
+                the database per batch
+
+        Returns:
+            a tuple of
+
+            -   **vectors**: a ``num_vectors x dim`` array, or a
+                ``numpy.memmap`` if ``mmap_path`` is provided
+            -   **ids**: a ``num_vectors`` array containing the sample IDs (or
+                frame IDs, for frame-level fields) of each row of ``vectors``
+        """
+        field_name, is_frame_field = self._handle_frame_field(field)
+        db_field = self._handle_db_field(field_name, frames=is_frame_field)
+
+        match = {"$match": {db_field: {"$ne": None}}}
+        project = {"$project": {"_id": True, "vector": "$" + db_field}}
+
+        # Frames are unwound after `pipeline`, so the stages are applied via
+        # `post_pipeline`
+        result = list(
+            self._aggregate(
+                frames_only=is_frame_field,
+                post_pipeline=[match, {"$count": "count"}],
+            )
+        )
+        num_vectors = result[0]["count"] if result else 0
+
+        cursor = self._aggregate(
+            frames_only=is_frame_field, post_pipeline=[match, project]
+        )
+        if batch_size is not None:
+            cursor.batch_size(batch_size)
+
+        vectors = None
+        ids = []
+        for idx, d in enumerate(cursor):
+            if idx >= num_vectors:
+                # Documents were added while the vectors were being loaded
+                cursor.close()
+                break
+
+            vector = d["vector"]
+            if isinstance(vector, (list, tuple)):
+                vector = np.asarray(vector)
+            else:
+                vector = fou.deserialize_numpy_array(vector, writable=False)
+
+            if vectors is None:
+                vectors = _make_vectors_array(
+                    (num_vectors, vector.size),
+                    dtype or vector.dtype,
+                    mmap_path=mmap_path,
+                )
+
+            if vector.ndim != 1 or vector.size != vectors.shape[1]:
+                raise ValueError(
+                    "Expected field '%s' to contain %d-dimensional vectors, "
+                    "but found an array of shape %s"
+                    % (field, vectors.shape[1], vector.shape)
+                )
+
+            vectors[idx] = vector
+            ids.append(str(d["_id"]))
+
+        if vectors is None:
+            vectors = _make_vectors_array(
+                (0, 0), dtype or float, mmap_path=mmap_path
+            )
+        elif len(ids) < num_vectors:
+            # Documents were deleted while the vectors were being loaded
+            vectors = vectors[: len(ids)]
+
+        if mmap_path is not None:
+            vectors.flush()
+
+        return vectors, np.array(ids, dtype=str)
+
     def draw_labels(
         self,
         output_dir,
@@ -8572,6 +9036,8 @@ class SampleCollection(object):
         # Placeholder to store results
         results = [None] * len(aggregations)
 
+        start = timeit.default_timer()
+
         idx_map = {}
         pipelines = []
 
@@ -8581,10 +9047,14 @@ class SampleCollection(object):
             pipelines.append(pipeline)
 
         # Build big pipelines
+        raw_pipelines = {}
         for idx, aggregation in big_aggs.items():
             pipeline = self._build_big_pipeline(aggregation)
-            idx_map[idx] = len(pipelines)
-            pipelines.append(pipeline)
+            if aggregation._has_raw_result:
+                raw_pipelines[idx] = pipeline
+            else:
+                idx_map[idx] = len(pipelines)
+                pipelines.append(pipeline)
 
         # Build facet-able pipelines
         compiled_facet_aggs, facet_pipelines = self._build_facets(facet_aggs)
@@ -8592,8 +9062,12 @@ class SampleCollection(object):
             idx_map[idx] = len(pipelines)
             pipelines.append(pipeline)
 
+        compile_time = timeit.default_timer() - start
+
         # Run all aggregations
-        _results = foo.aggregate(self._dataset._sample_collection, pipelines)
+        coll = self._dataset._sample_collection
+        if pipelines:
+            _results = foo.aggregate(coll, pipelines)
 
         # Parse batch results
         if batch_aggs:
@@ -8603,8 +9077,14 @@ class SampleCollection(object):
 
         # Parse big results
         for idx, aggregation in big_aggs.items():
-            result = list(_results[idx_map[idx]])
-            results[idx] = self._parse_big_result(aggregation, result)
+            if idx in raw_pipelines:
+                batches = foo.aggregate_raw_batches(coll, raw_pipelines[idx])
+                results[idx] = aggregation._parse_raw_result(
+                    batches, coll.codec_options
+                )
+            else:
+                result = list(_results[idx_map[idx]])
+                results[idx] = self._parse_big_result(aggregation, result)
 
         # Parse facet-able results
         for idx, aggregation in compiled_facet_aggs.items():
@@ -8619,6 +9099,14 @@ class SampleCollection(object):
             else:
                 results[idx] = data
 
+        logger.debug(
+            "Compiled %d aggregation pipeline(s) in %.3fs and executed them "
+            "in %.3fs",
+            len(pipelines) + len(raw_pipelines),
+            compile_time,
+            timeit.default_timer() - start - compile_time,
+        )
+
         return results[0] if scalar_result else results
 
     async def _async_aggregate(self, aggregations):
@@ -8797,6 +9285,7 @@ class SampleCollection(object):
         detach_frames=False,
         frames_only=False,
         support=None,
+        frames_limit=None,
         group_slice=None,
         group_slices=None,
         detach_groups=False,
@@ -8821,6 +9310,8 @@ class SampleCollection(object):
                 *only* the frames in the collection
             support (None): an optional ``[first, last]`` range of frames to
                 attach. Only applicable when attaching frames
+            frames_limit (None): an optional maximum number of frames to
+                attach to each sample. Only applicable when attaching frames
             group_slice (None): the current group slice of the collection, if
                 different than the source dataset's group slice. Only
                 applicable for grouped collections
@@ -8896,6 +9387,39 @@ class SampleCollection(object):
         """
         raise NotImplementedError("Subclass must implement _aggregate()")
 
+    def _iter_lightweight_samples(self, batch_size=None, skip=0):
+        schema = self.get_field_schema(include_private=True)
+
+        coll = self._dataset._sample_collection
+        codec_options = coll.codec_options
+        raw_coll = coll.with_options(
+            codec_options=codec_options.with_options(
+                document_class=RawBSONDocument
+            )
+        )
+
+        pipeline = self._pipeline(detach_frames=True, detach_groups=True)
+        if skip > 0:
+            pipeline.append({"$skip": skip})
+
+        kwargs = {}
+        if batch_size is not None:
+            kwargs["batchSize"] = int(batch_size)
+
+        index = skip
+
+        try:
+            for d in raw_coll.aggregate(pipeline, allowDiskUse=True, **kwargs):
+                index += 1
+                yield fosa.LightweightSample(d, schema, codec_options)
+        except CursorNotFound:
+            # The cursor has timed out so we yield from a new one after
+            # skipping to the last offset
+            for sample in self._iter_lightweight_samples(
+                batch_size=batch_size, skip=index
+            ):
+                yield sample
+
     def _make_and_aggregate(self, make, args):
         if isinstance(args, (list, tuple)):
             return tuple(self.aggregate([make(arg) for arg in args]))
@@ -9448,6 +9972,52 @@ def _serialize_value(field_name, field, value, validate=True):
     return field.to_mongo(value)
 
 
+def _get_columnar_db_values(field, values):
+    # Returns `values` cast to the type in which `field` stores them, or None
+    # if they can't be stored directly
+    if values.ndim > 2:
+        return None
+
+    if values.ndim == 2:
+        if not isinstance(field, fof.ListField):
+            return None
+
+        field = field.field
+
+    kind = values.dtype.kind
+    if isinstance(field, fof.BooleanField):
+        if kind != "b":
+            return None
+
+        return values
+
+    if isinstance(field, fof.IntField):
+        if kind not in "iu":
+            return None
+
+        if (
+            kind == "u"
+            and values.size
+            and values.max() > np.iinfo(np.int64).max
+        ):
+            return None
+
+        return values.astype(np.int64, copy=False)
+
+    if isinstance(field, fof.FloatField):
+        if kind not in "iuf":
+            return None
+
+        values = values.astype(float, copy=False)
+        if values.ndim > 1 and np.isnan(values).any():
+            # Missing values within lists are set via lists
+            return None
+
+        return values
+
+    return None
+
+
 def _unwind_values(values, level=0):
     if not values:
         return values
@@ -10393,3 +10963,13 @@ def _add_db_fields_to_schema(schema):
             additions[field.db_field] = field
 
     schema.update(additions)
+
+
+def _make_vectors_array(shape, dtype, mmap_path=None):
+    if mmap_path is None:
+        return np.empty(shape, dtype=dtype)
+
+    etau.ensure_basedir(mmap_path)
+    return np.lib.format.open_memmap(
+        mmap_path, mode="w+", dtype=dtype, shape=shape
+    )
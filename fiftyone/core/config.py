@@ -178,6 +178,18 @@ class FiftyOneConfig(EnvConfig):
             env_var="FIFTYONE_DESKTOP_APP",
             default=False,
         )
+        self.app_metadata_writeback = self.parse_bool(
+            d,
+            "app_metadata_writeback",
+            env_var="FIFTYONE_APP_METADATA_WRITEBACK",
+            default=False,
+        )
+        self.media_export_workers = self.parse_int(
+            d,
+            "media_export_workers",
+            env_var="FIFTYONE_MEDIA_EXPORT_WORKERS",
+            default=8,
+        )
         self.logging_level = self.parse_string(
             d,
             "logging_level",
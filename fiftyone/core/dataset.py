@@ -278,6 +278,10 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
 
         self._group_slice = doc.default_group_slice
 
+        # Incremented whenever the dataset's document may have changed, so
+        # that views can invalidate their compiled pipelines
+        self._schema_version = 0
+
         self._annotation_cache = cachetools.LRUCache(5)
         self._brain_cache = cachetools.LRUCache(5)
         self._evaluation_cache = cachetools.LRUCache(5)
@@ -2076,7 +2080,13 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
 
         self.save()
 
-    def iter_samples(self, progress=False, autosave=False, batch_size=None):
+    def iter_samples(
+        self,
+        progress=False,
+        autosave=False,
+        batch_size=None,
+        lightweight=False,
+    ):
         """Returns an iterator over the samples in the dataset.
 
         Examples::
@@ -2109,6 +2119,13 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             ):
                 sample.ground_truth.label = make_label()
 
+            # Fast read-only iteration
+            labels = []
+            for sample in dataset.iter_samples(
+                lightweight=True, batch_size=1000
+            ):
+                labels.append(sample.ground_truth.label)
+
         Args:
             progress (False): whether to render a progress bar tracking the
                 iterator's progress
@@ -2116,13 +2133,30 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                 emitted by this iterator
             batch_size (None): a batch size to use when autosaving samples. Can
                 either be an integer specifying the number of samples to save
-                in a batch, or a float number of seconds between batched saves
+                in a batch, or a float number of seconds between batched saves.
+                When ``lightweight`` is True, this is instead the number of
+                samples to fetch from the database per cursor batch
+            lightweight (False): whether to emit read-only
+                :class:`fiftyone.core.sample.LightweightSample` instances
+                whose fields are lazily decoded from the raw database
+                documents. This is much faster when you only need to read a
+                few fields of each sample
 
         Returns:
-            an iterator over :class:`fiftyone.core.sample.Sample` instances
+            an iterator over :class:`fiftyone.core.sample.Sample` or
+            :class:`fiftyone.core.sample.LightweightSample` instances
         """
+        if lightweight and autosave:
+            raise ValueError(
+                "Lightweight samples are read-only, so `autosave=True` is not "
+                "supported"
+            )
+
         with contextlib.ExitStack() as exit_context:
-            samples = self._iter_samples()
+            if lightweight:
+                samples = self._iter_lightweight_samples(batch_size=batch_size)
+            else:
+                samples = self._iter_samples()
 
             if progress:
                 pb = fou.ProgressBar(total=len(self))
@@ -2374,6 +2408,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         dynamic=False,
         validate=True,
         num_samples=None,
+        _attach=True,
     ):
         """Adds the given samples to the dataset.
 
@@ -2420,7 +2455,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         with batcher:
             for batch in batcher:
                 _ids = self._add_samples_batch(
-                    batch, expand_schema, dynamic, validate
+                    batch, expand_schema, dynamic, validate, attach=_attach
                 )
                 sample_ids.extend(_ids)
 
@@ -2473,7 +2508,18 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         )
         return self.skip(num_samples).values("id")
 
-    def _add_samples_batch(self, samples, expand_schema, dynamic, validate):
+    def _add_samples_batch(
+        self, samples, expand_schema, dynamic, validate, attach=True
+    ):
+        samples, dicts = self._prepare_samples_batch(
+            samples, expand_schema, dynamic, validate
+        )
+        self._insert_sample_dicts(dicts)
+        return self._attach_samples_batch(samples, dicts, attach)
+
+    def _prepare_samples_batch(
+        self, samples, expand_schema, dynamic, validate
+    ):
         samples = [s.copy() if s._in_db else s for s in samples]
 
         if self.media_type is None and samples:
@@ -2487,6 +2533,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
 
         dicts = [self._make_dict(sample) for sample in samples]
 
+        return samples, dicts
+
+    def _insert_sample_dicts(self, dicts):
         try:
             # adds `_id` to each dict
             self._sample_collection.insert_many(dicts)
@@ -2494,9 +2543,13 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             msg = bwe.details["writeErrors"][0]["errmsg"]
             raise ValueError(msg) from bwe
 
+    def _attach_samples_batch(self, samples, dicts, attach):
         for sample, d in zip(samples, dicts):
-            doc = self._sample_dict_to_doc(d)
-            sample._set_backing_doc(doc, dataset=self)
+            # Video samples must be attached in order to save their frames
+            if attach or sample.media_type == fom.VIDEO:
+                doc = self._sample_dict_to_doc(d)
+                sample._set_backing_doc(doc, dataset=self)
+
             if sample.media_type == fom.VIDEO:
                 sample.frames.save()
 
@@ -2575,13 +2628,16 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
 
         return d
 
-    def _bulk_write(self, ops, frames=False, ordered=False):
+    def _bulk_write(self, ops, frames=False, ordered=False, raw=False):
         if frames:
             coll = self._frame_collection
         else:
             coll = self._sample_collection
 
-        foo.bulk_write(ops, coll, ordered=ordered)
+        if raw:
+            foo.bulk_update_raw(ops, coll, ordered=ordered)
+        else:
+            foo.bulk_write(ops, coll, ordered=ordered)
 
         if frames:
             fofr.Frame._reload_docs(self._frame_collection_name)
@@ -3211,6 +3267,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         if view is not None:
             _save_view(view, fields=fields)
 
+        self._schema_version += 1
+
         try:
             self._doc.save(safe=True)
         except moe.DoesNotExist:
@@ -3790,6 +3848,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         expand_schema=True,
         dynamic=False,
         add_info=True,
+        num_workers=None,
         **kwargs,
     ):
         """Adds the contents of the given directory to the dataset.
@@ -3878,6 +3937,11 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                 document fields that are encountered
             add_info (True): whether to add dataset info from the importer (if
                 any) to the dataset's ``info``
+            num_workers (None): an optional number of processes to use to
+                parse samples in parallel. Only applicable to importers that
+                support it. See
+                :func:`fiftyone.utils.data.importers.import_samples` for more
+                information
             **kwargs: optional keyword arguments to pass to the constructor of
                 the :class:`fiftyone.utils.data.importers.DatasetImporter` for
                 the specified ``dataset_type``
@@ -3901,6 +3965,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             expand_schema=expand_schema,
             dynamic=dynamic,
             add_info=add_info,
+            num_workers=num_workers,
         )
 
     def merge_dir(
@@ -4417,6 +4482,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         expand_schema=True,
         dynamic=False,
         add_info=True,
+        num_workers=None,
     ):
         """Adds the samples from the given
         :class:`fiftyone.utils.data.importers.DatasetImporter` to the dataset.
@@ -4450,6 +4516,11 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                 document fields that are encountered
             add_info (True): whether to add dataset info from the importer (if
                 any) to the dataset's ``info``
+            num_workers (None): an optional number of processes to use to
+                parse samples in parallel. Only applicable to importers that
+                support it. See
+                :func:`fiftyone.utils.data.importers.import_samples` for more
+                information
 
         Returns:
             a list of IDs of the samples that were added to the dataset
@@ -4462,6 +4533,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             expand_schema=expand_schema,
             dynamic=dynamic,
             add_info=add_info,
+            num_workers=num_workers,
         )
 
     def merge_importer(
@@ -5062,6 +5134,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         label_field=None,
         tags=None,
         dynamic=False,
+        num_workers=None,
         **kwargs,
     ):
         """Creates a :class:`Dataset` from the contents of the given directory.
@@ -5146,6 +5219,11 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                 sample
             dynamic (False): whether to declare dynamic attributes of embedded
                 document fields that are encountered
+            num_workers (None): an optional number of processes to use to
+                parse samples in parallel. Only applicable to importers that
+                support it. See
+                :func:`fiftyone.utils.data.importers.import_samples` for more
+                information
             **kwargs: optional keyword arguments to pass to the constructor of
                 the :class:`fiftyone.utils.data.importers.DatasetImporter` for
                 the specified ``dataset_type``
@@ -5162,6 +5240,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             label_field=label_field,
             tags=tags,
             dynamic=dynamic,
+            num_workers=num_workers,
             **kwargs,
         )
         return dataset
@@ -5288,6 +5367,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         label_field=None,
         tags=None,
         dynamic=False,
+        num_workers=None,
     ):
         """Creates a :class:`Dataset` by importing the samples in the given
         :class:`fiftyone.utils.data.importers.DatasetImporter`.
@@ -5319,6 +5399,11 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                 sample
             dynamic (False): whether to declare dynamic attributes of embedded
                 document fields that are encountered
+            num_workers (None): an optional number of processes to use to
+                parse samples in parallel. Only applicable to importers that
+                support it. See
+                :func:`fiftyone.utils.data.importers.import_samples` for more
+                information
 
         Returns:
             a :class:`Dataset`
@@ -5329,6 +5414,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             label_field=label_field,
             tags=tags,
             dynamic=dynamic,
+            num_workers=num_workers,
         )
         return dataset
 
@@ -5739,6 +5825,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         detach_frames=False,
         frames_only=False,
         support=None,
+        frames_limit=None,
         group_slice=None,
         group_slices=None,
         detach_groups=False,
@@ -5789,7 +5876,11 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             _pipeline.extend(self._group_select_pipeline(group_slice))
 
         if attach_frames:
-            _pipeline.extend(self._attach_frames_pipeline(support=support))
+            _pipeline.extend(
+                self._attach_frames_pipeline(
+                    support=support, limit=frames_limit
+                )
+            )
 
         if pipeline is not None:
             _pipeline.extend(pipeline)
@@ -5811,7 +5902,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
 
         return _pipeline
 
-    def _attach_frames_pipeline(self, support=None):
+    def _attach_frames_pipeline(
+        self, support=None, limit=None, frames_filter=None, field="frames"
+    ):
         """A pipeline that attaches the frame documents for each document."""
         if self._is_clips:
             first = {"$arrayElemAt": ["$support", 0]}
@@ -5842,20 +5935,42 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             let = {"sample_id": "$_id"}
             match_expr = {"$eq": ["$$sample_id", "$_sample_id"]}
 
+        if frames_filter is not None:
+            match_expr = {"$and": [match_expr, frames_filter]}
+
+        pipeline = [
+            {"$match": {"$expr": match_expr}},
+            {"$sort": {"frame_number": 1}},
+        ]
+
+        if limit is not None:
+            pipeline.append({"$limit": limit})
+
         return [
             {
                 "$lookup": {
                     "from": self._frame_collection_name,
                     "let": let,
-                    "pipeline": [
-                        {"$match": {"$expr": match_expr}},
-                        {"$sort": {"frame_number": 1}},
-                    ],
-                    "as": "frames",
+                    "pipeline": pipeline,
+                    "as": field,
                 }
             }
         ]
 
+    def _match_frames_pipeline(self, frames_filter):
+        """A pipeline that selects only the documents with at least one frame
+        that matches the given frame-level aggregation expression.
+
+        The frames are queried directly, so the documents need not have their
+        frames attached.
+        """
+        return self._attach_frames_pipeline(
+            limit=1, frames_filter=frames_filter, field="_frames_match"
+        ) + [
+            {"$match": {"_frames_match": {"$ne": []}}},
+            {"$unset": "_frames_match"},
+        ]
+
     def _unwind_frames_pipeline(self):
         """A pipeline that returns (only) the unwound ``frames`` documents."""
         return [
@@ -6236,6 +6351,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         self._evaluation_cache.clear()
 
     def _reload(self, hard=False):
+        self._schema_version += 1
+
         if not hard:
             self._doc.reload()
             return
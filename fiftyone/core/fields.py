@@ -955,24 +955,31 @@ class VectorField(mongoengine.fields.BinaryField, Field):
 
     :class:`VectorField` instances accept numeric lists, tuples, and 1D numpy
     array values. The underlying data is serialized and stored in the database
-    as zlib-compressed bytes generated by ``numpy.save`` and always retrieved
-    as a numpy array.
+    via :func:`fiftyone.core.utils.serialize_array` and always retrieved as a
+    numpy array.
 
     Args:
         description (None): an optional description
         info (None): an optional info dict
+        compression (None): an optional compression to apply when storing
+            values. Supported values are ``("zlib", "lz4")``. By default,
+            vectors are stored uncompressed, since embeddings and other
+            floating point vectors rarely benefit from compression
     """
 
-    def __init__(self, description=None, info=None, **kwargs):
+    def __init__(
+        self, description=None, info=None, compression=None, **kwargs
+    ):
         super().__init__(**kwargs)
         self._description = description
         self._info = info
+        self._compression = compression
 
     def to_mongo(self, value):
         if value is None:
             return None
 
-        bytes = fou.serialize_numpy_array(value)
+        bytes = fou.serialize_array(value, compression=self._compression)
         return super().to_mongo(bytes)
 
     def to_python(self, value):
@@ -999,24 +1006,30 @@ class ArrayField(mongoengine.fields.BinaryField, Field):
     """An n-dimensional array field.
 
     :class:`ArrayField` instances accept numpy array values. The underlying
-    data is serialized and stored in the database as zlib-compressed bytes
-    generated by ``numpy.save`` and always retrieved as a numpy array.
+    data is serialized and stored in the database via
+    :func:`fiftyone.core.utils.serialize_array` and always retrieved as a
+    numpy array.
 
     Args:
         description (None): an optional description
         info (None): an optional info dict
+        compression ("zlib"): an optional compression to apply when storing
+            values. Supported values are ``(None, "zlib", "lz4")``
     """
 
-    def __init__(self, description=None, info=None, **kwargs):
+    def __init__(
+        self, description=None, info=None, compression="zlib", **kwargs
+    ):
         super().__init__(**kwargs)
         self._description = description
         self._info = info
+        self._compression = compression
 
     def to_mongo(self, value):
         if value is None:
             return None
 
-        bytes = fou.serialize_numpy_array(value)
+        bytes = fou.serialize_array(value, compression=self._compression)
         return super().to_mongo(bytes)
 
     def to_python(self, value):
@@ -19,6 +19,9 @@ import fiftyone.core.utils as fou
 fov = fou.lazy_import("fiftyone.core.view")
 
 
+_STREAM_BATCH_SIZE = 1000
+
+
 def get_default_frame_fields(include_private=False, use_db_fields=False):
     """Returns the default fields present on all frames.
 
@@ -256,6 +259,62 @@ class Frames(object):
         for frame in self._iter_frames():
             yield frame
 
+    def iter_frames(self, autosave=False, batch_size=None):
+        """Returns an iterator over the :class:`Frame` instances for the
+        sample that does not retain the frames that it loads in memory.
+
+        Unlike :meth:`values`, which caches every frame that it loads from the
+        database on this instance until the sample is saved, this method only
+        keeps references to frames while they are in use, so it can be used
+        to iterate over long videos with bounded memory.
+
+        The frames are traversed in ascending order.
+
+        Examples::
+
+            import fiftyone as fo
+            import fiftyone.zoo as foz
+
+            dataset = foz.load_zoo_dataset("quickstart-video")
+            sample = dataset.first()
+
+            # Save in batches of 100 frames
+            for frame in sample.frames.iter_frames(
+                autosave=True, batch_size=100
+            ):
+                frame["num_objects"] = len(frame.detections.detections)
+
+        Args:
+            autosave (False): whether to automatically save changes to the
+                frames emitted by this iterator. If True, any other pending
+                changes to the sample's frames are also saved
+            batch_size (None): the number of frames to fetch from the database
+                per batch and, when ``autosave`` is True, the number of frames
+                to save per batch. By default, 1000 is used
+
+        Returns:
+            a generator that emits :class:`Frame` instances
+        """
+        if batch_size is None:
+            batch_size = _STREAM_BATCH_SIZE
+
+        num_pending = 0
+        for frame in self._iter_frames(cache=False, batch_size=batch_size):
+            yield frame
+
+            if autosave:
+                # The frame is added back to the replacements so that its
+                # changes are included in the next save
+                self._set_replacement(frame)
+                num_pending += 1
+
+                if num_pending >= batch_size:
+                    self.save()
+                    num_pending = 0
+
+        if autosave:
+            self.save()
+
     def add_frame(
         self,
         frame_number,
@@ -563,71 +622,68 @@ class Frames(object):
     def _set_replacement(self, frame):
         self._replacements[frame.frame_number] = frame
 
-    def _iter_frames(self, offset=None):
+    def _iter_frames(self, offset=None, cache=True, batch_size=None):
         if offset is None:
             offset = -1
 
+        # A snapshot of the replacements is used so that saving the frames
+        # during iteration doesn't affect the frames that are emitted
+        replacements = sorted(
+            (fn, frame)
+            for fn, frame in self._replacements.items()
+            if fn >= offset
+        )
+
         if not self._in_db or self._delete_all:
-            for frame_number in sorted(self._replacements.keys()):
-                if frame_number >= offset:
-                    yield self._replacements[frame_number]
+            for _, frame in replacements:
+                yield frame
 
             return
 
-        if self._replacements:
-            max_repl_fn = max(self._replacements.keys())
-            repl_done = False
-        else:
-            max_repl_fn = -1
-            repl_done = True
+        delete_frames = set(self._delete_frames)
+        replacements = iter(replacements)
+        repl = next(replacements, None)
 
-        results = self._iter_frames_db()
+        # Database frames and replacements are both sorted by frame number, so
+        # they are merged rather than visiting every possible frame number
+        for d in self._iter_frames_db(batch_size=batch_size):
+            frame_number = d["frame_number"]
+            if frame_number < offset:
+                continue
 
-        try:
-            d = next(results)
-            db_done = False
-        except StopIteration:
-            d = None
-            db_done = True
-
-        frame_number = 1
-        while True:
-            if repl_done and db_done:
-                break
-
-            if frame_number >= offset:
-                if not repl_done and frame_number in self._replacements:
-                    yield self._replacements[frame_number]
+            while repl is not None and repl[0] < frame_number:
+                yield repl[1]
+                repl = next(replacements, None)
 
-                elif (
-                    not db_done
-                    and frame_number == d["frame_number"]
-                    and frame_number not in self._delete_frames
-                ):
-                    frame = self._make_frame(d)
-                    self._set_replacement(frame)
+            if repl is not None and repl[0] == frame_number:
+                yield repl[1]
+                repl = next(replacements, None)
+                continue
 
-                    yield frame
+            if frame_number in delete_frames:
+                continue
 
-            frame_number += 1
+            frame = self._make_frame(d)
+            if cache:
+                self._set_replacement(frame)
 
-            if not repl_done:
-                repl_done = max_repl_fn < frame_number
+            yield frame
 
-            if not db_done:
-                while d["frame_number"] < frame_number:
-                    try:
-                        d = next(results)
-                    except StopIteration:
-                        db_done = True
-                        break
+        while repl is not None:
+            yield repl[1]
+            repl = next(replacements, None)
 
-    def _iter_frames_db(self):
+    def _iter_frames_db(self, batch_size=None):
         pipeline = [
             self._get_frames_match_stage(),
             {"$sort": {"frame_number": 1}},
         ]
-        return foo.aggregate(self._frame_collection, pipeline)
+
+        cursor = foo.aggregate(self._frame_collection, pipeline)
+        if batch_size is not None:
+            cursor.batch_size(batch_size)
+
+        return cursor
 
     def _make_frame(self, d):
         doc = self._dataset._frame_dict_to_doc(d)
@@ -948,11 +1004,15 @@ class FramesView(Frames):
         except StopIteration:
             return None
 
-    def _iter_frames_db(self):
+    def _iter_frames_db(self, batch_size=None):
         if not self._needs_frames:
-            return super()._iter_frames_db()
+            return super()._iter_frames_db(batch_size=batch_size)
+
+        cursor = foo.aggregate(self._sample_collection, self._frames_pipeline)
+        if batch_size is not None:
+            cursor.batch_size(batch_size)
 
-        return foo.aggregate(self._sample_collection, self._frames_pipeline)
+        return cursor
 
     def _make_frame(self, d):
         doc = self._dataset._frame_dict_to_doc(d)
@@ -24,6 +24,8 @@ import fiftyone.core.utils as fou
 
 logger = logging.getLogger(__name__)
 
+_WRITE_BATCH_SIZE = 1000
+
 
 class Metadata(DynamicEmbeddedDocument):
     """Base class for storing metadata about generic samples.
@@ -229,12 +231,21 @@ def compute_sample_metadata(sample, overwrite=False, skip_failures=False):
 
 
 def compute_metadata(
-    sample_collection, overwrite=False, num_workers=None, skip_failures=True
+    sample_collection,
+    overwrite=False,
+    num_workers=None,
+    skip_failures=True,
+    refresh_stale=False,
 ):
     """Populates the ``metadata`` field of all samples in the collection.
 
     Any samples with existing metadata are skipped, unless
-    ``overwrite == True``.
+    ``overwrite == True`` or ``refresh_stale == True`` and their media has
+    changed.
+
+    Metadata is written to the database in batches as it is computed, so if
+    this method is interrupted, calling it again will resume where it left
+    off.
 
     Args:
         sample_collection: a
@@ -244,6 +255,9 @@ def compute_metadata(
             ``multiprocessing.cpu_count()`` is used
         skip_failures (True): whether to gracefully continue without raising an
             error if metadata cannot be computed for a sample
+        refresh_stale (False): whether to recompute existing metadata for
+            samples whose media's size on disk no longer matches its
+            ``size_bytes``
     """
     if num_workers is None:
         num_workers = multiprocessing.cpu_count()
@@ -254,12 +268,17 @@ def compute_metadata(
         )
 
     if num_workers <= 1:
-        _compute_metadata(sample_collection, overwrite=overwrite)
+        _compute_metadata(
+            sample_collection,
+            overwrite=overwrite,
+            refresh_stale=refresh_stale,
+        )
     else:
         _compute_metadata_multi(
             sample_collection,
             num_workers,
             overwrite=overwrite,
+            refresh_stale=refresh_stale,
         )
 
     num_missing = len(sample_collection.exists("metadata", False))
@@ -289,56 +308,120 @@ def get_image_info(f):
     return (img.width, img.height, len(img.getbands()))
 
 
-def _compute_metadata(sample_collection, overwrite=False):
-    if not overwrite:
-        sample_collection = sample_collection.exists("metadata", False)
+def _compute_metadata(sample_collection, overwrite=False, refresh_stale=False):
+    inputs = _get_metadata_inputs(
+        sample_collection, overwrite=overwrite, refresh_stale=refresh_stale
+    )
 
-    num_samples = len(sample_collection)
+    num_samples = len(inputs)
     if num_samples == 0:
         return
 
     logger.info("Computing metadata...")
-    with fou.ProgressBar(total=num_samples) as pb:
-        for sample in pb(sample_collection.select_fields()):
-            compute_sample_metadata(sample, skip_failures=True)
-
+    with _MetadataWriter(sample_collection) as writer:
+        with fou.ProgressBar(total=num_samples) as pb:
+            for args in pb(inputs):
+                writer.add(*_do_compute_metadata(args))
 
-def _compute_metadata_multi(sample_collection, num_workers, overwrite=False):
-    if not overwrite:
-        sample_collection = sample_collection.exists("metadata", False)
 
-    ids, filepaths, media_types = sample_collection.values(
-        ["id", "filepath", "_media_type"],
-        _allow_missing=True,
+def _compute_metadata_multi(
+    sample_collection, num_workers, overwrite=False, refresh_stale=False
+):
+    inputs = _get_metadata_inputs(
+        sample_collection, overwrite=overwrite, refresh_stale=refresh_stale
     )
 
-    inputs = list(zip(ids, filepaths, media_types))
     num_samples = len(inputs)
-
     if num_samples == 0:
         return
 
     logger.info("Computing metadata...")
 
-    view = sample_collection.select_fields()
-    with fou.ProgressBar(total=num_samples) as pb:
-        with fou.get_multiprocessing_context().Pool(
-            processes=num_workers
-        ) as pool:
-            for sample_id, metadata in pb(
-                pool.imap_unordered(_do_compute_metadata, inputs)
-            ):
-                sample = view[sample_id]
-                sample.metadata = metadata
-                sample.save()
+    chunksize = max(1, min(num_samples // (4 * num_workers), 100))
+    with _MetadataWriter(sample_collection) as writer:
+        with fou.ProgressBar(total=num_samples) as pb:
+            with fou.get_multiprocessing_context().Pool(
+                processes=num_workers
+            ) as pool:
+                for result in pb(
+                    pool.imap_unordered(
+                        _do_compute_metadata, inputs, chunksize=chunksize
+                    )
+                ):
+                    writer.add(*result)
+
+
+def _get_metadata_inputs(
+    sample_collection, overwrite=False, refresh_stale=False
+):
+    if not overwrite and not refresh_stale:
+        sample_collection = sample_collection.exists("metadata", False)
+
+    ids, filepaths, media_types, sizes = sample_collection.values(
+        ["id", "filepath", "_media_type", "metadata.size_bytes"],
+        _allow_missing=True,
+    )
+
+    # When overwriting, existing sizes are ignored so that all metadata is
+    # recomputed
+    if overwrite:
+        sizes = itertools.repeat(None)
+
+    return list(zip(ids, filepaths, media_types, sizes))
+
+
+class _MetadataWriter(object):
+    """Context manager that writes computed metadata to a collection in
+    batches.
+    """
+
+    def __init__(self, sample_collection, batch_size=None):
+        if batch_size is None:
+            batch_size = _WRITE_BATCH_SIZE
+
+        self.sample_collection = sample_collection
+        self.batch_size = batch_size
+        self._metadata = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.flush()
+
+    def add(self, sample_id, metadata, changed):
+        if not changed:
+            return
+
+        self._metadata[sample_id] = metadata
+        if len(self._metadata) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self._metadata:
+            return
+
+        self.sample_collection.set_values(
+            "metadata", self._metadata, key_field="id"
+        )
+        self._metadata = {}
 
 
 def _do_compute_metadata(args):
-    sample_id, filepath, media_type = args
+    sample_id, filepath, media_type, size_bytes = args
+
+    # Existing metadata is considered current if the media's size is unchanged
+    if size_bytes is not None:
+        try:
+            if os.path.getsize(filepath) == size_bytes:
+                return sample_id, None, False
+        except:
+            pass
+
     metadata = _compute_sample_metadata(
         filepath, media_type, skip_failures=True
     )
-    return sample_id, metadata
+    return sample_id, metadata, True
 
 
 def _compute_sample_metadata(filepath, media_type, skip_failures=False):
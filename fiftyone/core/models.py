@@ -5,9 +5,13 @@ FiftyOne models.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from collections import deque
 import contextlib
 import inspect
+import itertools
 import logging
+from multiprocessing.pool import ThreadPool
+import timeit
 
 import numpy as np
 
@@ -84,7 +88,10 @@ def apply_model(
         batch_size (None): an optional batch size to use, if the model supports
             batching
         num_workers (None): the number of workers to use when loading images.
-            Only applicable for Torch-based models
+            For Torch-based models, this is the number of ``DataLoader``
+            workers. For other image models, providing this parameter causes
+            images to be read and preprocessed by a pool of this many
+            background threads that prefetch upcoming batches
         skip_failures (True): whether to gracefully continue without raising an
             error if predictions cannot be generated for a sample. Only
             applicable to :class:`Model` instances
@@ -152,9 +159,16 @@ def apply_model(
         isinstance(model, TorchModelMixin) and samples.media_type == fom.IMAGE
     )
 
-    if num_workers is not None and not use_data_loader:
+    use_prefetch = (
+        not use_data_loader
+        and num_workers is not None
+        and samples.media_type == fom.IMAGE
+    )
+
+    if num_workers is not None and not use_data_loader and not use_prefetch:
         logger.warning(
-            "Ignoring `num_workers` parameter; only supported for Torch models"
+            "Ignoring `num_workers` parameter; only supported for image "
+            "collections"
         )
 
     if output_dir is not None:
@@ -186,6 +200,16 @@ def apply_model(
             # pylint: disable=no-member
             context.enter_context(fou.SetAttributes(model, preprocess=False))
 
+        if use_prefetch:
+            transforms = _get_prefetch_transforms(model)
+            if transforms is not None:
+                # pylint: disable=no-member
+                context.enter_context(
+                    fou.SetAttributes(model, preprocess=False)
+                )
+        else:
+            transforms = None
+
         # pylint: disable=no-member
         context.enter_context(model)
 
@@ -236,6 +260,19 @@ def apply_model(
                 filename_maker,
             )
 
+        if use_prefetch:
+            return _apply_image_model_prefetch(
+                samples,
+                model,
+                label_field,
+                confidence_thresh,
+                batch_size,
+                num_workers,
+                transforms,
+                skip_failures,
+                filename_maker,
+            )
+
         if batch_size is not None:
             return _apply_image_model_batch(
                 samples,
@@ -392,6 +429,144 @@ def _apply_image_model_data_loader(
             pb.update(len(sample_batch))
 
 
+def _apply_image_model_prefetch(
+    samples,
+    model,
+    label_field,
+    confidence_thresh,
+    batch_size,
+    num_workers,
+    transforms,
+    skip_failures,
+    filename_maker,
+):
+    samples = samples.select_fields()
+    samples_loader = fou.iter_batches(samples, batch_size or 1)
+
+    num_workers = max(1, num_workers)
+    stack = transforms is not None and not model.ragged_batches
+    stats = {"load_time": 0.0, "wait_time": 0.0, "predict_time": 0.0}
+
+    def _submit(pool, results, sample_batch):
+        filepaths = [sample.filepath for sample in sample_batch]
+        result = pool.apply_async(
+            _load_image_batch, (filepaths, transforms, stack)
+        )
+        results.append((sample_batch, result))
+
+    start_time = timeit.default_timer()
+
+    with ThreadPool(processes=num_workers) as pool:
+        with fou.ProgressBar(samples) as pb:
+            # Keep a bounded number of batches in flight so that images are
+            # loaded ahead of inference without buffering the entire
+            # collection in memory
+            results = deque()
+            for sample_batch in itertools.islice(
+                samples_loader, 2 * num_workers
+            ):
+                _submit(pool, results, sample_batch)
+
+            while results:
+                sample_batch, result = results.popleft()
+
+                _start_time = timeit.default_timer()
+                imgs, load_time = result.get()
+                stats["wait_time"] += timeit.default_timer() - _start_time
+                stats["load_time"] += load_time
+
+                next_batch = next(samples_loader, None)
+                if next_batch is not None:
+                    _submit(pool, results, next_batch)
+
+                try:
+                    if isinstance(imgs, Exception):
+                        raise imgs
+
+                    _start_time = timeit.default_timer()
+                    if batch_size is not None:
+                        labels_batch = model.predict_all(imgs)
+                    else:
+                        labels_batch = [model.predict(imgs[0])]
+
+                    stats["predict_time"] += (
+                        timeit.default_timer() - _start_time
+                    )
+
+                    for sample, labels in zip(sample_batch, labels_batch):
+                        if filename_maker is not None:
+                            _export_arrays(
+                                labels, sample.filepath, filename_maker
+                            )
+
+                        sample.add_labels(
+                            labels,
+                            label_field=label_field,
+                            confidence_thresh=confidence_thresh,
+                        )
+                        sample.save()
+
+                except Exception as e:
+                    if not skip_failures:
+                        raise e
+
+                    logger.warning(
+                        "Batch: %s - %s\nError: %s\n",
+                        sample_batch[0].id,
+                        sample_batch[-1].id,
+                        e,
+                    )
+
+                pb.update(len(sample_batch))
+
+    total_time = timeit.default_timer() - start_time
+    _log_prefetch_stats(num_workers, total_time, stats)
+
+
+def _get_prefetch_transforms(model):
+    # Models are not required to expose their preprocessing, in which case
+    # they must perform it themselves in the main thread
+    try:
+        if model.preprocess:
+            return model.transforms
+    except NotImplementedError:
+        pass
+
+    return None
+
+
+def _load_image_batch(filepaths, transforms, stack):
+    start_time = timeit.default_timer()
+
+    try:
+        imgs = [etai.read(filepath) for filepath in filepaths]
+
+        if transforms is not None:
+            imgs = [transforms(img) for img in imgs]
+
+        if stack and all(isinstance(img, np.ndarray) for img in imgs):
+            imgs = np.stack(imgs)
+    except Exception as e:
+        # Errors are raised in the main thread, which handles failures
+        imgs = e
+
+    return imgs, timeit.default_timer() - start_time
+
+
+def _log_prefetch_stats(num_workers, total_time, stats):
+    logger.info(
+        "Loaded images in %.1fs of worker time across %d workers",
+        stats["load_time"],
+        num_workers,
+    )
+    logger.info(
+        "Inference took %.1fs; waited %.1fs for images; %.1fs total",
+        stats["predict_time"],
+        stats["wait_time"],
+        total_time,
+    )
+
+
 def _apply_image_model_to_frames_single(
     samples,
     model,
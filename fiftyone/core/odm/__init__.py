@@ -9,6 +9,7 @@ import types
 
 from .database import (
     aggregate,
+    aggregate_raw_batches,
     get_db_config,
     establish_db_conn,
     get_db_client,
@@ -37,6 +38,7 @@ from .database import (
     import_collection,
     insert_documents,
     bulk_write,
+    bulk_update_raw,
 )
 from .dataset import (
     SampleFieldDocument,
@@ -46,6 +48,7 @@ from .dataset import (
     SidebarGroupDocument,
 )
 from .document import (
+    DeferredUpdate,
     Document,
     SerializableDocument,
 )
@@ -7,13 +7,19 @@ Database utilities.
 """
 import atexit
 from datetime import datetime
+import gzip
+import itertools
+import json
 import logging
 from multiprocessing.pool import ThreadPool
 import os
+import re
 
 import asyncio
+import bson
 from bson import json_util, ObjectId
 from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
 from mongoengine import connect
 import mongoengine.errors as moe
 import motor.motor_asyncio as mtr
@@ -43,6 +49,12 @@ _async_client = None
 _connection_kwargs = {}
 _db_service = None
 
+_BSON_SHARD_SIZE = 10000
+_JSON_CHUNK_SIZE = 1 << 20
+_MAX_UPDATE_BATCH_BYTES = 1 << 23  # well below the 16MB command limit
+_JSON_HEADER_REGEX = re.compile(r'\s*\{\s*"((?:[^"\\]|\\.)*)"\s*:\s*\[')
+_JSON_SEPARATOR_REGEX = re.compile(r"[\s,]*")
+
 
 #
 # IMPORTANT DATABASE CONFIG REQUIREMENTS
@@ -339,6 +351,21 @@ def aggregate(collection, pipelines):
     return _do_pooled_aggregate(collection, pipelines)
 
 
+def aggregate_raw_batches(collection, pipeline):
+    """Executes an aggregation on a collection and returns its results as raw
+    BSON batches rather than decoded documents.
+
+    Args:
+        collection: a ``pymongo.collection.Collection``
+        pipeline: a MongoDB aggregation pipeline
+
+    Returns:
+        a list of ``bytes``, each of which contains a batch of concatenated
+        BSON documents
+    """
+    return list(collection.aggregate_raw_batches(pipeline, allowDiskUse=True))
+
+
 def _do_pooled_aggregate(collection, pipelines):
     # @todo: MongoDB 5.0 supports snapshots which can be used to make the
     # results consistent, i.e. read from the same point in time
@@ -617,28 +644,52 @@ def export_collection(
     key="documents",
     patt="{idx:06d}-{id}.json",
     num_docs=None,
+    max_shard_size=None,
 ):
-    """Exports the collection to disk in JSON format.
+    """Exports the collection to disk in JSON or BSON format.
+
+    The format is determined by the extension of ``json_dir_or_path``:
+
+    -   ``.json``: a single JSON file of the form ``{key: [doc, ...]}``
+    -   ``.bson`` or ``.bson.gz``: a single (optionally gzip-compressed) file
+        containing the concatenated BSON documents
+    -   otherwise, a directory of files whose names are generated via
+        ``patt``. If ``patt`` ends in ``.json``, one JSON file is written per
+        document. If ``patt`` ends in ``.bson`` or ``.bson.gz``, the documents
+        are written to BSON shard files containing up to ``max_shard_size``
+        documents each
 
     Args:
-        docs: an iterable containing the documents to export
-        json_dir_or_path: the path to write a single JSON file containing the
+        docs: an iterable containing the documents to export. The documents
+            may be ``bson.raw_bson.RawBSONDocument`` instances, in which case
+            their raw bytes are written directly when exporting BSON
+        json_dir_or_path: the path to write a single file containing the
             entire collection, or a directory in which to write per-document
-            JSON files
+            or per-shard files
         key ("documents"): the field name under which to store the documents
-            when ``json_path`` is a single JSON file
+            when ``json_dir_or_path`` is a single JSON file
         patt ("{idx:06d}-{id}.json"): a filename pattern to use when
-            ``json_path`` is a directory. The pattern may contain ``idx`` to
-            refer to the index of the document in ``docs`` or ``id`` to refer
-            to the document's ID
+            ``json_dir_or_path`` is a directory. The pattern may contain
+            ``idx`` to refer to the index of the document in ``docs`` (or of
+            the shard, when writing BSON shards) or ``id`` to refer to the
+            document's ID (JSON only)
         num_docs (None): the total number of documents. If omitted, this must
             be computable via ``len(docs)``
+        max_shard_size (None): the maximum number of documents to write to
+            each BSON shard. Only applicable when writing BSON shards. By
+            default, 10,000 documents are written to each shard
     """
     if num_docs is None:
         num_docs = len(docs)
 
     if json_dir_or_path.endswith(".json"):
         _export_collection_single(docs, json_dir_or_path, key, num_docs)
+    elif _is_bson_path(json_dir_or_path):
+        _export_collection_bson(docs, json_dir_or_path, num_docs)
+    elif _is_bson_path(patt):
+        _export_collection_shards(
+            docs, json_dir_or_path, patt, num_docs, max_shard_size
+        )
     else:
         _export_collection_multi(docs, json_dir_or_path, patt, num_docs)
 
@@ -667,6 +718,31 @@ def _export_collection_multi(docs, json_dir, patt, num_docs):
             export_document(doc, json_path)
 
 
+def _export_collection_bson(docs, bson_path, num_docs):
+    etau.ensure_basedir(bson_path)
+
+    with fou.ProgressBar(total=num_docs, iters_str="docs") as pb:
+        with _open_bson(bson_path, "wb") as f:
+            for doc in pb(docs):
+                f.write(_encode_bson(doc))
+
+
+def _export_collection_shards(docs, bson_dir, patt, num_docs, max_shard_size):
+    if max_shard_size is None:
+        max_shard_size = _BSON_SHARD_SIZE
+
+    etau.ensure_dir(bson_dir)
+
+    bson_patt = os.path.join(bson_dir, patt)
+    with fou.ProgressBar(total=num_docs, iters_str="docs") as pb:
+        for idx, shard in enumerate(fou.iter_batches(docs, max_shard_size), 1):
+            with _open_bson(bson_patt.format(idx=idx), "wb") as f:
+                for doc in shard:
+                    f.write(_encode_bson(doc))
+
+            pb.update(count=len(shard))
+
+
 def import_document(json_path):
     """Imports a document from JSON on disk.
 
@@ -680,45 +756,164 @@ def import_document(json_path):
         return json_util.loads(f.read())
 
 
-def import_collection(json_dir_or_path, key="documents"):
-    """Imports the collection from JSON on disk.
+def import_collection(json_dir_or_path, key="documents", raw=False):
+    """Imports the collection from JSON or BSON on disk.
+
+    Documents are read incrementally from disk as the returned iterable is
+    consumed, so the collection need not fit in memory.
+
+    See :func:`export_collection` for the supported formats.
 
     Args:
-        json_dir_or_path: the path to a JSON file on disk, or a directory
-            containing per-document JSON files
+        json_dir_or_path: the path to a JSON or (optionally gzip-compressed)
+            BSON file on disk, or a directory containing per-document JSON
+            files or BSON shard files
         key ("documents"): the field name under which the documents are stored
-            when ``json_path`` is a single JSON file
+            when ``json_dir_or_path`` is a single JSON file
+        raw (False): whether to return documents read from BSON files as
+            ``bson.raw_bson.RawBSONDocument`` instances rather than decoding
+            them. Documents read from JSON files are always decoded
 
     Returns:
         a tuple of
 
         -   an iterable of BSON documents
-        -   the number of documents
+        -   the number of documents, or None if it cannot be determined without
+            reading the entire collection
     """
     if json_dir_or_path.endswith(".json"):
         return _import_collection_single(json_dir_or_path, key)
 
-    return _import_collection_multi(json_dir_or_path)
-
+    if _is_bson_path(json_dir_or_path):
+        return (
+            _import_collection_bson(json_dir_or_path, raw=raw),
+            _count_bson_docs(json_dir_or_path),
+        )
 
-def _import_collection_single(json_path, key):
-    with open(json_path, "r") as f:
-        docs = json_util.loads(f.read()).get(key, [])
+    return _import_collection_multi(json_dir_or_path, raw=raw)
 
-    num_docs = len(docs)
 
-    return docs, num_docs
+def _import_collection_single(json_path, key):
+    return _iter_json_docs(json_path, key), None
 
 
-def _import_collection_multi(json_dir):
-    json_paths = [
+def _import_collection_multi(json_dir, raw=False):
+    paths = [
         p
         for p in etau.list_files(json_dir, abs_paths=True)
-        if p.endswith(".json")
+        if p.endswith(".json") or _is_bson_path(p)
     ]
-    docs = map(import_document, json_paths)
 
-    return docs, len(json_paths)
+    if all(p.endswith(".json") for p in paths):
+        return map(import_document, paths), len(paths)
+
+    docs = itertools.chain.from_iterable(
+        _import_file_docs(p, raw=raw) for p in paths
+    )
+    num_docs = sum(
+        _count_bson_docs(p) if _is_bson_path(p) else 1 for p in paths
+    )
+
+    return docs, num_docs
+
+
+def _import_file_docs(path, raw=False):
+    if _is_bson_path(path):
+        return _import_collection_bson(path, raw=raw)
+
+    return [import_document(path)]
+
+
+def _import_collection_bson(bson_path, raw=False):
+    if raw:
+        codec_options = CodecOptions(document_class=RawBSONDocument)
+    else:
+        codec_options = bson.DEFAULT_CODEC_OPTIONS
+
+    with _open_bson(bson_path, "rb") as f:
+        for doc in bson.decode_file_iter(f, codec_options=codec_options):
+            yield doc
+
+
+def _count_bson_docs(bson_path):
+    # Each BSON document begins with its size in bytes, so documents can be
+    # counted without decoding them
+    num_docs = 0
+    with _open_bson(bson_path, "rb") as f:
+        while True:
+            size_data = f.read(4)
+            if len(size_data) < 4:
+                break
+
+            size = int.from_bytes(size_data, "little")
+            f.seek(size - 4, os.SEEK_CUR)
+            num_docs += 1
+
+    return num_docs
+
+
+def _iter_json_docs(json_path, key):
+    # Incrementally parses the documents in a JSON file of the form
+    # `{key: [doc, ...]}` without reading the entire file into memory
+    decoder = json.JSONDecoder(object_pairs_hook=json_util.object_pairs_hook)
+
+    with open(json_path, "r") as f:
+        buf = f.read(_JSON_CHUNK_SIZE)
+        eof = not buf
+
+        m = _JSON_HEADER_REGEX.match(buf)
+        if m is None or json.loads('"%s"' % m.group(1)) != key:
+            # Not the layout written by `export_collection()`
+            buf += f.read()
+            for doc in json_util.loads(buf).get(key, []):
+                yield doc
+
+            return
+
+        pos = m.end()
+        while True:
+            pos = _JSON_SEPARATOR_REGEX.match(buf, pos).end()
+
+            if pos < len(buf) and buf[pos] == "]":
+                return
+
+            try:
+                doc, pos = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+
+                # Read more data, growing the read size so that large
+                # documents are not repeatedly re-parsed
+                data = f.read(max(_JSON_CHUNK_SIZE, len(buf) - pos))
+                eof = not data
+                buf = buf[pos:] + data
+                pos = 0
+                continue
+
+            yield doc
+
+            if pos >= _JSON_CHUNK_SIZE:
+                buf = buf[pos:]
+                pos = 0
+
+
+def _is_bson_path(path):
+    return path.endswith(".bson") or path.endswith(".bson.gz")
+
+
+def _open_bson(bson_path, mode):
+    if bson_path.endswith(".gz"):
+        return gzip.open(bson_path, mode)
+
+    return open(bson_path, mode)
+
+
+def _encode_bson(doc):
+    if isinstance(doc, RawBSONDocument):
+        return doc.raw
+
+    return bson.encode(doc)
 
 
 def insert_documents(docs, coll, ordered=False, progress=False, num_docs=None):
@@ -781,6 +976,41 @@ def bulk_write(ops, coll, ordered=False):
         raise ValueError(msg) from bwe
 
 
+def bulk_update_raw(updates, coll, ordered=False):
+    """Performs a batch of update statements whose BSON has already been
+    encoded on a collection.
+
+    Args:
+        updates: a list of ``bson.raw_bson.RawBSONDocument`` update statements
+            of the form ``{"q": query, "u": update}``
+        coll: a pymongo collection
+        ordered (False): whether the updates must be performed in order
+    """
+    batch = []
+    batch_size = 0
+    for update in updates:
+        if len(batch) >= 100000 or batch_size >= _MAX_UPDATE_BATCH_BYTES:
+            _do_update_raw(batch, coll, ordered)
+            batch = []
+            batch_size = 0
+
+        batch.append(update)
+        batch_size += len(update.raw)
+
+    if batch:
+        _do_update_raw(batch, coll, ordered)
+
+
+def _do_update_raw(updates, coll, ordered):
+    result = coll.database.command(
+        "update", coll.name, updates=updates, ordered=ordered
+    )
+
+    write_errors = result.get("writeErrors", None)
+    if write_errors:
+        raise ValueError(write_errors[0]["errmsg"])
+
+
 def list_datasets():
     """Returns the list of available FiftyOne datasets.
 
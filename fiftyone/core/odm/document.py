@@ -680,10 +680,44 @@ class Document(BaseDocument, mongoengine.Document):
         return updated_existing
 
     def _deferred_updates(self, _id, updates, upsert):
-        op = UpdateOne({"_id": _id}, updates, upsert=upsert)
+        if upsert:
+            op = UpdateOne({"_id": _id}, updates, upsert=True)
+        else:
+            op = DeferredUpdate(_id, updates)
+
         return [op]
 
 
+class DeferredUpdate(object):
+    """An update of a single document by ID whose write has been deferred.
+
+    Unlike ``pymongo`` operations, the update document remains accessible so
+    that identical updates of multiple documents can be coalesced before they
+    are written.
+
+    Args:
+        _id: the ID of the document
+        update: the update document
+    """
+
+    def __init__(self, _id, update):
+        self._id = _id
+        self.update = update
+
+    @property
+    def id(self):
+        """The ID of the document."""
+        return self._id
+
+    def to_op(self):
+        """Returns a ``pymongo.UpdateOne`` that performs this update.
+
+        Returns:
+            a ``pymongo.UpdateOne``
+        """
+        return UpdateOne({"_id": self._id}, self.update)
+
+
 def _merge_lists(dst, src, overwrite=False):
     dst.extend(v for v in src if v not in dst)
 
@@ -16,6 +16,7 @@ import fiftyone.core.utils as fou
 
 from .database import get_db_conn
 from .dataset import SampleFieldDocument
+from .document import DeferredUpdate
 from .utils import (
     deserialize_value,
     serialize_value,
@@ -1280,7 +1281,10 @@ class DatasetMixin(object):
         ops = []
 
         if updates:
-            ops.append(UpdateOne({"_id": _id}, updates, upsert=upsert))
+            if upsert:
+                ops.append(UpdateOne({"_id": _id}, updates, upsert=True))
+            else:
+                ops.append(DeferredUpdate(_id, updates))
 
         for update, element_id in extra_updates:
             ops.append(
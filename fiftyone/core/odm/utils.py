@@ -65,7 +65,8 @@ def serialize_value(value, extended=False):
 
     if isinstance(value, np.ndarray):
         # VectorField/ArrayField
-        binary = Binary(fou.serialize_numpy_array(value))
+        compression = None if value.ndim == 1 else "zlib"
+        binary = Binary(fou.serialize_array(value, compression=compression))
         if not extended:
             return binary
 
@@ -7,7 +7,9 @@ Dataset samples.
 """
 import os
 
+import bson
 from bson import ObjectId
+from bson.raw_bson import RawBSONDocument
 
 from fiftyone.core.document import Document, DocumentView
 import fiftyone.core.frame as fofr
@@ -748,6 +750,176 @@ class SampleView(_SampleMixin, DocumentView):
         return sample_ops, frame_ops
 
 
+class LightweightSample(object):
+    """A read-only proxy for a sample in a collection that lazily decodes its
+    field values from the raw database document.
+
+    Lightweight samples skip the construction of the backing sample document,
+    so iterating over them is significantly faster than iterating over
+    :class:`Sample` or :class:`SampleView` instances, especially when only a
+    few fields of each sample are accessed. Each field is decoded on first
+    access and then cached.
+
+    .. note::
+
+        Lightweight samples should never be created manually; they are
+        generated by passing ``lightweight=True`` to
+        :meth:`fiftyone.core.collections.SampleCollection.iter_samples`.
+
+    Args:
+        d: a ``bson.raw_bson.RawBSONDocument``
+        schema: a dict mapping field names to
+            :class:`fiftyone.core.fields.Field` instances
+        codec_options: the ``bson.codec_options.CodecOptions`` to use when
+            decoding embedded documents
+    """
+
+    __slots__ = ("_d", "_schema", "_codec_options", "_values")
+
+    def __init__(self, d, schema, codec_options):
+        object.__setattr__(self, "_d", d)
+        object.__setattr__(self, "_schema", schema)
+        object.__setattr__(self, "_codec_options", codec_options)
+        object.__setattr__(self, "_values", {})
+
+    def __str__(self):
+        return repr(self)
+
+    def __repr__(self):
+        return "<%s: id=%s, filepath=%s>" % (
+            self.__class__.__name__,
+            self.id,
+            self.get_field("filepath") if "filepath" in self else None,
+        )
+
+    def __dir__(self):
+        return super().__dir__() + list(self.field_names)
+
+    def __contains__(self, name):
+        return self.has_field(name)
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        return self.get_field(name)
+
+    def __setattr__(self, name, value):
+        self._raise_read_only()
+
+    def __delattr__(self, name):
+        self._raise_read_only()
+
+    def __getitem__(self, field_name):
+        try:
+            return self.get_field(field_name)
+        except AttributeError as e:
+            raise KeyError(e.args[0])
+
+    def __setitem__(self, field_name, value):
+        self._raise_read_only()
+
+    def __delitem__(self, field_name):
+        self._raise_read_only()
+
+    @property
+    def id(self):
+        """The ID of the sample."""
+        return str(self._d["_id"])
+
+    @property
+    def _id(self):
+        return self._d["_id"]
+
+    @property
+    def filename(self):
+        """The basename of the media's filepath."""
+        return os.path.basename(self.filepath)
+
+    @property
+    def media_type(self):
+        """The media type of the sample."""
+        return self._d.get("_media_type", None)
+
+    @property
+    def field_names(self):
+        """An ordered tuple of the public field names of this sample."""
+        return tuple(f for f in self._schema if not f.startswith("_"))
+
+    def has_field(self, field_name):
+        """Determines whether the sample has the given field.
+
+        Args:
+            field_name: the field name
+
+        Returns:
+            True/False
+        """
+        return field_name in self._schema
+
+    def get_field(self, field_name):
+        """Gets the value of a field of the sample.
+
+        Args:
+            field_name: the field name
+
+        Returns:
+            the field value
+
+        Raises:
+            AttributeError: if the field does not exist
+        """
+        try:
+            return self._values[field_name]
+        except KeyError:
+            pass
+
+        field = self._schema.get(field_name, None)
+        if field is None:
+            raise AttributeError(
+                "%s has no field '%s'" % (self.__class__.__name__, field_name)
+            )
+
+        value = self._d.get(field.db_field or field_name, None)
+        if value is not None:
+            value = field.to_python(_decode_raw(value, self._codec_options))
+
+        self._values[field_name] = value
+        return value
+
+    def to_mongo_dict(self, include_id=False):
+        """Serializes the sample to a BSON dictionary equivalent to the
+        representation that is stored in the database.
+
+        Args:
+            include_id (False): whether to include the sample ID
+
+        Returns:
+            a BSON dict
+        """
+        d = bson.decode(self._d.raw, codec_options=self._codec_options)
+        if not include_id:
+            d.pop("_id", None)
+
+        return d
+
+    def _raise_read_only(self):
+        raise ValueError(
+            "%s instances are read-only; use `iter_samples()` without "
+            "`lightweight=True` to edit samples" % self.__class__.__name__
+        )
+
+
+def _decode_raw(value, codec_options):
+    if isinstance(value, RawBSONDocument):
+        return bson.decode(value.raw, codec_options=codec_options)
+
+    if isinstance(value, list):
+        return [_decode_raw(v, codec_options) for v in value]
+
+    return value
+
+
 def _apply_confidence_thresh(label, confidence_thresh):
     if _is_frames_dict(label):
         label = {
@@ -9,11 +9,13 @@ from collections import defaultdict, OrderedDict
 import contextlib
 from copy import deepcopy
 import itertools
+import numbers
 import random
 import reprlib
 import uuid
 import warnings
 
+import bson
 from bson import ObjectId
 import numpy as np
 
@@ -40,6 +42,8 @@ fov = fou.lazy_import("fiftyone.core.view")
 fovi = fou.lazy_import("fiftyone.core.video")
 foug = fou.lazy_import("fiftyone.utils.geojson")
 
+_MAX_SELECT_ORDER_BYTES = 15 * 1024**2
+
 
 class ViewStage(object):
     """Abstract base class for all view stages.
@@ -239,6 +243,25 @@ class ViewStage(object):
         """
         return None
 
+    def _get_limited_frames_pipeline(self, sample_collection):
+        """Returns a MongoDB aggregation pipeline that is equivalent to
+        :meth:`to_mongo` when only the first frame(s) of each video sample,
+        rather than all of their frames, are attached.
+
+        This method is only called for stages that need frames, and it
+        returns ``None`` by default, meaning that the stage requires all
+        frames to be attached.
+
+        Args:
+            sample_collection: the
+                :class:`fiftyone.core.collections.SampleCollection` to which
+                the stage is being applied
+
+        Returns:
+            None, or a MongoDB aggregation pipeline (list of dicts)
+        """
+        return None
+
     def _serialize(self, include_uuid=True):
         """Returns a JSON dict representation of the :class:`ViewStage`.
 
@@ -2021,6 +2044,9 @@ class FilterLabels(ViewStage):
                 % self.__class__
             )
 
+        return self._make_pipeline(sample_collection, self._only_matches)
+
+    def _make_pipeline(self, sample_collection, only_matches):
         labels_field, is_frame_field = sample_collection._handle_frame_field(
             self._labels_field
         )
@@ -2055,7 +2081,7 @@ class FilterLabels(ViewStage):
             labels_field,
             new_field,
             label_filter,
-            only_matches=self._only_matches,
+            only_matches=only_matches,
         )
 
         pipeline.extend(filter_pipeline)
@@ -2065,6 +2091,62 @@ class FilterLabels(ViewStage):
 
         return pipeline
 
+    def _get_limited_frames_pipeline(self, sample_collection):
+        # Trajectories are defined by all frames of the video
+        if self._trajectories:
+            return None
+
+        pipeline = []
+
+        if self._only_matches:
+            # Samples with a matching label in any of their frames are found
+            # by querying the frames directly, which requires that no previous
+            # stage has modified this field
+            if _may_modify_frame_field(sample_collection, self._labels_field):
+                return None
+
+            frames_filter = self._get_frames_filter(sample_collection)
+            pipeline.extend(
+                sample_collection._dataset._match_frames_pipeline(
+                    frames_filter
+                )
+            )
+
+        pipeline.extend(self._make_pipeline(sample_collection, False))
+
+        return pipeline
+
+    def _get_frames_filter(self, sample_collection):
+        # An expression on frame documents that is true if the frame contains
+        # at least one label after filtering
+        labels_field, _ = sample_collection._handle_frame_field(
+            self._labels_field
+        )
+
+        if self._is_labels_list_field:
+            return {
+                "$gt": [
+                    {
+                        "$size": {
+                            "$filter": {
+                                "input": {"$ifNull": ["$" + labels_field, []]},
+                                "cond": _get_list_field_mongo_filter(
+                                    self._filter
+                                ),
+                            }
+                        }
+                    },
+                    0,
+                ]
+            }
+
+        return {
+            "$and": [
+                {"$gt": ["$" + labels_field, None]},
+                _get_field_mongo_filter(self._filter, prefix=labels_field),
+            ]
+        }
+
     def _parse_labels_field(self, sample_collection):
         field_name, is_list_field, is_frame_field = _parse_labels_field(
             sample_collection, self._field
@@ -2151,6 +2233,27 @@ class FilterLabels(ViewStage):
         self._parse_labels_field(sample_collection)
 
 
+def _may_modify_frame_field(sample_collection, field):
+    # Whether any stage in the collection may have modified the given
+    # frame-level field. Only label filters of other fields are known not to
+    if not isinstance(sample_collection, fov.DatasetView):
+        return False
+
+    root = field.split(".")[1]
+    dataset = sample_collection._dataset
+    for stage in sample_collection._stages:
+        if not stage._needs_frames(dataset):
+            continue
+
+        if isinstance(stage, FilterLabels) and not stage.trajectories:
+            if stage._new_field.split(".")[1] != root:
+                continue
+
+        return True
+
+    return False
+
+
 def _get_filter_list_field_pipeline(
     filter_field,
     new_field,
@@ -4937,7 +5040,10 @@ class Select(ViewStage):
             -   a :class:`fiftyone.core.collections.SampleCollection`
 
         ordered (False): whether to sort the samples in the returned view to
-            match the order of the provided IDs
+            match the order of the provided IDs. All IDs are embedded in the
+            view's pipeline, which is subject to MongoDB's 16MB limit. Very
+            large lists are ordered in time quadratic in the number of IDs,
+            and an error is raised if they cannot be ordered within the limit
     """
 
     def __init__(self, sample_ids, ordered=False):
@@ -4967,17 +5073,7 @@ class Select(ViewStage):
         pipeline = [{"$match": {"_id": {"$in": ids}}}]
 
         if self._ordered:
-            pipeline.extend(
-                [
-                    {
-                        "$set": {
-                            "_select_order": {"$indexOfArray": [ids, "$_id"]}
-                        }
-                    },
-                    {"$sort": {"_select_order": 1}},
-                    {"$unset": "_select_order"},
-                ]
-            )
+            pipeline.extend(_make_select_order_pipeline(ids, "_id"))
 
         return pipeline
 
@@ -5093,19 +5189,7 @@ class SelectBy(ViewStage):
         pipeline = [{"$match": {path: {"$in": values}}}]
 
         if self._ordered:
-            pipeline.extend(
-                [
-                    {
-                        "$set": {
-                            "_select_order": {
-                                "$indexOfArray": [values, "$" + path]
-                            }
-                        }
-                    },
-                    {"$sort": {"_select_order": 1}},
-                    {"$unset": "_select_order"},
-                ]
-            )
+            pipeline.extend(_make_select_order_pipeline(values, path))
 
         return pipeline
 
@@ -5509,19 +5593,7 @@ class SelectGroups(ViewStage):
         pipeline = [{"$match": {id_path: {"$in": ids}}}]
 
         if self._ordered:
-            pipeline.extend(
-                [
-                    {
-                        "$set": {
-                            "_select_order": {
-                                "$indexOfArray": [ids, "$" + id_path]
-                            }
-                        }
-                    },
-                    {"$sort": {"_select_order": 1}},
-                    {"$unset": "_select_order"},
-                ]
-            )
+            pipeline.extend(_make_select_order_pipeline(ids, id_path))
 
         return pipeline
 
@@ -7444,6 +7516,156 @@ def _get_rng(seed):
     return _random
 
 
+def _make_select_order_pipeline(values, path):
+    # The values are already embedded once in the `$match` stage that precedes
+    # this pipeline. Binary search is O(M log M) rather than O(M^2), but it
+    # also embeds a sorted copy of the values and their positions, so it is
+    # only used if the encoded pipeline stays within the 16MB BSON limit
+    num_bytes = _get_bson_size(values)
+    if 2 * num_bytes > _MAX_SELECT_ORDER_BYTES:
+        raise ValueError(
+            "Cannot sort by %d values (%d bytes) within MongoDB's 16MB "
+            "pipeline size limit. Select fewer values or pass "
+            "`ordered=False`" % (len(values), num_bytes)
+        )
+
+    order_expr = None
+    if _is_sortable(values):
+        order_expr = _make_sorted_index_expr(
+            values, "$" + path, max_bytes=_MAX_SELECT_ORDER_BYTES - num_bytes
+        )
+
+    if order_expr is None:
+        order_expr = {"$indexOfArray": [values, "$" + path]}
+
+    return [
+        {"$set": {"_select_order": order_expr}},
+        {"$sort": {"_select_order": 1}},
+        {"$unset": "_select_order"},
+    ]
+
+
+def _get_bson_size(values):
+    return len(bson.encode({"values": values}))
+
+
+def _is_sortable(values):
+    # Only value types whose Python ordering matches their BSON ordering
+    if all(isinstance(v, ObjectId) for v in values):
+        return True
+
+    if all(etau.is_str(v) for v in values):
+        return True
+
+    return all(
+        isinstance(v, numbers.Number) and not isinstance(v, bool)
+        for v in values
+    )
+
+
+def _make_sorted_index_expr(values, expr, max_bytes=None):
+    # Equivalent to `{"$indexOfArray": [values, expr]}`, but it binary
+    # searches a sorted copy of `values` rather than scanning `values`, so
+    # ordering M documents costs O(M log M) rather than O(M^2). Returns None if
+    # the sorted values and their positions exceed `max_bytes` when encoded
+    first_inds = {}
+    for idx, value in enumerate(values):
+        first_inds.setdefault(value, idx)
+
+    sorted_values = sorted(first_inds.keys())
+    order = [first_inds[value] for value in sorted_values]
+
+    if max_bytes is not None:
+        num_bytes = _get_bson_size(sorted_values) + _get_bson_size(order)
+        if num_bytes > max_bytes:
+            return None
+
+    num_values = len(sorted_values)
+    num_steps = num_values.bit_length()
+
+    # Finds the first index whose value is >= `expr`
+    search = {
+        "$reduce": {
+            "input": {"$range": [0, num_steps]},
+            "initialValue": [0, num_values],
+            "in": {
+                "$let": {
+                    "vars": {
+                        "lo": {"$arrayElemAt": ["$$value", 0]},
+                        "hi": {"$arrayElemAt": ["$$value", 1]},
+                    },
+                    "in": {
+                        "$let": {
+                            "vars": {
+                                "mid": {
+                                    "$toInt": {
+                                        "$floor": {
+                                            "$divide": [
+                                                {"$add": ["$$lo", "$$hi"]},
+                                                2,
+                                            ]
+                                        }
+                                    }
+                                }
+                            },
+                            "in": {
+                                "$cond": [
+                                    {"$gte": ["$$lo", "$$hi"]},
+                                    "$$value",
+                                    {
+                                        "$cond": [
+                                            {
+                                                "$lt": [
+                                                    {
+                                                        "$arrayElemAt": [
+                                                            "$$values",
+                                                            "$$mid",
+                                                        ]
+                                                    },
+                                                    "$$x",
+                                                ]
+                                            },
+                                            [{"$add": ["$$mid", 1]}, "$$hi"],
+                                            ["$$lo", "$$mid"],
+                                        ]
+                                    },
+                                ]
+                            },
+                        }
+                    },
+                }
+            },
+        }
+    }
+
+    return {
+        "$let": {
+            "vars": {
+                "values": {"$literal": sorted_values},
+                "order": {"$literal": order},
+                "x": expr,
+            },
+            "in": {
+                "$let": {
+                    "vars": {"idx": {"$arrayElemAt": [search, 0]}},
+                    "in": {
+                        "$cond": [
+                            {
+                                "$eq": [
+                                    {"$arrayElemAt": ["$$values", "$$idx"]},
+                                    "$$x",
+                                ]
+                            },
+                            {"$arrayElemAt": ["$$order", "$$idx"]},
+                            -1,
+                        ]
+                    },
+                }
+            },
+        }
+    }
+
+
 def _parse_labels_field(sample_collection, field_path):
     label_type = sample_collection._get_label_field_type(field_path)
     is_frame_field = sample_collection._is_frame_field(field_path)
@@ -7735,3 +7957,34 @@ _STAGES_THAT_SELECT_OR_REORDER = {
     Skip,
     Take,
 }
+
+
+# Registry of stages that process each document independently, and therefore
+# never change the relative order of the documents that they output, unless
+# they have an ``ordered`` property that is True
+_STAGES_THAT_PRESERVE_ORDER = {
+    Exclude,
+    ExcludeBy,
+    ExcludeFields,
+    ExcludeFrames,
+    ExcludeGroups,
+    ExcludeLabels,
+    Exists,
+    FilterField,
+    FilterLabels,
+    FilterKeypoints,
+    GeoWithin,
+    LimitLabels,
+    MapLabels,
+    Match,
+    MatchFrames,
+    MatchLabels,
+    MatchTags,
+    Select,
+    SelectBy,
+    SelectFields,
+    SelectFrames,
+    SelectGroups,
+    SelectLabels,
+    SetField,
+}
@@ -7,7 +7,7 @@ Core utilities.
 """
 import atexit
 from base64 import b64encode, b64decode
-from collections import defaultdict
+from collections import defaultdict, deque
 from contextlib import contextmanager
 from copy import deepcopy
 from datetime import date, datetime
@@ -1280,6 +1280,9 @@ def compute_filehash(filepath, method=None, chunk_size=None):
 def serialize_numpy_array(array, ascii=False):
     """Serializes a numpy array.
 
+    The array is serialized as zlib-compressed bytes generated by
+    ``numpy.save``. See :func:`serialize_array` for a faster binary format.
+
     Args:
         array: a numpy array-like
         ascii (False): whether to return a base64-encoded ASCII string instead
@@ -1298,14 +1301,73 @@ def serialize_numpy_array(array, ascii=False):
     return bytes_str
 
 
-def deserialize_numpy_array(numpy_bytes, ascii=False):
+def serialize_array(array, compression=None):
+    """Serializes a numpy array in FiftyOne's binary array format.
+
+    The format consists of a small header that records the array's dtype and
+    shape followed by its raw (optionally compressed) buffer, so, unlike
+    :func:`serialize_numpy_array`, uncompressed arrays can be decoded without
+    copying their data.
+
+    Arrays whose dtypes cannot be represented in this format, such as
+    structured arrays, are serialized via :func:`serialize_numpy_array`.
+
+    Use :func:`deserialize_numpy_array` to load the array.
+
+    Args:
+        array: a numpy array-like
+        compression (None): an optional compression to apply to the array's
+            buffer. Supported values are ``("zlib", "lz4")``. The ``lz4``
+            package is required to use ``"lz4"``
+
+    Returns:
+        the serialized bytes
+    """
+    array = np.asarray(array)
+    if array.dtype.hasobject or array.dtype.fields is not None:
+        return serialize_numpy_array(array)
+
+    try:
+        compression_type = _ARRAY_COMPRESSION_TYPES[compression]
+    except KeyError:
+        raise ValueError(
+            "Unsupported compression '%s'; supported values are %s"
+            % (compression, tuple(_ARRAY_COMPRESSION_TYPES.keys()))
+        )
+
+    dtype_str = array.dtype.str.encode("ascii")
+    header = struct.pack(
+        "<4sBBBB%ds%dQ" % (len(dtype_str), array.ndim),
+        _ARRAY_MAGIC,
+        _ARRAY_FORMAT_VERSION,
+        compression_type,
+        array.ndim,
+        len(dtype_str),
+        dtype_str,
+        *array.shape,
+    )
+
+    data = array.tobytes(order="C")
+    if compression == "zlib":
+        data = zlib.compress(data)
+    elif compression == "lz4":
+        data = _import_lz4().compress(data)
+
+    return header + data
+
+
+def deserialize_numpy_array(numpy_bytes, ascii=False, writable=True):
     """Loads a serialized numpy array generated by
-    :func:`serialize_numpy_array`.
+    :func:`serialize_numpy_array` or :func:`serialize_array`.
 
     Args:
         numpy_bytes: the serialized numpy array bytes
         ascii (False): whether the bytes were generated with the
             ``ascii == True`` parameter of :func:`serialize_numpy_array`
+        writable (True): whether the returned array must be writable. If
+            False, arrays serialized by :func:`serialize_array` are returned
+            as read-only views into ``numpy_bytes`` when possible, which avoids
+            copying their data
 
     Returns:
         the numpy array
@@ -1313,10 +1375,55 @@ def deserialize_numpy_array(numpy_bytes, ascii=False):
     if ascii:
         numpy_bytes = b64decode(numpy_bytes.encode("ascii"))
 
+    if numpy_bytes[:4] == _ARRAY_MAGIC:
+        array = _deserialize_array(numpy_bytes)
+        if writable and not array.flags.writeable:
+            array = array.copy()
+
+        return array
+
     with io.BytesIO(zlib.decompress(numpy_bytes)) as f:
         return np.load(f)
 
 
+def _deserialize_array(data):
+    version, compression_type, ndim, dtype_len = struct.unpack_from(
+        "<BBBB", data, 4
+    )
+    if version != _ARRAY_FORMAT_VERSION:
+        raise ValueError("Unsupported array format version %d" % version)
+
+    offset = 8
+    dtype = np.dtype(bytes(data[offset : offset + dtype_len]).decode("ascii"))
+    offset += dtype_len
+
+    shape = struct.unpack_from("<%dQ" % ndim, data, offset)
+    offset += 8 * ndim
+
+    if compression_type == _ARRAY_COMPRESSION_TYPES["zlib"]:
+        data = zlib.decompress(memoryview(data)[offset:])
+        offset = 0
+    elif compression_type == _ARRAY_COMPRESSION_TYPES["lz4"]:
+        data = _import_lz4().decompress(memoryview(data)[offset:])
+        offset = 0
+
+    count = int(np.prod(shape))
+    array = np.frombuffer(data, dtype=dtype, count=count, offset=offset)
+    return array.reshape(shape)
+
+
+def _import_lz4():
+    ensure_import("lz4")
+    import lz4.frame
+
+    return lz4.frame
+
+
+_ARRAY_MAGIC = b"\x93FOA"
+_ARRAY_FORMAT_VERSION = 1
+_ARRAY_COMPRESSION_TYPES = {None: 0, "zlib": 1, "lz4": 2}
+
+
 def iter_batches(iterable, batch_size):
     """Iterates over the given iterable in batches.
 
@@ -1549,6 +1656,134 @@ def get_multiprocessing_context():
     return multiprocessing.get_context()
 
 
+def map_batches(
+    map_fcn,
+    iterable,
+    num_workers,
+    batch_size=None,
+    max_batch_size=None,
+    total=None,
+    progress=False,
+    initializer=None,
+    initargs=(),
+):
+    """Applies a function to batches of the given iterable in a pool of
+    worker processes.
+
+    Results are emitted in the same order as the input batches. At most
+    ``2 * num_workers`` batches are in flight at any time, and new batches are
+    read from ``iterable`` while earlier ones are being processed, so memory
+    usage is bounded by the batch size rather than by the size of
+    ``iterable``.
+
+    Example usage::
+
+        import fiftyone.core.utils as fou
+
+        for batch, result in fou.map_batches(sum, range(100), 4, total=100):
+            print(len(batch), result)
+
+    Args:
+        map_fcn: a picklable function that accepts a tuple of elements of
+            ``iterable`` and returns a result
+        iterable: an iterable
+        num_workers: the number of processes to use
+        batch_size (None): the number of elements per batch. By default,
+            ``total / num_workers`` is used, if ``total`` is provided, capped
+            at ``max_batch_size``
+        max_batch_size (None): a maximum default batch size
+        total (None): the number of elements in ``iterable``, if known
+        progress (False): whether to render a progress bar tracking the
+            number of processed elements
+        initializer (None): an optional function to run in each worker process
+            when it starts
+        initargs (()): arguments to pass to ``initializer``
+
+    Returns:
+        a generator that emits ``(batch, result)`` tuples
+    """
+    if batch_size is None:
+        if total is not None:
+            batch_size = max(1, total // num_workers)
+            if max_batch_size is not None:
+                batch_size = min(batch_size, max_batch_size)
+        else:
+            batch_size = max_batch_size or 1
+
+    batches = iter_batches(iterable, batch_size)
+
+    ctx = get_multiprocessing_context()
+    with ProgressBar(total=total, quiet=not progress) as pb:
+        with ctx.Pool(
+            processes=num_workers, initializer=initializer, initargs=initargs
+        ) as pool:
+            pending = deque()
+            for batch in itertools.islice(batches, 2 * num_workers):
+                pending.append((batch, pool.apply_async(map_fcn, (batch,))))
+
+            while pending:
+                batch, result = pending.popleft()
+                result = result.get()
+
+                next_batch = next(batches, None)
+                if next_batch is not None:
+                    pending.append(
+                        (next_batch, pool.apply_async(map_fcn, (next_batch,)))
+                    )
+
+                pb.update(count=len(batch))
+                yield batch, result
+
+
+def load_raw_labels(sample_collection, paths):
+    """Loads the raw label dicts in the given fields of the collection.
+
+    Only the requested fields are loaded, and no label objects are
+    constructed, so the output can be cheaply sent to worker processes and
+    parsed via :func:`parse_raw_labels`.
+
+    Args:
+        sample_collection: a
+            :class:`fiftyone.core.collections.SampleCollection`
+        paths: a list of label fields, which must be all sample-level or all
+            frame-level
+
+    Returns:
+        a list with one element per sample. Each element is a list of tuples
+        of raw label dicts, one per frame for frame-level fields and a single
+        tuple otherwise
+    """
+    is_frame_field = sample_collection._is_frame_field(paths[0])
+    values = sample_collection.values(paths, _raw=True)
+
+    if is_frame_field:
+        return [
+            list(zip(*[v or [] for v in sample_values]))
+            for sample_values in zip(*values)
+        ]
+
+    return [[sample_values] for sample_values in zip(*values)]
+
+
+def parse_raw_labels(keys, raw_labels):
+    """Parses a tuple of raw label dicts returned by :func:`load_raw_labels`.
+
+    Args:
+        keys: the keys to assign to each label
+        raw_labels: a tuple of raw label dicts, which may be None
+
+    Returns:
+        a dict mapping ``keys`` to :class:`fiftyone.core.labels.Label`
+        instances or None
+    """
+    import fiftyone.core.labels as fol
+
+    return {
+        key: fol.Label.from_dict(d) if d is not None else None
+        for key, d in zip(keys, raw_labels)
+    }
+
+
 def datetime_to_timestamp(dt):
     """Converts a `datetime.date` or `datetime.datetime` to milliseconds since
     epoch.
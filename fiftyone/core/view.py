@@ -9,7 +9,9 @@ from collections import defaultdict, OrderedDict
 import contextlib
 from copy import copy, deepcopy
 import itertools
+import logging
 import numbers
+import timeit
 
 from bson import ObjectId
 from pymongo.errors import CursorNotFound
@@ -28,6 +30,9 @@ import fiftyone.core.utils as fou
 fost = fou.lazy_import("fiftyone.core.stages")
 
 
+logger = logging.getLogger(__name__)
+
+
 class DatasetView(foc.SampleCollection):
     """A view into a :class:`fiftyone.core.dataset.Dataset`.
 
@@ -57,6 +62,9 @@ class DatasetView(foc.SampleCollection):
             view
     """
 
+    # The cached result of `_compile_stages()`
+    __compiled = None
+
     def __init__(
         self,
         dataset,
@@ -398,7 +406,13 @@ class DatasetView(foc.SampleCollection):
         """
         return copy(self)
 
-    def iter_samples(self, progress=False, autosave=False, batch_size=None):
+    def iter_samples(
+        self,
+        progress=False,
+        autosave=False,
+        batch_size=None,
+        lightweight=False,
+    ):
         """Returns an iterator over the samples in the view.
 
         Examples::
@@ -432,6 +446,13 @@ class DatasetView(foc.SampleCollection):
             ):
                 sample.ground_truth.label = make_label()
 
+            # Fast read-only iteration
+            labels = []
+            for sample in view.iter_samples(
+                lightweight=True, batch_size=1000
+            ):
+                labels.append(sample.ground_truth.label)
+
         Args:
             progress (False): whether to render a progress bar tracking the
                 iterator's progress
@@ -439,13 +460,30 @@ class DatasetView(foc.SampleCollection):
                 emitted by this iterator
             batch_size (None): a batch size to use when autosaving samples. Can
                 either be an integer specifying the number of samples to save
-                in a batch, or a float number of seconds between batched saves
+                in a batch, or a float number of seconds between batched saves.
+                When ``lightweight`` is True, this is instead the number of
+                samples to fetch from the database per cursor batch
+            lightweight (False): whether to emit read-only
+                :class:`fiftyone.core.sample.LightweightSample` instances
+                whose fields are lazily decoded from the raw database
+                documents. This is much faster when you only need to read a
+                few fields of each sample
 
         Returns:
-            an iterator over :class:`fiftyone.core.sample.SampleView` instances
+            an iterator over :class:`fiftyone.core.sample.SampleView` or
+            :class:`fiftyone.core.sample.LightweightSample` instances
         """
+        if lightweight and autosave:
+            raise ValueError(
+                "Lightweight samples are read-only, so `autosave=True` is not "
+                "supported"
+            )
+
         with contextlib.ExitStack() as exit_context:
-            samples = self._iter_samples()
+            if lightweight:
+                samples = self._iter_lightweight_samples(batch_size=batch_size)
+            else:
+                samples = self._iter_samples()
 
             if progress:
                 pb = fou.ProgressBar(total=len(self))
@@ -1167,6 +1205,34 @@ class DatasetView(foc.SampleCollection):
 
         return False
 
+    def _can_limit_frames(self):
+        """Whether the stages of this view can be applied when only a limited
+        number of frames are attached to each video via
+        ``_pipeline(frames_limit=...)``.
+
+        Returns:
+            True/False
+        """
+        (
+            _,
+            _,
+            _attach_frames_idx0,
+            _,
+            _,
+            _,
+            _,
+            _limited_frames_pipelines,
+        ) = self._compile_stages()
+
+        # Frames are attached again after selecting group slices
+        if _attach_frames_idx0 is not None:
+            return False
+
+        return all(
+            _pipeline is not None
+            for _pipeline in _limited_frames_pipelines.values()
+        )
+
     def _pipeline(
         self,
         pipeline=None,
@@ -1175,6 +1241,7 @@ class DatasetView(foc.SampleCollection):
         detach_frames=False,
         frames_only=False,
         support=None,
+        frames_limit=None,
         group_slice=None,
         group_slices=None,
         detach_groups=False,
@@ -1182,53 +1249,26 @@ class DatasetView(foc.SampleCollection):
         manual_group_select=False,
         post_pipeline=None,
     ):
-        _pipelines = []
-        _view = self._base_view
-
-        _contains_videos = self._dataset._contains_videos(any_slice=True)
-        _found_select_group_slice = False
-        _attach_frames_idx = None
-        _attach_frames_idx0 = None
-
-        _contains_groups = self._dataset.media_type == fom.GROUP
-        _group_slices = set()
-        _attach_groups_idx = None
-
-        for idx, stage in enumerate(self._stages):
-            if isinstance(stage, fost.SelectGroupSlices):
-                # We might need to reattach frames after `SelectGroupSlices`,
-                # since it involves a `$lookup` that resets the samples
-                _found_select_group_slice = True
-                _attach_frames_idx0 = _attach_frames_idx
-                _attach_frames_idx = None
-
-            # Determine if stage needs frames attached
-            if (
-                _contains_videos
-                and _attach_frames_idx is None
-                and stage._needs_frames(_view)
-            ):
-                _attach_frames_idx = idx
-
-            if _contains_groups:
-                # Special case: report a manual override if the first stage
-                # transforms a grouped collection into a non-grouped collection
-                if idx == 0:
-                    _media_type = stage.get_media_type(_view)
-                    if _media_type not in (None, fom.GROUP):
-                        manual_group_select = True
-
-                # Determine if stage needs group slices attached
-                _stage_group_slices = stage._needs_group_slices(_view)
-                if _stage_group_slices:
-                    if _attach_groups_idx is None:
-                        _attach_groups_idx = idx
-
-                    _group_slices.update(_stage_group_slices)
-
-            # Generate stage's pipeline
-            _pipelines.append(stage.to_mongo(_view))
-            _view = _view._add_view_stage(stage, validate=False)
+        (
+            _pipelines,
+            _attach_frames_idx,
+            _attach_frames_idx0,
+            _found_select_group_slice,
+            _group_slices,
+            _attach_groups_idx,
+            _manual_group_select,
+            _limited_frames_pipelines,
+        ) = self._compile_stages()
+
+        # The cached pipelines are copied so that callers can't modify them
+        _pipelines = deepcopy(_pipelines)
+
+        if frames_limit is not None:
+            for idx, _pipeline in _limited_frames_pipelines.items():
+                if _pipeline is not None:
+                    _pipelines[idx] = deepcopy(_pipeline)
+        if _manual_group_select:
+            manual_group_select = True
 
         if _attach_frames_idx is None and (attach_frames or frames_only):
             _attach_frames_idx = len(_pipelines)
@@ -1241,12 +1281,16 @@ class DatasetView(foc.SampleCollection):
             # Two lookups are required; manually do the **last** one and rely
             # on dataset._pipeline() to do the first one
             attach_frames = True
-            _pipeline = self._dataset._attach_frames_pipeline(support=support)
+            _pipeline = self._dataset._attach_frames_pipeline(
+                support=support, limit=frames_limit
+            )
             _pipelines.insert(_attach_frames_idx, _pipeline)
         elif _found_select_group_slice and _attach_frames_idx is not None:
             # Must manually attach frames after the group selection
             attach_frames = None  # special syntax: frames already attached
-            _pipeline = self._dataset._attach_frames_pipeline(support=support)
+            _pipeline = self._dataset._attach_frames_pipeline(
+                support=support, limit=frames_limit
+            )
             _pipelines.insert(_attach_frames_idx, _pipeline)
         elif _attach_frames_idx0 is not None or _attach_frames_idx is not None:
             # Exactly one lookup is required; rely on dataset._pipeline() to
@@ -1304,6 +1348,7 @@ class DatasetView(foc.SampleCollection):
             detach_frames=detach_frames,
             frames_only=frames_only,
             support=support,
+            frames_limit=frames_limit,
             media_type=media_type,
             group_slice=group_slice,
             group_slices=group_slices,
@@ -1313,6 +1358,100 @@ class DatasetView(foc.SampleCollection):
             post_pipeline=post_pipeline,
         )
 
+    def _compile_stages(self):
+        # Compiling the stages is expensive because every stage is applied to
+        # a copy of the view, so the result is cached until the view's stages
+        # or its dataset changes
+        key = self._get_compile_key()
+        if self.__compiled is not None and self.__compiled[0] == key:
+            return self.__compiled[2]
+
+        start = timeit.default_timer()
+
+        _pipelines = []
+        _view = self._base_view
+
+        _contains_videos = self._dataset._contains_videos(any_slice=True)
+        _found_select_group_slice = False
+        _attach_frames_idx = None
+        _attach_frames_idx0 = None
+
+        _contains_groups = self._dataset.media_type == fom.GROUP
+        _group_slices = set()
+        _attach_groups_idx = None
+        _manual_group_select = False
+        _limited_frames_pipelines = {}
+
+        for idx, stage in enumerate(self._stages):
+            if isinstance(stage, fost.SelectGroupSlices):
+                # We might need to reattach frames after `SelectGroupSlices`,
+                # since it involves a `$lookup` that resets the samples
+                _found_select_group_slice = True
+                _attach_frames_idx0 = _attach_frames_idx
+                _attach_frames_idx = None
+
+            # Determine if stage needs frames attached
+            if _contains_videos and stage._needs_frames(_view):
+                if _attach_frames_idx is None:
+                    _attach_frames_idx = idx
+
+                _limited_frames_pipelines[
+                    idx
+                ] = stage._get_limited_frames_pipeline(_view)
+
+            if _contains_groups:
+                # Special case: report a manual override if the first stage
+                # transforms a grouped collection into a non-grouped collection
+                if idx == 0:
+                    _media_type = stage.get_media_type(_view)
+                    if _media_type not in (None, fom.GROUP):
+                        _manual_group_select = True
+
+                # Determine if stage needs group slices attached
+                _stage_group_slices = stage._needs_group_slices(_view)
+                if _stage_group_slices:
+                    if _attach_groups_idx is None:
+                        _attach_groups_idx = idx
+
+                    _group_slices.update(_stage_group_slices)
+
+            # Generate stage's pipeline
+            _pipelines.append(stage.to_mongo(_view))
+            _view = _view._add_view_stage(stage, validate=False)
+
+        compiled = (
+            _pipelines,
+            _attach_frames_idx,
+            _attach_frames_idx0,
+            _found_select_group_slice,
+            frozenset(_group_slices),
+            _attach_groups_idx,
+            _manual_group_select,
+            _limited_frames_pipelines,
+        )
+
+        # A reference to the stages is stored so that their IDs in `key`
+        # cannot be reused by other objects
+        self.__compiled = (key, tuple(self._stages), compiled)
+
+        logger.debug(
+            "Compiled %d view stage(s) in %.3fs",
+            len(self._stages),
+            timeit.default_timer() - start,
+        )
+
+        return compiled
+
+    def _get_compile_key(self):
+        return (
+            tuple(id(stage) for stage in self._stages),
+            self.media_type,
+            self.group_slice,
+            self._dataset.group_slice,
+            self._dataset._schema_version,
+            self._root_dataset._schema_version,
+        )
+
     def _aggregate(
         self,
         pipeline=None,
@@ -6,19 +6,28 @@ FiftyOne Server aggregations
 |
 """
 from datetime import date, datetime
+import logging
+import threading
 import typing as t
 
+from bson import json_util
+import cachetools
 import strawberry as gql
 
 import fiftyone.core.aggregations as foa
 import fiftyone.core.collections as foc
+import fiftyone.core.dataset as fod
 import fiftyone.core.fields as fof
 import fiftyone.core.labels as fol
 import fiftyone.core.media as fom
 from fiftyone.core.utils import datetime_to_timestamp
 import fiftyone.core.view as fov
 
-from fiftyone.server.constants import LIST_LIMIT
+from fiftyone.server.constants import (
+    AGGREGATION_CACHE_SIZE,
+    AGGREGATION_CACHE_TTL,
+    LIST_LIMIT,
+)
 from fiftyone.server.filters import GroupElementFilter, SampleFilter
 from fiftyone.server.inputs import SelectedLabel
 from fiftyone.server.scalars import BSON, BSONArray
@@ -26,6 +35,15 @@ from fiftyone.server.utils import from_dict, meets_type
 import fiftyone.server.view as fosv
 
 
+logger = logging.getLogger(__name__)
+
+_cache = cachetools.TTLCache(
+    maxsize=AGGREGATION_CACHE_SIZE, ttl=AGGREGATION_CACHE_TTL
+)
+_cache_lock = threading.Lock()
+_cache_stats = {"hits": 0, "misses": 0}
+
+
 @gql.input
 class AggregationForm:
     dataset: str
@@ -144,6 +162,18 @@ async def aggregate_resolver(
     if form.mixed and view.media_type == fom.GROUP:
         view = view.select_group_slices(_allow_mixed=True)
 
+    key = _make_cache_key(form, view._dataset)
+    with _cache_lock:
+        results = _cache.get(key, None)
+        if results is not None:
+            _cache_stats["hits"] += 1
+        else:
+            _cache_stats["misses"] += 1
+
+    if results is not None:
+        logger.debug("Aggregation cache hit for dataset '%s'", form.dataset)
+        return list(results)
+
     aggregations, deserializers = zip(
         *[_resolve_path_aggregation(path, view) for path in form.paths]
     )
@@ -169,7 +199,66 @@ async def aggregate_resolver(
                 result.slice = await slice_view._async_aggregate(foa.Count())
                 break
 
-    return results
+    with _cache_lock:
+        _cache[key] = results
+
+    return list(results)
+
+
+def clear_cache(dataset_name: t.Optional[str] = None) -> None:
+    """Clears the App aggregation cache.
+
+    Args:
+        dataset_name (None): the name of a dataset whose cached aggregations
+            to clear. By default, the entire cache is cleared
+    """
+    with _cache_lock:
+        if dataset_name is None:
+            _cache.clear()
+            return
+
+        for key in list(_cache.keys()):
+            if key[0] == dataset_name:
+                _cache.pop(key, None)
+
+
+def get_cache_stats() -> t.Dict[str, int]:
+    """Returns statistics about the App aggregation cache.
+
+    Returns:
+        a dict with the ``hits``, ``misses``, and current ``size`` of the cache
+    """
+    with _cache_lock:
+        return dict(size=len(_cache), **_cache_stats)
+
+
+def _make_cache_key(form: AggregationForm, dataset: fod.Dataset) -> t.Tuple:
+    # Samples can be written to by other processes that don't notify the
+    # server, so the estimated number of samples, which is read from
+    # collection metadata, is included to catch added or deleted samples.
+    # Other writes are caught by the cache's TTL or by `clear_cache()`
+    num_samples = dataset._sample_collection.estimated_document_count()
+
+    params = json_util.dumps(
+        [
+            form.extended_stages,
+            form.filters,
+            form.group_id,
+            [
+                [l.sample_id, l.field, l.label_id, l.frame_number]
+                for l in form.hidden_labels
+            ],
+            form.mixed,
+            form.paths,
+            form.sample_ids,
+            form.slice,
+            form.view,
+            form.view_name,
+        ],
+        sort_keys=True,
+    )
+
+    return form.dataset, str(dataset._doc.id), num_samples, params
 
 
 RESULT_MAPPING = {
@@ -7,3 +7,7 @@ FiftyOne Server constants
 """
 
 LIST_LIMIT = 200
+AGGREGATION_CACHE_SIZE = 1024
+AGGREGATION_CACHE_TTL = 300  # ttl in seconds
+METADATA_CACHE_SIZE = 100000
+METADATA_WRITEBACK_BATCH_SIZE = 100
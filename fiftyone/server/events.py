@@ -31,6 +31,7 @@ from fiftyone.core.session.events import (
 import fiftyone.core.state as fos
 import fiftyone.core.utils as fou
 
+import fiftyone.server.aggregations as fosa
 from fiftyone.server.query import serialize_dataset
 
 
@@ -66,6 +67,10 @@ async def dispatch_event(
         global _state
         _state = event.state
 
+        # A refresh means the dataset may have been modified
+        if event.refresh:
+            fosa.clear_cache()
+
     if isinstance(event, ReactivateNotebookCell):
         await dispatch_event(subscription, DeactivateNotebookCell())
 
@@ -5,29 +5,50 @@ FiftyOne Server JIT metadata utilities
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from collections import defaultdict
 from enum import Enum
 import logging
 import shutil
 import struct
+import threading
 import typing as t
 
 from functools import reduce
 
 import asyncio
 import aiofiles
+import aiofiles.os
+import cachetools
+from pymongo import UpdateOne
 import strawberry as gql
 
 import eta.core.serial as etas
 import eta.core.utils as etau
 import eta.core.video as etav
+import fiftyone as fo
 import fiftyone.core.labels as fol
+import fiftyone.core.metadata as fomt
 from fiftyone.core.collections import SampleCollection
+import fiftyone.core.odm as foo
+from fiftyone.server.constants import (
+    METADATA_CACHE_SIZE,
+    METADATA_WRITEBACK_BATCH_SIZE,
+)
 from fiftyone.utils.utils3d import OrthographicProjectionMetadata
 
 import fiftyone.core.media as fom
 
 logger = logging.getLogger(__name__)
 
+# Media metadata read from disk, keyed by `(filepath, mtime, size)`
+_cache = cachetools.LRUCache(maxsize=METADATA_CACHE_SIZE)
+_cache_lock = threading.Lock()
+_cache_stats = {"hits": 0, "misses": 0}
+
+# Pending metadata writes, keyed by sample collection name
+_writeback_ops = defaultdict(list)
+_writeback_tasks = set()
+
 _ADDITIONAL_MEDIA_FIELDS = {
     fol.Heatmap: "map_path",
     fol.Segmentation: "mask_path",
@@ -102,9 +123,21 @@ async def get_metadata(
     if filepath not in metadata_cache:
         try:
             # Retrieve media metadata from disk
-            metadata_cache[filepath] = await read_metadata(
+            media_metadata = await _get_media_metadata(
                 filepath_source, is_video
             )
+            metadata_cache[filepath] = _to_app_metadata(
+                media_metadata, is_video
+            )
+
+            if (
+                metadata is None
+                and filepath_source == sample["filepath"]
+                and fo.config.app_metadata_writeback
+            ):
+                await _save_metadata(
+                    collection, sample, media_metadata, is_video
+                )
         except Exception as exc:
             # Immediately fail so the user knows they should install FFmpeg
             if isinstance(exc, FFmpegNotFoundException):
@@ -130,17 +163,45 @@ async def read_metadata(filepath, is_video):
     Returns:
         dict
     """
-    if is_video:
-        info = await get_stream_info(filepath)
+    media_metadata = await _read_media_metadata(filepath, is_video)
+    return _to_app_metadata(media_metadata, is_video)
+
+
+def flush_metadata_writeback():
+    """Schedules any pending writes of media metadata computed by the App
+    server to the database.
+
+    The writes are performed asynchronously in the current event loop. Only
+    applicable when ``fo.config.app_metadata_writeback`` is True.
+    """
+    for collection_name in list(_writeback_ops.keys()):
+        _flush_writeback(collection_name)
+
+
+def clear_cache():
+    """Clears the App server's media metadata cache."""
+    with _cache_lock:
+        _cache.clear()
+
+
+def get_cache_stats() -> t.Dict[str, t.Union[int, float]]:
+    """Returns statistics about the App server's media metadata cache.
+
+    Returns:
+        a dict with the ``hits``, ``misses``, ``hit_rate``, and current
+        ``size`` of the cache
+    """
+    with _cache_lock:
+        hits = _cache_stats["hits"]
+        misses = _cache_stats["misses"]
+        total = hits + misses
         return dict(
-            aspect_ratio=info.frame_size[0] / info.frame_size[1],
-            frame_rate=info.frame_rate,
+            hits=hits,
+            misses=misses,
+            hit_rate=hits / total if total > 0 else 0.0,
+            size=len(_cache),
         )
 
-    async with aiofiles.open(filepath, "rb") as f:
-        width, height = await get_image_dimensions(f)
-        return dict(aspect_ratio=width / height)
-
 
 class Reader(object):
     """Asynchronous file-like reader.
@@ -377,6 +438,140 @@ class FFmpegNotFoundException(RuntimeError):
     pass
 
 
+async def _get_media_metadata(filepath, is_video):
+    # Files are identified by their modification time and size so that
+    # cached metadata is never served for files that have since changed
+    try:
+        stat = await aiofiles.os.stat(filepath)
+        key = (filepath, stat.st_mtime, stat.st_size)
+    except Exception:
+        key = None
+
+    if key is not None:
+        with _cache_lock:
+            media_metadata = _cache.get(key, None)
+            if media_metadata is not None:
+                _cache_stats["hits"] += 1
+                return media_metadata
+
+            _cache_stats["misses"] += 1
+
+    media_metadata = await _read_media_metadata(filepath, is_video)
+
+    if key is not None:
+        with _cache_lock:
+            _cache[key] = media_metadata
+
+    return media_metadata
+
+
+async def _read_media_metadata(filepath, is_video):
+    if is_video:
+        info = await get_stream_info(filepath)
+        return dict(
+            size_bytes=info.size_bytes,
+            mime_type=info.mime_type,
+            frame_width=info.frame_size[0],
+            frame_height=info.frame_size[1],
+            frame_rate=info.frame_rate,
+            total_frame_count=info.total_frame_count,
+            duration=info.duration,
+            encoding_str=info.encoding_str,
+        )
+
+    async with aiofiles.open(filepath, "rb") as f:
+        width, height = await get_image_dimensions(f)
+        return dict(width=width, height=height)
+
+
+def _to_app_metadata(media_metadata, is_video):
+    if is_video:
+        width = media_metadata["frame_width"]
+        height = media_metadata["frame_height"]
+        return dict(
+            aspect_ratio=width / height,
+            frame_rate=media_metadata["frame_rate"],
+        )
+
+    width = media_metadata["width"]
+    height = media_metadata["height"]
+    return dict(aspect_ratio=width / height)
+
+
+async def _save_metadata(collection, sample, media_metadata, is_video):
+    # Generated collections contain copies of their source samples, so their
+    # metadata is not written
+    if collection._is_generated:
+        return
+
+    if is_video:
+        dims = (media_metadata["frame_width"], media_metadata["frame_height"])
+    else:
+        dims = (media_metadata["width"], media_metadata["height"])
+
+    # Don't save dimensions that could not be read from the file's header
+    if any(value <= 0 for value in dims):
+        return
+
+    # Saved metadata must be complete, since compute_metadata() skips samples
+    # whose metadata is already populated
+    if is_video:
+        metadata = fomt.VideoMetadata(**media_metadata)
+    else:
+        # Only image dimensions are read when serving the App, so the
+        # remaining image metadata is computed here
+        loop = asyncio.get_running_loop()
+        try:
+            metadata = await loop.run_in_executor(
+                None, fomt.ImageMetadata.build_for, sample["filepath"]
+            )
+        except Exception as e:
+            logger.debug(
+                "Failed to compute metadata for '%s': %s",
+                sample["filepath"],
+                e,
+            )
+            return
+
+    metadata = metadata.to_dict()
+
+    collection_name = collection._dataset._sample_collection_name
+    _writeback_ops[collection_name].append(
+        UpdateOne(
+            {"_id": sample["_id"], "metadata": None},
+            {"$set": {"metadata": metadata}},
+        )
+    )
+
+    if len(_writeback_ops[collection_name]) >= METADATA_WRITEBACK_BATCH_SIZE:
+        _flush_writeback(collection_name)
+
+
+def _flush_writeback(collection_name):
+    ops = _writeback_ops.pop(collection_name, None)
+    if not ops:
+        return
+
+    # A reference to the task is kept until it completes so that it is not
+    # garbage collected
+    task = asyncio.get_running_loop().create_task(
+        _write_metadata(collection_name, ops)
+    )
+    _writeback_tasks.add(task)
+    task.add_done_callback(_writeback_tasks.discard)
+
+
+async def _write_metadata(collection_name, ops):
+    try:
+        await foo.get_async_db_conn()[collection_name].bulk_write(
+            ops, ordered=False
+        )
+    except Exception as e:
+        logger.warning(
+            "Failed to save metadata for %d sample(s): %s", len(ops), e
+        )
+
+
 def _create_media_urls(
     collection: SampleCollection,
     sample: t.Dict,
@@ -14,6 +14,7 @@ import fiftyone.core.media as fom
 import fiftyone.core.odm as foo
 import fiftyone.core.view as fov
 
+import fiftyone.server.aggregations as fosa
 from fiftyone.server.decorators import route
 from fiftyone.server.filters import GroupElementFilter, SampleFilter
 import fiftyone.server.tags as fost
@@ -58,6 +59,8 @@ class Tag(HTTPEndpoint):
         else:
             fosu.change_sample_tags(view, changes)
 
+        fosa.clear_cache(dataset)
+
         if not modal:
             return {"samples": []}
 
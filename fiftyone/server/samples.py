@@ -6,14 +6,19 @@ FiftyOne Server samples pagination
 |
 """
 import asyncio
+from copy import copy
+
+from bson import ObjectId, json_util
 import strawberry as gql
 import typing as t
 
 
 from fiftyone.core.collections import SampleCollection
 from fiftyone.core.expressions import ViewField as F
+import fiftyone.core.fields as fof
 import fiftyone.core.media as fom
 import fiftyone.core.odm as foo
+import fiftyone.core.stages as fosg
 from fiftyone.server.filters import SampleFilter
 
 import fiftyone.server.metadata as fosm
@@ -62,6 +67,27 @@ MEDIA_TYPES = {
     fom.VIDEO: VideoSample,
 }
 
+# Raw MongoDB stages that process each document independently
+_ORDER_PRESERVING_MONGO_STAGES = {
+    "$addFields",
+    "$match",
+    "$set",
+    "$unset",
+}
+
+# Scalar field types whose values can be compared via range queries
+_KEYSET_SORT_FIELD_TYPES = (
+    fof.BooleanField,
+    fof.DateField,
+    fof.DateTimeField,
+    fof.FloatField,
+    fof.IntField,
+    fof.ObjectIdField,
+    fof.StringField,
+)
+
+_KEYSET_VALUE_FIELD = "_keyset_value"
+
 
 async def paginate_samples(
     dataset: str,
@@ -90,16 +116,30 @@ async def paginate_samples(
     if media == fom.GROUP:
         media = view.group_media_types[view.group_slice]
 
-    # TODO: Remove this once we have a better way to handle large videos. This
-    # is a temporary fix to reduce the $lookup overhead for sample frames on
-    # full datasets.
-    full_lookup = media == fom.VIDEO and (filters or stages)
-    support = [1, 1] if not full_lookup else None
-    if after is None:
-        after = "-1"
+    # Only the first frame of each video is needed for the grid, so frames
+    # are only fully attached if the view's stages require all of them. This
+    # includes counting the label tags of frame-level fields, which must be
+    # done across all frames
+    if media == fom.VIDEO and view._can_limit_frames():
+        frames_limit = 1
+    else:
+        frames_limit = None
+
+    offset, last_id, last_value = _parse_cursor(after)
+    keyset = _get_keyset_sort(view)
 
-    if int(after) > -1:
-        view = view.skip(int(after) + 1)
+    if keyset is None:
+        if offset > -1:
+            view = view.skip(offset + 1)
+    else:
+        sort_idx, sort_path, order = keyset
+
+        # Ties are broken by `_id` so that the order of samples is stable
+        if sort_idx is not None:
+            view = copy(view)
+            view._stages[sort_idx] = fosg.SortBy(
+                [(sort_path, order), ("_id", order)]
+            )
 
     pipeline = view._pipeline(
         attach_frames=True,
@@ -107,8 +147,40 @@ async def paginate_samples(
         manual_group_select=sample_filter
         and sample_filter.group
         and (sample_filter.group.id and not sample_filter.group.slice),
-        support=support,
+        frames_limit=frames_limit,
     )
+
+    if keyset is not None:
+        # Subsequent pages are found via a range query on the sort key that
+        # can use an index, rather than by skipping all earlier samples
+        if sort_idx is None:
+            idx = 0
+            pipeline.insert(idx, {"$sort": {"_id": 1}})
+        else:
+            idx = _find_sort(pipeline, sort_path, order)
+
+        if last_id is not None:
+            match = _make_keyset_match(sort_path, order, last_id, last_value)
+            pipeline.insert(idx, {"$match": match})
+            idx += 1
+
+        if sort_path != "_id":
+            pipeline.insert(
+                idx,
+                {
+                    "$set": {
+                        _KEYSET_VALUE_FIELD: {
+                            "$ifNull": ["$" + sort_path, None]
+                        }
+                    }
+                },
+            )
+
+        if last_id is None and offset > -1:
+            pipeline.append({"$skip": offset + 1})
+
+    pipeline.append({"$limit": first + 1})
+
     # Only return the first frame of each video sample for the grid thumbnail
     if media == fom.VIDEO:
         pipeline.append({"$set": {"frames": {"$slice": ["$frames", 1]}}})
@@ -123,6 +195,19 @@ async def paginate_samples(
         samples = samples[:first]
         more = True
 
+    cursors = []
+    for idx, sample in enumerate(samples, offset + 1):
+        if keyset is None:
+            cursors.append(_make_cursor(idx))
+        elif sort_path == "_id":
+            cursors.append(_make_cursor(idx, sample["_id"]))
+        elif _KEYSET_VALUE_FIELD in sample:
+            value = sample.pop(_KEYSET_VALUE_FIELD)
+            cursors.append(_make_cursor(idx, sample["_id"], value))
+        else:
+            # The sort key was excluded by a later stage
+            cursors.append(_make_cursor(idx))
+
     metadata_cache = {}
     url_cache = {}
     nodes = await asyncio.gather(
@@ -131,15 +216,11 @@ async def paginate_samples(
             for sample in samples
         ]
     )
+    fosm.flush_metadata_writeback()
 
-    edges = []
-    for idx, node in enumerate(nodes):
-        edges.append(
-            Edge(
-                node=node,
-                cursor=str(idx + int(after) + 1),
-            )
-        )
+    edges = [
+        Edge(node=node, cursor=cursor) for node, cursor in zip(nodes, cursors)
+    ]
 
     return Connection(
         page_info=PageInfo(
@@ -174,3 +255,126 @@ async def _create_sample_item(
     )
 
     return from_dict(cls, {"id": sample["_id"], "sample": sample, **metadata})
+
+
+def _parse_cursor(after: t.Optional[t.Union[str, int]]):
+    if after is None:
+        return -1, None, None
+
+    after = str(after)
+    if ":" not in after:
+        return int(after), None, None
+
+    chunks = after.split(":", 2)
+    offset = int(chunks[0])
+    last_id = ObjectId(chunks[1])
+    last_value = json_util.loads(chunks[2]) if len(chunks) > 2 else None
+
+    return offset, last_id, last_value
+
+
+def _make_cursor(
+    offset: int,
+    last_id: t.Optional[ObjectId] = None,
+    last_value: t.Optional[t.Any] = None,
+) -> str:
+    if last_id is None:
+        return str(offset)
+
+    if last_value is None:
+        return "%d:%s" % (offset, last_id)
+
+    return "%d:%s:%s" % (offset, last_id, json_util.dumps(last_value))
+
+
+def _get_keyset_sort(
+    view: SampleCollection,
+) -> t.Optional[t.Tuple[t.Optional[int], str, int]]:
+    # Keyset pagination injects range queries on the sort key of the view,
+    # which is only valid if every stage other than a single sort processes
+    # each sample independently and does not reorder them. Unsorted views
+    # are served in `_id` order
+    sort_idx = None
+    for idx, stage in enumerate(view._stages):
+        if isinstance(stage, fosg.SortBy):
+            if sort_idx is not None:
+                return None
+
+            sort_idx = idx
+        elif isinstance(stage, fosg.Mongo):
+            if not all(
+                set(s.keys()).issubset(_ORDER_PRESERVING_MONGO_STAGES)
+                for s in stage.pipeline
+            ):
+                return None
+        elif type(stage) not in fosg._STAGES_THAT_PRESERVE_ORDER:
+            return None
+        elif getattr(stage, "ordered", False):
+            return None
+
+    if sort_idx is None:
+        return None, "_id", 1
+
+    stage = view._stages[sort_idx]
+    sort_path = stage._get_mongo_field_or_expr()
+    if not _is_keyset_sort_field(view, sort_path):
+        return None
+
+    order = -1 if stage.reverse else 1
+
+    return sort_idx, sort_path, order
+
+
+def _is_keyset_sort_field(view: SampleCollection, path: t.Any) -> bool:
+    if not isinstance(path, str) or view._is_frame_field(path):
+        return False
+
+    if path == "_id":
+        return True
+
+    # Arrays are sorted by their min/max elements, which a range query on the
+    # field cannot reproduce
+    chunks = path.split(".")
+    for idx in range(1, len(chunks) + 1):
+        field = view.get_field(".".join(chunks[:idx]))
+        if field is None or isinstance(field, fof.ListField):
+            return False
+
+    return isinstance(field, _KEYSET_SORT_FIELD_TYPES)
+
+
+def _find_sort(pipeline: t.List[t.Dict], path: str, order: int) -> int:
+    sort = [(path, order)]
+    if path != "_id":
+        sort.append(("_id", order))
+
+    for idx, stage in enumerate(pipeline):
+        if list(stage.get("$sort", {}).items()) == sort:
+            return idx + 1
+
+    raise ValueError("Sort stage not found")
+
+
+def _make_keyset_match(
+    path: str, order: int, last_id: ObjectId, last_value: t.Any
+) -> t.Dict:
+    op = "$gt" if order == 1 else "$lt"
+
+    if path == "_id":
+        return {"_id": {op: last_id}}
+
+    # Null and missing values sort first in ascending order and last in
+    # descending order
+    tie = {path: last_value, "_id": {op: last_id}}
+
+    if last_value is None:
+        if order == 1:
+            return {"$or": [tie, {path: {"$ne": None}}]}
+
+        return tie
+
+    after = [{path: {op: last_value}}, tie]
+    if order == -1:
+        after.append({path: None})
+
+    return {"$or": after}
@@ -424,6 +424,9 @@ class COCODetectionDatasetImporter(
     def __len__(self):
         return len(self._filenames)
 
+    def _set_shard(self, start, stop):
+        self._filenames = self._filenames[start:stop]
+
     def __next__(self):
         filename = next(self._iter_filenames)
 
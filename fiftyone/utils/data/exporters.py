@@ -5,13 +5,15 @@ Dataset exporters.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
-from collections import defaultdict
+from collections import defaultdict, deque
 import inspect
 import logging
+from multiprocessing.pool import ThreadPool
 import os
 import warnings
 
 from bson import json_util
+from bson.raw_bson import RawBSONDocument
 
 import eta.core.datasets as etad
 import eta.core.image as etai
@@ -1088,6 +1090,11 @@ class MediaExporter(object):
             output paths
         ignore_exts (False): whether to omit file extensions when generating
             UUIDs for files
+        num_workers (None): the number of threads to use to copy or symlink
+            media files. When multiple workers are used, files are transferred
+            in the background while the caller continues, and any errors are
+            raised by a subsequent call to :meth:`export` or by :meth:`close`.
+            By default, ``fiftyone.config.media_export_workers`` is used
     """
 
     def __init__(
@@ -1098,6 +1105,7 @@ class MediaExporter(object):
         supported_modes=None,
         default_ext=None,
         ignore_exts=False,
+        num_workers=None,
     ):
         if supported_modes is None:
             supported_modes = (True, False, "move", "symlink", "manifest")
@@ -1120,10 +1128,15 @@ class MediaExporter(object):
         self.supported_modes = supported_modes
         self.default_ext = default_ext
         self.ignore_exts = ignore_exts
+        self.num_workers = num_workers
 
         self._filename_maker = None
         self._manifest = None
         self._manifest_path = None
+        self._pool = None
+        self._results = None
+        self._max_pending = None
+        self._outpaths = None
 
     def _write_media(self, media, outpath):
         raise NotImplementedError("subclass must implement _write_media()")
@@ -1172,6 +1185,16 @@ class MediaExporter(object):
         self._manifest_path = manifest_path
         self._manifest = manifest
 
+        num_workers = self.num_workers
+        if num_workers is None:
+            num_workers = fo.config.media_export_workers
+
+        if self.export_mode in (True, "symlink") and num_workers > 1:
+            self._pool = ThreadPool(processes=num_workers)
+            self._results = deque()
+            self._max_pending = 4 * num_workers
+            self._outpaths = {}
+
     def export(self, media_or_path, outpath=None):
         """Exports the given media.
 
@@ -1203,11 +1226,11 @@ class MediaExporter(object):
                 uuid = self._get_uuid(outpath)
 
             if self.export_mode == True:
-                etau.copy_file(media_path, outpath)
+                self._transfer_file(etau.copy_file, media_path, outpath)
             elif self.export_mode == "move":
                 etau.move_file(media_path, outpath)
             elif self.export_mode == "symlink":
-                etau.symlink_file(media_path, outpath)
+                self._transfer_file(etau.symlink_file, media_path, outpath)
             elif self.export_mode == "manifest":
                 self._manifest[uuid] = media_path
         else:
@@ -1231,9 +1254,47 @@ class MediaExporter(object):
 
     def close(self):
         """Performs any necessary actions to complete the export."""
+        if self._pool is not None:
+            try:
+                self._wait_for_transfers()
+            finally:
+                self._pool.close()
+                self._pool.join()
+                self._pool = None
+
         if self.export_mode == "manifest":
             etas.write_json(self._manifest, self._manifest_path)
 
+    def _transfer_file(self, transfer_fcn, inpath, outpath):
+        if self._pool is None:
+            transfer_fcn(inpath, outpath)
+            return
+
+        # Each output path must only be written once, and a different input
+        # path must not be written until any pending write has completed
+        _inpath = self._outpaths.get(outpath, None)
+        if _inpath == inpath:
+            return
+
+        if _inpath is not None:
+            self._wait_for_transfers()
+
+        self._outpaths[outpath] = inpath
+        self._results.append(
+            self._pool.apply_async(transfer_fcn, (inpath, outpath))
+        )
+
+        # Raise any errors that have occurred and bound the number of pending
+        # transfers
+        while self._results and (
+            self._results[0].ready() or len(self._results) > self._max_pending
+        ):
+            self._results.popleft().get()
+
+    def _wait_for_transfers(self):
+        while self._results:
+            self._results.popleft().get()
+
 
 class ImageExporter(MediaExporter):
     """Utility class for :class:`DatasetExporter` instances that export images.
@@ -1936,7 +1997,7 @@ class LegacyFiftyOneDatasetExporter(GenericSampleDatasetExporter):
 
 class FiftyOneDatasetExporter(BatchDatasetExporter):
     """Exporter that writes an entire FiftyOne dataset to disk in a serialized
-    JSON format along with its source media.
+    JSON or BSON format along with its source media.
 
     See :ref:`this page <FiftyOneDataset-export>` for format details.
 
@@ -1966,6 +2027,15 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
             sample/frame files
         ordered (True): whether to preserve the order of the exported
             collections
+        use_bson (False): whether to export samples/frames as concatenated
+            BSON documents rather than JSON, which is significantly faster to
+            export and import
+        compress (False): whether to gzip-compress the BSON files. Only
+            applicable when ``use_bson`` is True
+        max_shard_size (None): an optional maximum number of samples/frames
+            to write to each BSON file. If provided, the samples/frames are
+            written to directories of BSON shards. Only applicable when
+            ``use_bson`` is True
     """
 
     def __init__(
@@ -1977,6 +2047,9 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
         export_runs=True,
         use_dirs=False,
         ordered=True,
+        use_bson=False,
+        compress=False,
+        max_shard_size=None,
     ):
         if export_media is None:
             export_media = True
@@ -1984,6 +2057,12 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
         if rel_dir is not None:
             rel_dir = fou.normalize_path(rel_dir)
 
+        if use_dirs and use_bson:
+            raise ValueError(
+                "Per-sample/frame files are not supported when exporting in "
+                "BSON format; use `max_shard_size` instead"
+            )
+
         super().__init__(export_dir=export_dir)
 
         self.export_media = export_media
@@ -1992,6 +2071,9 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
         self.export_runs = export_runs
         self.use_dirs = use_dirs
         self.ordered = ordered
+        self.use_bson = use_bson
+        self.compress = compress
+        self.max_shard_size = max_shard_size
 
         self._data_dir = None
         self._fields_dir = None
@@ -2013,7 +2095,11 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
         self._eval_dir = os.path.join(self.export_dir, "evaluations")
         self._metadata_path = os.path.join(self.export_dir, "metadata.json")
 
-        if self.use_dirs:
+        if self.use_bson and self.max_shard_size is None:
+            ext = ".bson.gz" if self.compress else ".bson"
+            self._samples_path = os.path.join(self.export_dir, "samples" + ext)
+            self._frames_path = os.path.join(self.export_dir, "frames" + ext)
+        elif self.use_bson or self.use_dirs:
             self._samples_path = os.path.join(self.export_dir, "samples")
             self._frames_path = os.path.join(self.export_dir, "frames")
         else:
@@ -2065,7 +2151,9 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
 
             return sd
 
-        if self.use_dirs:
+        if self.use_bson:
+            patt = "{idx:06d}.bson.gz" if self.compress else "{idx:06d}.bson"
+        elif self.use_dirs:
             if self.ordered:
                 patt = "{idx:06d}-{id}.json"
             else:
@@ -2079,6 +2167,7 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
             key="samples",
             patt=patt,
             num_docs=num_samples,
+            max_shard_size=self.max_shard_size,
         )
 
         if sample_collection._contains_videos(any_slice=True):
@@ -2096,6 +2185,16 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
 
             coll, pipeline = fod._get_frames_pipeline(_video_collection)
             num_frames = foo.count_documents(coll, pipeline)
+
+            if self.use_bson:
+                # Frames are exported unmodified, so their raw BSON can be
+                # written directly to disk
+                coll = coll.with_options(
+                    codec_options=coll.codec_options.with_options(
+                        document_class=RawBSONDocument
+                    )
+                )
+
             frames = foo.aggregate(coll, pipeline)
 
             # @todo export segmentation/heatmap masks stored as paths
@@ -2105,6 +2204,7 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
                 key="frames",
                 patt=patt,
                 num_docs=num_frames,
+                max_shard_size=self.max_shard_size,
             )
 
         dataset = sample_collection._dataset
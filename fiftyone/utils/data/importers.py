@@ -5,13 +5,17 @@ Dataset importers.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from collections import deque
+import copy
 import inspect
 import itertools
 import logging
 import os
 import random
+import timeit
 
 from bson import json_util
+from bson.raw_bson import RawBSONDocument
 from mongoengine.base import get_document
 
 import eta.core.datasets as etad
@@ -47,6 +51,8 @@ from .parsers import (
 
 logger = logging.getLogger(__name__)
 
+_MAX_PARSE_BATCH_SIZE = 100
+
 
 def import_samples(
     dataset,
@@ -56,6 +62,7 @@ def import_samples(
     expand_schema=True,
     dynamic=False,
     add_info=True,
+    num_workers=None,
 ):
     """Adds the samples from the given :class:`DatasetImporter` to the dataset.
 
@@ -86,6 +93,12 @@ def import_samples(
             document fields that are encountered
         add_info (True): whether to add dataset info from the importer (if
             any) to the dataset
+        num_workers (None): an optional number of processes to use to parse
+            samples in parallel. Only applicable to importers that support
+            sharding (COCO, VOC, KITTI, and YOLO formats). Samples are
+            still added to the dataset in the order defined by the importer,
+            and parsing of subsequent samples overlaps with the insertion of
+            previously parsed samples
 
     Returns:
         a list of IDs of the samples that were added to the dataset
@@ -134,18 +147,43 @@ def import_samples(
         except:
             num_samples = None
 
-        if isinstance(dataset_importer, GroupDatasetImporter):
+        parallel = num_workers is not None and num_workers > 1
+        if parallel and (
+            num_samples is None or not dataset_importer._supports_sharding
+        ):
+            logger.warning(
+                "%s does not support parallel parsing; parsing samples "
+                "serially",
+                type(dataset_importer),
+            )
+            parallel = False
+
+        if parallel:
+            stats = {"parse_time": 0.0, "wait_time": 0.0}
+            samples = _parse_samples_multi(
+                dataset_importer, parse_sample, num_samples, num_workers, stats
+            )
+        elif isinstance(dataset_importer, GroupDatasetImporter):
             samples = _generate_group_samples(dataset_importer, parse_sample)
         else:
             samples = map(parse_sample, iter(dataset_importer))
 
+        start_time = timeit.default_timer()
+
+        # The parsed samples are not used after insertion, so there's no need
+        # to attach them to the dataset
         sample_ids = dataset.add_samples(
             samples,
             expand_schema=expand_schema,
             dynamic=dynamic,
             num_samples=num_samples,
+            _attach=False,
         )
 
+        if parallel:
+            total_time = timeit.default_timer() - start_time
+            _log_parse_stats(len(sample_ids), num_workers, total_time, stats)
+
         if add_info and dataset_importer.has_dataset_info:
             info = dataset_importer.get_dataset_info()
             if info:
@@ -364,6 +402,81 @@ def _handle_legacy_formats(dataset_importer):
     return dataset_importer
 
 
+def _parse_samples_multi(
+    dataset_importer, parse_sample, num_samples, num_workers, stats
+):
+    batch_size = max(1, min(_MAX_PARSE_BATCH_SIZE, num_samples // num_workers))
+    shards = (
+        (start, min(start + batch_size, num_samples))
+        for start in range(0, num_samples, batch_size)
+    )
+
+    ctx = fou.get_multiprocessing_context()
+    with ctx.Pool(
+        processes=num_workers,
+        initializer=_init_parse_worker,
+        initargs=(dataset_importer,),
+    ) as pool:
+        # Keep a bounded number of shards in flight so that workers parse
+        # ahead of insertion without buffering the entire dataset in memory
+        results = deque()
+        for shard in itertools.islice(shards, 2 * num_workers):
+            results.append(pool.apply_async(_parse_shard, (shard,)))
+
+        while results:
+            start_time = timeit.default_timer()
+            outputs, parse_time = results.popleft().get()
+            stats["wait_time"] += timeit.default_timer() - start_time
+            stats["parse_time"] += parse_time
+
+            shard = next(shards, None)
+            if shard is not None:
+                results.append(pool.apply_async(_parse_shard, (shard,)))
+
+            for output in outputs:
+                yield parse_sample(output)
+
+
+def _init_parse_worker(dataset_importer):
+    global _dataset_importer
+    _dataset_importer = dataset_importer
+
+
+def _parse_shard(shard):
+    start_time = timeit.default_timer()
+
+    # Shallow copy so that the original importer can be resharded
+    dataset_importer = copy.copy(_dataset_importer)
+    dataset_importer._set_shard(*shard)
+    outputs = list(iter(dataset_importer))
+
+    return outputs, timeit.default_timer() - start_time
+
+
+def _log_parse_stats(num_samples, num_workers, total_time, stats):
+    parse_time = stats["parse_time"]
+    insert_time = max(total_time - stats["wait_time"], 1e-6)
+    parse_rate = num_samples * num_workers / max(parse_time, 1e-6)
+    insert_rate = num_samples / insert_time
+
+    logger.info(
+        "Parsed %d samples in %.1fs of worker time (%.1f samples/s across "
+        "%d workers)",
+        num_samples,
+        parse_time,
+        parse_rate,
+        num_workers,
+    )
+    logger.info(
+        "Added %d samples in %.1fs (%.1f samples/s); waited %.1fs for "
+        "parsing",
+        num_samples,
+        insert_time,
+        insert_rate,
+        stats["wait_time"],
+    )
+
+
 def _generate_group_samples(dataset_importer, parse_sample):
     group_field = dataset_importer.group_field
     for group in dataset_importer:
@@ -911,6 +1024,26 @@ class DatasetImporter(object):
         """
         pass
 
+    @property
+    def _supports_sharding(self):
+        """Whether this importer implements :meth:`_set_shard`."""
+        return type(self)._set_shard is not DatasetImporter._set_shard
+
+    def _set_shard(self, start, stop):
+        """Internal utility that restricts this importer to the
+        ``[start, stop)`` slice of the samples that it would otherwise import.
+
+        This method is called on a shallow copy of the importer after
+        :meth:`setup` has been called, and it enables
+        :func:`import_samples` to parse samples in parallel via its
+        ``num_workers`` parameter.
+
+        Args:
+            start: the index of the first sample to import
+            stop: the index after the last sample to import
+        """
+        raise NotImplementedError("subclass must implement _set_shard()")
+
     def _preprocess_list(self, l):
         """Internal utility that preprocesses the given list---which is
         presumed to be a list defining the samples that should be imported---by
@@ -1660,7 +1793,8 @@ class LegacyFiftyOneDatasetImporter(GenericSampleDatasetImporter):
 
 
 class FiftyOneDatasetImporter(BatchDatasetImporter):
-    """Importer for FiftyOne datasets stored on disk in serialized JSON format.
+    """Importer for FiftyOne datasets stored on disk in serialized JSON or
+    BSON format.
 
     See :ref:`this page <FiftyOneDataset-import>` for format details.
 
@@ -1729,19 +1863,9 @@ class FiftyOneDatasetImporter(BatchDatasetImporter):
                 f: False for f in etau.list_subdirs(self._fields_dir)
             }
 
-        self._samples_path = os.path.join(self.dataset_dir, "samples.json")
-        if not os.path.isfile(self._samples_path):
-            self._samples_path = os.path.join(self.dataset_dir, "samples")
-
-        self._frames_path = os.path.join(self.dataset_dir, "frames.json")
-        if os.path.isfile(self._frames_path):
-            self._has_frames = True
-        else:
-            self._frames_path = os.path.join(self.dataset_dir, "frames")
-            if os.path.isdir(self._frames_path):
-                self._has_frames = True
-            else:
-                self._has_frames = False
+        self._samples_path = _get_collection_path(self.dataset_dir, "samples")
+        self._frames_path = _get_collection_path(self.dataset_dir, "frames")
+        self._has_frames = os.path.exists(self._frames_path)
 
     def import_samples(self, dataset, tags=None):
         dataset_dict = foo.import_document(self._metadata_path)
@@ -1871,8 +1995,12 @@ class FiftyOneDatasetImporter(BatchDatasetImporter):
 
         if self._has_frames:
             logger.info("Importing frames...")
+            # Unless frames must be filtered, the labels of frames stored as
+            # BSON are inserted without being decoded
             frames, num_frames = foo.import_collection(
-                self._frames_path, key="frames"
+                self._frames_path,
+                key="frames",
+                raw=self.max_samples is None,
             )
 
             # @todo optimize by only loading these docs in the first place
@@ -1882,8 +2010,7 @@ class FiftyOneDatasetImporter(BatchDatasetImporter):
                 num_frames = len(frames)
 
             def _parse_frame(fd):
-                fd["_dataset_id"] = dataset_id
-                return fd
+                return _set_dataset_id(fd, dataset_id)
 
             foo.insert_documents(
                 map(_parse_frame, frames),
@@ -1960,9 +2087,14 @@ class FiftyOneDatasetImporter(BatchDatasetImporter):
     @staticmethod
     def _get_num_samples(dataset_dir):
         # Used only by dataset zoo
-        samples_path = os.path.join(dataset_dir, "samples.json")
-        samples = etas.read_json(samples_path).get("samples", [])
-        return len(samples)
+        samples_path = _get_collection_path(dataset_dir, "samples")
+        samples, num_samples = foo.import_collection(
+            samples_path, key="samples"
+        )
+        if num_samples is None:
+            num_samples = sum(1 for _ in samples)
+
+        return num_samples
 
     def _is_legacy_format_data(self):
         metadata_path = os.path.join(self.dataset_dir, "metadata.json")
@@ -1982,6 +2114,25 @@ class FiftyOneDatasetImporter(BatchDatasetImporter):
         )
 
 
+def _set_dataset_id(doc, dataset_id):
+    if isinstance(doc, RawBSONDocument):
+        # Only the top-level fields are decoded. Embedded documents remain
+        # raw and their bytes are reused when the document is re-encoded
+        doc = dict(doc.items())
+
+    doc["_dataset_id"] = dataset_id
+    return doc
+
+
+def _get_collection_path(dataset_dir, name):
+    for ext in (".json", ".bson", ".bson.gz"):
+        path = os.path.join(dataset_dir, name + ext)
+        if os.path.isfile(path):
+            return path
+
+    return os.path.join(dataset_dir, name)
+
+
 def _import_saved_views(dataset, views):
     for d in views:
         if etau.is_str(d):
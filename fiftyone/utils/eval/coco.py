@@ -650,7 +650,7 @@ def _compute_pr_curves(samples, config, classes=None):
     logger.info("Performing IoU sweep...")
     for sample in samples.iter_samples(progress=True):
         if processing_frames:
-            images = sample.frames.values()
+            images = sample.frames.iter_frames()
         else:
             images = [sample]
 
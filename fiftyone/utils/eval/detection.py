@@ -5,6 +5,7 @@ Detection evaluation.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from collections import defaultdict
 import itertools
 import logging
 
@@ -21,6 +22,8 @@ from .base import BaseEvaluationResults
 
 logger = logging.getLogger(__name__)
 
+_MAX_BATCH_SIZE = 100
+
 
 def evaluate_detections(
     samples,
@@ -35,6 +38,7 @@ def evaluate_detections(
     use_boxes=False,
     classwise=True,
     dynamic=True,
+    num_workers=None,
     **kwargs,
 ):
     """Evaluates the predicted detections in the given samples with respect to
@@ -121,6 +125,12 @@ def evaluate_detections(
             label (True) or allow matches between classes (False)
         dynamic (True): whether to declare the dynamic object-level attributes
             that are populated on the dataset's schema
+        num_workers (None): an optional number of processes to use to
+            evaluate batches of samples in parallel. When provided, the label
+            fields are loaded in bulk via
+            :meth:`values() <fiftyone.core.collections.SampleCollection.values>`
+            and the results are written back in bulk. By default, samples are
+            evaluated serially in the main process
         **kwargs: optional keyword arguments for the constructor of the
             :class:`DetectionEvaluationConfig` being used
 
@@ -158,47 +168,21 @@ def evaluate_detections(
     eval_method.register_run(samples, eval_key)
     eval_method.register_samples(samples, eval_key, dynamic=dynamic)
 
-    processing_frames = samples._is_frame_field(pred_field)
-
-    if eval_key is not None:
-        tp_field = "%s_tp" % eval_key
-        fp_field = "%s_fp" % eval_key
-        fn_field = "%s_fn" % eval_key
-
-    if config.requires_additional_fields:
-        _samples = samples
+    if num_workers is None or num_workers <= 1:
+        matches = _evaluate_detections(samples, eval_method, eval_key)
+    elif (
+        config.requires_additional_fields and config.additional_fields is None
+    ):
+        logger.warning(
+            "Evaluation method '%s' does not support multiprocessing; "
+            "evaluating serially",
+            config.method,
+        )
+        matches = _evaluate_detections(samples, eval_method, eval_key)
     else:
-        _samples = samples.select_fields([gt_field, pred_field])
-
-    matches = []
-    logger.info("Evaluating detections...")
-    for sample in _samples.iter_samples(progress=True):
-        if processing_frames:
-            docs = sample.frames.values()
-        else:
-            docs = [sample]
-
-        sample_tp = 0
-        sample_fp = 0
-        sample_fn = 0
-        for doc in docs:
-            doc_matches = eval_method.evaluate(doc, eval_key=eval_key)
-            matches.extend(doc_matches)
-            tp, fp, fn = _tally_matches(doc_matches)
-            sample_tp += tp
-            sample_fp += fp
-            sample_fn += fn
-
-            if processing_frames and eval_key is not None:
-                doc[tp_field] = tp
-                doc[fp_field] = fp
-                doc[fn_field] = fn
-
-        if eval_key is not None:
-            sample[tp_field] = sample_tp
-            sample[fp_field] = sample_fp
-            sample[fn_field] = sample_fn
-            sample.save()
+        matches = _evaluate_detections_multi(
+            samples, eval_method, eval_key, num_workers
+        )
 
     results = eval_method.generate_results(
         samples, matches, eval_key=eval_key, classes=classes, missing=missing
@@ -243,6 +227,16 @@ class DetectionEvaluationConfig(foe.EvaluationMethodConfig):
         """
         return False
 
+    @property
+    def additional_fields(self):
+        """A list of fields besides ``pred_field`` and ``gt_field`` that are
+        required in order to perform evaluation, or None if the entire samples
+        may be required.
+
+        Only applicable when :meth:`requires_additional_fields` is True.
+        """
+        return None
+
 
 class DetectionEvaluation(foe.EvaluationMethod):
     """Base class for detection evaluation methods.
@@ -592,6 +586,188 @@ def _parse_config(pred_field, gt_field, method, is_temporal, **kwargs):
     raise ValueError("Unsupported evaluation method '%s'" % method)
 
 
+def _evaluate_detections(samples, eval_method, eval_key):
+    config = eval_method.config
+    gt_field = config.gt_field
+    pred_field = config.pred_field
+
+    processing_frames = samples._is_frame_field(pred_field)
+
+    if eval_key is not None:
+        tp_field = "%s_tp" % eval_key
+        fp_field = "%s_fp" % eval_key
+        fn_field = "%s_fn" % eval_key
+
+    if config.requires_additional_fields:
+        _samples = samples
+    else:
+        _samples = samples.select_fields([gt_field, pred_field])
+
+    matches = []
+    logger.info("Evaluating detections...")
+    for sample in _samples.iter_samples(progress=True):
+        if processing_frames:
+            # Frames are saved in batches while iterating so that long videos
+            # need not be held in memory
+            docs = sample.frames.iter_frames(autosave=eval_key is not None)
+        else:
+            docs = [sample]
+
+        sample_tp = 0
+        sample_fp = 0
+        sample_fn = 0
+        for doc in docs:
+            doc_matches = eval_method.evaluate(doc, eval_key=eval_key)
+            matches.extend(doc_matches)
+            tp, fp, fn = _tally_matches(doc_matches)
+            sample_tp += tp
+            sample_fp += fp
+            sample_fn += fn
+
+            if processing_frames and eval_key is not None:
+                doc[tp_field] = tp
+                doc[fp_field] = fp
+                doc[fn_field] = fn
+
+        if eval_key is not None:
+            sample[tp_field] = sample_tp
+            sample[fp_field] = sample_fp
+            sample[fn_field] = sample_fn
+            sample.save()
+
+    return matches
+
+
+def _evaluate_detections_multi(samples, eval_method, eval_key, num_workers):
+    config = eval_method.config
+    processing_frames = samples._is_frame_field(config.pred_field)
+
+    # Only the fields required for evaluation are loaded, as raw BSON, so that
+    # label objects are only ever constructed in the worker processes
+    keys = [eval_method.gt_field, eval_method.pred_field]
+    paths = [config.gt_field, config.pred_field]
+    if config.requires_additional_fields:
+        for field in config.additional_fields:
+            keys.append(field)
+            if processing_frames:
+                paths.append(samples._FRAMES_PREFIX + field)
+            else:
+                paths.append(field)
+
+    sample_ids = samples.values("id")
+    docs = fou.load_raw_labels(samples, paths)
+
+    matches = []
+    counts = []
+    gt_values = defaultdict(dict)
+    pred_values = defaultdict(dict)
+
+    logger.info("Evaluating detections...")
+
+    # Results are generated in order, so `matches` are generated in the same
+    # order as when evaluating serially
+    for _, batch_results in fou.map_batches(
+        _do_evaluate_batch,
+        docs,
+        num_workers,
+        max_batch_size=_MAX_BATCH_SIZE,
+        total=len(docs),
+        progress=True,
+        initializer=_init_worker,
+        initargs=(eval_method, eval_key, keys),
+    ):
+        for result in batch_results:
+            sample_matches, sample_counts, gt_vals, pred_vals = result
+            matches.extend(sample_matches)
+            counts.append(sample_counts)
+            for attr, vals in gt_vals.items():
+                gt_values[attr].update(vals)
+
+            for attr, vals in pred_vals.items():
+                pred_values[attr].update(vals)
+
+    if eval_key is None:
+        return matches
+
+    for field, field_values in (
+        (config.gt_field, gt_values),
+        (config.pred_field, pred_values),
+    ):
+        for attr, label_values in field_values.items():
+            if label_values:
+                _, path = samples._get_label_field_path(field, attr)
+                samples.set_label_values(path, label_values)
+
+    tp_field = "%s_tp" % eval_key
+    fp_field = "%s_fp" % eval_key
+    fn_field = "%s_fn" % eval_key
+
+    for idx, field in enumerate((tp_field, fp_field, fn_field)):
+        if processing_frames:
+            frame_values = {
+                _id: [c[idx] for c in sample_counts]
+                for _id, sample_counts in zip(sample_ids, counts)
+            }
+            samples.set_values(
+                samples._FRAMES_PREFIX + field,
+                frame_values,
+                key_field="id",
+            )
+
+        sample_values = {
+            _id: sum(c[idx] for c in sample_counts)
+            for _id, sample_counts in zip(sample_ids, counts)
+        }
+        samples.set_values(field, sample_values, key_field="id")
+
+    return matches
+
+
+def _init_worker(eval_method, eval_key, keys):
+    global _worker_args
+    _worker_args = (eval_method, eval_key, keys)
+
+
+def _do_evaluate_batch(batch):
+    eval_method, eval_key, keys = _worker_args
+
+    if eval_key is not None:
+        attrs = (eval_key, "%s_id" % eval_key, "%s_iou" % eval_key)
+
+    results = []
+    for sample_docs in batch:
+        sample_matches = []
+        sample_counts = []
+        gt_values = defaultdict(dict)
+        pred_values = defaultdict(dict)
+        for doc_values in sample_docs:
+            doc = fou.parse_raw_labels(keys, doc_values)
+
+            doc_matches = eval_method.evaluate(doc, eval_key=eval_key)
+            sample_matches.extend(doc_matches)
+            sample_counts.append(_tally_matches(doc_matches))
+
+            if eval_key is None:
+                continue
+
+            for key, label_values in (
+                (eval_method.gt_field, gt_values),
+                (eval_method.pred_field, pred_values),
+            ):
+                labels = doc[key]
+                if labels is None:
+                    continue
+
+                for label in labels[labels._LABEL_LIST_FIELD]:
+                    for attr in attrs:
+                        if label.has_field(attr):
+                            label_values[attr][label.id] = label[attr]
+
+        results.append((sample_matches, sample_counts, gt_values, pred_values))
+
+    return results
+
+
 def _tally_matches(matches):
     tp = 0
     fp = 0
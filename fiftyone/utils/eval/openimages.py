@@ -128,6 +128,17 @@ class OpenImagesEvaluationConfig(DetectionEvaluationConfig):
     def requires_additional_fields(self):
         return True
 
+    @property
+    def additional_fields(self):
+        fields = []
+        if self.pos_label_field:
+            fields.append(self.pos_label_field)
+
+        if self.neg_label_field:
+            fields.append(self.neg_label_field)
+
+        return fields
+
 
 class OpenImagesEvaluation(DetectionEvaluation):
     """Open Images-style evaluation.
@@ -24,6 +24,9 @@ from .base import BaseEvaluationResults
 
 logger = logging.getLogger(__name__)
 
+_MAX_BATCH_SIZE = 20
+_WRITE_BATCH_SIZE = 1000
+
 
 def evaluate_segmentations(
     samples,
@@ -32,6 +35,7 @@ def evaluate_segmentations(
     eval_key=None,
     mask_targets=None,
     method="simple",
+    num_workers=None,
     **kwargs,
 ):
     """Evaluates the specified semantic segmentation masks in the given
@@ -80,6 +84,9 @@ def evaluate_segmentations(
             labels. If not provided, the observed values are used as labels
         method ("simple"): a string specifying the evaluation method to use.
             Supported values are ``("simple")``
+        num_workers (None): an optional number of processes to use to decode
+            masks and compute confusion matrices in parallel. By default,
+            samples are evaluated serially in the main process
         **kwargs: optional keyword arguments for the constructor of the
             :class:`SegmentationEvaluationConfig` being used
 
@@ -98,7 +105,10 @@ def evaluate_segmentations(
     eval_method.register_samples(samples, eval_key)
 
     results = eval_method.evaluate_samples(
-        samples, eval_key=eval_key, mask_targets=mask_targets
+        samples,
+        eval_key=eval_key,
+        mask_targets=mask_targets,
+        num_workers=num_workers,
     )
     eval_method.save_run_results(samples, eval_key, results)
 
@@ -158,7 +168,9 @@ class SegmentationEvaluation(foe.EvaluationMethod):
             dataset.add_frame_field(pre_field, fof.FloatField)
             dataset.add_frame_field(rec_field, fof.FloatField)
 
-    def evaluate_samples(self, samples, eval_key=None, mask_targets=None):
+    def evaluate_samples(
+        self, samples, eval_key=None, mask_targets=None, num_workers=None
+    ):
         """Evaluates the predicted segmentation masks in the given samples with
         respect to the specified ground truth masks.
 
@@ -169,6 +181,8 @@ class SegmentationEvaluation(foe.EvaluationMethod):
                 contain a subset of the possible classes if you wish to
                 evaluate a subset of the semantic classes. By default, the
                 observed pixel values are used as labels
+            num_workers (None): an optional number of processes to use to
+                evaluate batches of samples in parallel
 
         Returns:
             a :class:`SegmentationResults` instance
@@ -273,10 +287,9 @@ class SimpleEvaluation(SegmentationEvaluation):
         config: a :class:`SimpleEvaluationConfig`
     """
 
-    def evaluate_samples(self, samples, eval_key=None, mask_targets=None):
-        pred_field = self.config.pred_field
-        gt_field = self.config.gt_field
-
+    def evaluate_samples(
+        self, samples, eval_key=None, mask_targets=None, num_workers=None
+    ):
         if mask_targets is not None:
             if fof.is_rgb_mask_targets(mask_targets):
                 mask_targets = {
@@ -285,6 +298,41 @@ class SimpleEvaluation(SegmentationEvaluation):
 
             values, classes = zip(*sorted(mask_targets.items()))
         else:
+            values, classes = None, None
+
+        if num_workers is not None and num_workers > 1:
+            (
+                confusion_matrix,
+                values,
+                classes,
+            ) = _evaluate_segmentations_multi(
+                samples, self.config, eval_key, values, classes, num_workers
+            )
+        else:
+            confusion_matrix, values, classes = self._evaluate_samples(
+                samples, eval_key, values, classes
+            )
+
+        if len(values) > 0:
+            missing = classes[0] if values[0] in (0, "#000000") else None
+        else:
+            missing = None
+
+        return SegmentationResults(
+            samples,
+            self.config,
+            eval_key,
+            confusion_matrix,
+            classes,
+            missing=missing,
+            backend=self,
+        )
+
+    def _evaluate_samples(self, samples, eval_key, values, classes):
+        pred_field = self.config.pred_field
+        gt_field = self.config.gt_field
+
+        if values is None:
             logger.info("Computing possible mask values...")
             values, classes = _get_mask_values(samples, pred_field, gt_field)
 
@@ -353,20 +401,7 @@ class SimpleEvaluation(SegmentationEvaluation):
                 sample[rec_field] = srec
                 sample.save()
 
-        if nc > 0:
-            missing = classes[0] if values[0] in (0, "#000000") else None
-        else:
-            missing = None
-
-        return SegmentationResults(
-            samples,
-            self.config,
-            eval_key,
-            confusion_matrix,
-            classes,
-            missing=missing,
-            backend=self,
-        )
+        return confusion_matrix, values, classes
 
 
 class SegmentationResults(BaseEvaluationResults):
@@ -456,6 +491,20 @@ def _parse_config(pred_field, gt_field, method, **kwargs):
 def _compute_pixel_confusion_matrix(
     pred_mask, gt_mask, values, bandwidth=None
 ):
+    pred_mask, gt_mask = _prepare_masks(pred_mask, gt_mask, bandwidth)
+
+    try:
+        return skm.confusion_matrix(
+            gt_mask.ravel(), pred_mask.ravel(), labels=values
+        )
+    except ValueError:
+        # Assume that no `values` appear in `gt_mask`, which causes
+        # `skm.confusion_matrix` to raise an error
+        num_classes = len(values)
+        return np.zeros((num_classes, num_classes), dtype=int)
+
+
+def _prepare_masks(pred_mask, gt_mask, bandwidth):
     if pred_mask.ndim == 3:
         pred_mask = _rgb_array_to_int(pred_mask)
 
@@ -476,15 +525,7 @@ def _compute_pixel_confusion_matrix(
             pred_mask, gt_mask, bandwidth
         )
 
-    try:
-        return skm.confusion_matrix(
-            gt_mask.ravel(), pred_mask.ravel(), labels=values
-        )
-    except ValueError:
-        # Assume that no `values` appear in `gt_mask`, which causes
-        # `skm.confusion_matrix` to raise an error
-        num_classes = len(values)
-        return np.zeros((num_classes, num_classes), dtype=int)
+    return pred_mask, gt_mask
 
 
 def _extract_contour_band_values(pred_mask, gt_mask, bandwidth):
@@ -504,6 +545,382 @@ def _compute_accuracy_precision_recall(confusion_matrix, values, average):
     return metrics["accuracy"], metrics["precision"], metrics["recall"]
 
 
+def _evaluate_segmentations_multi(
+    samples, config, eval_key, values, classes, num_workers
+):
+    gt_field = config.gt_field
+    pred_field = config.pred_field
+    bandwidth = config.bandwidth
+    average = config.average
+
+    _samples = samples.select_fields([gt_field, pred_field])
+    pred_field, processing_frames = samples._handle_frame_field(pred_field)
+    gt_field, _ = samples._handle_frame_field(gt_field)
+
+    num_samples = len(_samples)
+    compute_metrics = eval_key is not None
+
+    # If `values` are not provided, they are discovered in the same pass: each
+    # worker returns the confusion matrix of its batch with respect to the
+    # values that it encountered, which is merged into the confusion matrix of
+    # all values seen so far
+    discover = values is None
+    if discover:
+        _values = np.array([], dtype=int)
+    else:
+        _values = np.asarray(values)
+
+    nc = len(_values)
+    confusion_matrix = np.zeros((nc, nc), dtype=int)
+    is_rgb = False
+
+    sample_metrics = {}
+    frame_metrics = {}
+    unscored = []
+
+    logger.info("Evaluating segmentations...")
+    docs = _samples._aggregate(attach_frames=processing_frames)
+    for _, batch_result in fou.map_batches(
+        _do_evaluate_batch,
+        docs,
+        num_workers,
+        max_batch_size=_MAX_BATCH_SIZE,
+        total=num_samples,
+        progress=True,
+        initializer=_init_worker,
+        initargs=(
+            gt_field,
+            pred_field,
+            processing_frames,
+            bandwidth,
+            values,
+            average,
+            compute_metrics,
+        ),
+    ):
+        (
+            batch_values,
+            batch_conf_mat,
+            batch_is_rgb,
+            batch_results,
+        ) = batch_result
+
+        if discover:
+            _values, confusion_matrix = _merge_confusion_matrices(
+                _values, confusion_matrix, batch_values, batch_conf_mat
+            )
+            is_rgb |= batch_is_rgb
+        else:
+            confusion_matrix += batch_conf_mat
+
+        for sample_id, msgs, metrics in batch_results:
+            for msg in msgs:
+                warnings.warn(msg)
+
+            if not compute_metrics:
+                continue
+
+            if discover:
+                # Metrics depend on all possible values, so they are computed
+                # from the (small) local confusion matrices after this pass
+                unscored.append((sample_id, metrics))
+            else:
+                sample_metrics[sample_id], frame_metrics[sample_id] = metrics
+
+        if len(sample_metrics) >= _WRITE_BATCH_SIZE:
+            _write_metrics(
+                samples,
+                eval_key,
+                processing_frames,
+                sample_metrics,
+                frame_metrics,
+            )
+            sample_metrics.clear()
+            frame_metrics.clear()
+
+    if discover:
+        values = _values.tolist()
+        if is_rgb:
+            classes = [_int_to_hex(v) for v in values]
+        else:
+            classes = [str(v) for v in values]
+
+    if unscored:
+        logger.info("Computing metrics...")
+        for _, batch_results in fou.map_batches(
+            _do_compute_metrics_batch,
+            unscored,
+            num_workers,
+            max_batch_size=_WRITE_BATCH_SIZE,
+            total=len(unscored),
+            progress=True,
+            initializer=_init_worker,
+            initargs=(values, average),
+        ):
+            for sample_id, metrics in batch_results:
+                sample_metrics[sample_id], frame_metrics[sample_id] = metrics
+
+            if len(sample_metrics) >= _WRITE_BATCH_SIZE:
+                _write_metrics(
+                    samples,
+                    eval_key,
+                    processing_frames,
+                    sample_metrics,
+                    frame_metrics,
+                )
+                sample_metrics.clear()
+                frame_metrics.clear()
+
+    if sample_metrics:
+        _write_metrics(
+            samples, eval_key, processing_frames, sample_metrics, frame_metrics
+        )
+
+    return confusion_matrix, values, classes
+
+
+def _write_metrics(
+    samples, eval_key, processing_frames, sample_metrics, frame_metrics
+):
+    acc_field = "%s_accuracy" % eval_key
+    pre_field = "%s_precision" % eval_key
+    rec_field = "%s_recall" % eval_key
+
+    for idx, field in enumerate((acc_field, pre_field, rec_field)):
+        if processing_frames:
+            _frame_values = {
+                _id: {fn: m[idx] for fn, m in fm.items()}
+                for _id, fm in frame_metrics.items()
+                if fm
+            }
+            samples.set_values(
+                samples._FRAMES_PREFIX + field,
+                _frame_values,
+                key_field="id",
+            )
+
+        _sample_values = {_id: m[idx] for _id, m in sample_metrics.items()}
+        samples.set_values(field, _sample_values, key_field="id")
+
+
+def _init_worker(*args):
+    global _worker_args
+    _worker_args = args
+
+
+def _iter_images(d, processing_frames):
+    if processing_frames:
+        for f in d.get("frames", []):
+            yield f["frame_number"], f
+    else:
+        yield None, d
+
+
+def _do_evaluate_batch(batch):
+    (
+        gt_field,
+        pred_field,
+        processing_frames,
+        bandwidth,
+        values,
+        average,
+        compute_metrics,
+    ) = _worker_args
+
+    # If `values` are not provided, confusion matrices are computed with
+    # respect to the values that appear in each sample and batch
+    discover = values is None
+    if discover:
+        batch_values = np.array([], dtype=int)
+    else:
+        batch_values = np.asarray(values)
+
+    nc = len(batch_values)
+    batch_conf_mat = np.zeros((nc, nc), dtype=int)
+    seen_values = np.array([], dtype=int)
+    is_rgb = False
+
+    results = []
+    for d in batch:
+        msgs = []
+        if discover:
+            sample_values = np.array([], dtype=int)
+            sample_conf_mat = np.zeros((0, 0), dtype=int)
+        else:
+            sample_conf_mat = np.zeros((nc, nc), dtype=int)
+
+        frame_metrics = {}
+        for frame_number, image in _iter_images(d, processing_frames):
+            gt_mask, gt_rgb = _get_mask(image, gt_field)
+            pred_mask, pred_rgb = _get_mask(image, pred_field)
+
+            if discover:
+                is_rgb |= gt_rgb or pred_rgb
+                for mask in (gt_mask, pred_mask):
+                    if mask is not None:
+                        seen_values = np.union1d(
+                            seen_values, _unique_values(mask)
+                        )
+
+            msg, conf = _evaluate_masks(gt_mask, pred_mask, bandwidth)
+            if msg is not None:
+                msgs.append(msg)
+                continue
+
+            if discover:
+                sample_values, sample_conf_mat = _merge_confusion_matrices(
+                    sample_values, sample_conf_mat, *conf
+                )
+
+                if processing_frames and compute_metrics:
+                    frame_metrics[frame_number] = conf
+
+                continue
+
+            image_conf_mat = _embed_confusion_matrix(*conf, batch_values)
+            sample_conf_mat += image_conf_mat
+
+            if processing_frames and compute_metrics:
+                frame_metrics[
+                    frame_number
+                ] = _compute_accuracy_precision_recall(
+                    image_conf_mat, values, average
+                )
+
+        if discover:
+            batch_values, batch_conf_mat = _merge_confusion_matrices(
+                batch_values, batch_conf_mat, sample_values, sample_conf_mat
+            )
+            metrics = ((sample_values, sample_conf_mat), frame_metrics)
+        else:
+            batch_conf_mat += sample_conf_mat
+            if compute_metrics:
+                sample_metrics = _compute_accuracy_precision_recall(
+                    sample_conf_mat, values, average
+                )
+                metrics = (sample_metrics, frame_metrics)
+
+        if not compute_metrics:
+            metrics = None
+
+        results.append((str(d["_id"]), msgs, metrics))
+
+    if discover:
+        # Values that only appear in skipped masks or outside of the evaluated
+        # boundaries are still reported
+        _batch_values = np.union1d(seen_values, batch_values)
+        batch_conf_mat = _embed_confusion_matrix(
+            batch_values, batch_conf_mat, _batch_values
+        )
+        batch_values = _batch_values
+
+    return batch_values, batch_conf_mat, is_rgb, results
+
+
+def _do_compute_metrics_batch(batch):
+    values, average = _worker_args
+
+    _values = np.asarray(values)
+
+    results = []
+    for sample_id, (sample_conf, frame_confs) in batch:
+        frame_metrics = {}
+        for frame_number, conf in frame_confs.items():
+            frame_metrics[frame_number] = _compute_accuracy_precision_recall(
+                _embed_confusion_matrix(*conf, _values), values, average
+            )
+
+        sample_metrics = _compute_accuracy_precision_recall(
+            _embed_confusion_matrix(*sample_conf, _values), values, average
+        )
+        results.append((sample_id, (sample_metrics, frame_metrics)))
+
+    return results
+
+
+def _get_mask(d, path):
+    seg = _parse_segmentation(d, path)
+    if seg is None or not seg.has_mask:
+        return None, False
+
+    mask = seg.get_mask()
+    if mask.ndim == 3:
+        return _rgb_array_to_int(mask), True
+
+    return mask, False
+
+
+def _parse_segmentation(d, path):
+    for key in path.split("."):
+        if d is None:
+            return None
+
+        d = d.get(key, None)
+
+    if d is None:
+        return None
+
+    return fol.Segmentation.from_dict(d)
+
+
+def _evaluate_masks(gt_mask, pred_mask, bandwidth):
+    if gt_mask is None:
+        return "Skipping sample with missing ground truth mask", None
+
+    if pred_mask is None:
+        return "Skipping sample with missing prediction mask", None
+
+    pred_mask, gt_mask = _prepare_masks(pred_mask, gt_mask, bandwidth)
+    gt_mask = gt_mask.ravel()
+    pred_mask = pred_mask.ravel()
+
+    values = np.union1d(_unique_values(gt_mask), _unique_values(pred_mask))
+
+    nc = len(values)
+    gt_inds = np.searchsorted(values, gt_mask)
+    pred_inds = np.searchsorted(values, pred_mask)
+    conf_mat = np.bincount(
+        gt_inds * nc + pred_inds, minlength=nc * nc
+    ).reshape(nc, nc)
+
+    return None, (values, conf_mat)
+
+
+def _unique_values(mask):
+    mask = mask.ravel()
+    if mask.dtype.kind in ("u", "b") and mask.size > 0:
+        # Much faster than `np.unique()` for small integer masks
+        if mask.dtype.kind == "b" or mask.max() < 65536:
+            counts = np.bincount(mask.astype(np.int64, copy=False))
+            return np.flatnonzero(counts)
+
+    return np.unique(mask)
+
+
+def _embed_confusion_matrix(local_values, local_conf_mat, values):
+    nc = len(values)
+    conf_mat = np.zeros((nc, nc), dtype=int)
+    if nc == 0 or len(local_values) == 0:
+        return conf_mat
+
+    inds = np.minimum(np.searchsorted(values, local_values), nc - 1)
+    found = values[inds] == local_values
+    inds = inds[found]
+
+    # Pixels whose ground truth or predicted value is not in `values` are
+    # ignored, consistent with `skm.confusion_matrix()`
+    conf_mat[np.ix_(inds, inds)] = local_conf_mat[np.ix_(found, found)]
+
+    return conf_mat
+
+
+def _merge_confusion_matrices(values1, conf_mat1, values2, conf_mat2):
+    values = np.union1d(values1, values2)
+    conf_mat = _embed_confusion_matrix(values1, conf_mat1, values)
+    conf_mat += _embed_confusion_matrix(values2, conf_mat2, values)
+    return values, conf_mat
+
+
 def _get_mask_values(samples, pred_field, gt_field):
     _samples = samples.select_fields([gt_field, pred_field])
     pred_field, processing_frames = samples._handle_frame_field(pred_field)
@@ -6,6 +6,7 @@ Intersection over union (IoU) utilities.
 |
 """
 import contextlib
+import itertools
 import logging
 
 import numpy as np
@@ -21,6 +22,10 @@ from .utils3d import compute_cuboid_iou as _compute_cuboid_iou
 
 sg = fou.lazy_import("shapely.geometry")
 so = fou.lazy_import("shapely.ops")
+sst = fou.lazy_import("shapely.strtree")
+
+
+_MAX_BATCH_SIZE = 100
 
 
 def compute_ious(
@@ -132,6 +137,7 @@ def compute_max_ious(
     other_field=None,
     iou_attr="max_iou",
     id_attr=None,
+    num_workers=None,
     **kwargs,
 ):
     """Populates an attribute on each label in the given spatial field(s) that
@@ -156,6 +162,11 @@ def compute_max_ious(
         iou_attr ("max_iou"): the label attribute in which to store the max IoU
         id_attr (None): an optional attribute in which to store the label ID of
             the maximum overlapping label
+        num_workers (None): an optional number of processes to use to compute
+            IoUs for batches of samples in parallel. When provided, the label
+            fields are loaded in bulk via
+            :meth:`values() <fiftyone.core.collections.SampleCollection.values>`.
+            By default, samples are processed serially in the main process
         **kwargs: optional keyword arguments for :func:`compute_ious`
     """
     if other_field is None:
@@ -173,43 +184,45 @@ def compute_max_ious(
     )
     _other_field, _ = sample_collection._handle_frame_field(other_field)
 
-    if other_field != label_field:
-        view = sample_collection.select_fields([label_field, other_field])
-    else:
-        view = sample_collection.select_fields(label_field)
-
-    max_ious1 = []
-    max_ious2 = []
-    label_ids1 = []
-    label_ids2 = []
+    if num_workers is not None and num_workers > 1:
+        if other_field != label_field:
+            fields = [label_field, other_field]
+            keys = [_label_field, _other_field]
+        else:
+            fields = [label_field]
+            keys = [_label_field]
+
+        results = _compute_multi(
+            sample_collection,
+            fields,
+            keys,
+            is_frame_field,
+            _compute_max_ious,
+            (_label_field, _other_field),
+            kwargs,
+            num_workers,
+        )
 
-    for sample in view.iter_samples(progress=True):
         if is_frame_field:
-            _max_ious1 = []
-            _max_ious2 = []
-            _label_ids1 = []
-            _label_ids2 = []
-            for frame in sample.frames.values():
-                iou1, iou2, id1, id2 = _compute_max_ious(
-                    frame, _label_field, _other_field, **kwargs
-                )
-                _max_ious1.append(iou1)
-                _max_ious2.append(iou2)
-                _label_ids1.append(id1)
-                _label_ids2.append(id2)
-
-            max_ious1.append(_max_ious1)
-            max_ious2.append(_max_ious2)
-            label_ids1.append(_label_ids1)
-            label_ids2.append(_label_ids2)
+            max_ious1, max_ious2, label_ids1, label_ids2 = (
+                [[r[i] for r in frame_results] for frame_results in results]
+                for i in range(4)
+            )
         else:
-            iou1, iou2, id1, id2 = _compute_max_ious(
-                sample, _label_field, _other_field, **kwargs
+            max_ious1, max_ious2, label_ids1, label_ids2 = (
+                [r[i] for r in results] for i in range(4)
             )
-            max_ious1.append(iou1)
-            max_ious2.append(iou2)
-            label_ids1.append(id1)
-            label_ids2.append(id2)
+    else:
+        results = _compute_max_ious_serial(
+            sample_collection,
+            label_field,
+            other_field,
+            _label_field,
+            _other_field,
+            is_frame_field,
+            **kwargs,
+        )
+        max_ious1, max_ious2, label_ids1, label_ids2 = results
 
     _, iou_path1 = sample_collection._get_label_field_path(
         label_field, iou_attr
@@ -240,7 +253,12 @@ def compute_max_ious(
 
 
 def find_duplicates(
-    sample_collection, label_field, iou_thresh=0.999, method="simple", **kwargs
+    sample_collection,
+    label_field,
+    iou_thresh=0.999,
+    method="simple",
+    num_workers=None,
+    **kwargs,
 ):
     """Returns IDs of duplicate labels in the given field of the collection, as
     defined as labels with an IoU greater than a chosen threshold with another
@@ -267,6 +285,11 @@ def find_duplicates(
             labels are duplicates
         method ("simple"): the duplicate removal method to use. The supported
             values are ``("simple", "greedy")``
+        num_workers (None): an optional number of processes to use to find
+            duplicates in batches of samples in parallel. When provided, the
+            label field is loaded in bulk via
+            :meth:`values() <fiftyone.core.collections.SampleCollection.values>`.
+            By default, samples are processed serially in the main process
         **kwargs: optional keyword arguments for :func:`compute_ious`
 
     Returns:
@@ -280,13 +303,30 @@ def find_duplicates(
         label_field
     )
 
+    if num_workers is not None and num_workers > 1:
+        results = _compute_multi(
+            sample_collection,
+            [label_field],
+            [_label_field],
+            is_frame_field,
+            _find_duplicates,
+            (_label_field, iou_thresh, method),
+            kwargs,
+            num_workers,
+        )
+
+        if is_frame_field:
+            results = itertools.chain.from_iterable(results)
+
+        return list(itertools.chain.from_iterable(results))
+
     view = sample_collection.select_fields(label_field)
 
     dup_ids = []
 
     for sample in view.iter_samples(progress=True):
         if is_frame_field:
-            for frame in sample.frames.values():
+            for frame in sample.frames.iter_frames():
                 _dup_ids = _find_duplicates(
                     frame, _label_field, iou_thresh, method, **kwargs
                 )
@@ -300,6 +340,110 @@ def find_duplicates(
     return dup_ids
 
 
+def _compute_max_ious_serial(
+    sample_collection,
+    label_field,
+    other_field,
+    _label_field,
+    _other_field,
+    is_frame_field,
+    **kwargs,
+):
+    if other_field != label_field:
+        view = sample_collection.select_fields([label_field, other_field])
+    else:
+        view = sample_collection.select_fields(label_field)
+
+    max_ious1 = []
+    max_ious2 = []
+    label_ids1 = []
+    label_ids2 = []
+
+    for sample in view.iter_samples(progress=True):
+        if is_frame_field:
+            _max_ious1 = []
+            _max_ious2 = []
+            _label_ids1 = []
+            _label_ids2 = []
+            for frame in sample.frames.iter_frames():
+                iou1, iou2, id1, id2 = _compute_max_ious(
+                    frame, _label_field, _other_field, **kwargs
+                )
+                _max_ious1.append(iou1)
+                _max_ious2.append(iou2)
+                _label_ids1.append(id1)
+                _label_ids2.append(id2)
+
+            max_ious1.append(_max_ious1)
+            max_ious2.append(_max_ious2)
+            label_ids1.append(_label_ids1)
+            label_ids2.append(_label_ids2)
+        else:
+            iou1, iou2, id1, id2 = _compute_max_ious(
+                sample, _label_field, _other_field, **kwargs
+            )
+            max_ious1.append(iou1)
+            max_ious2.append(iou2)
+            label_ids1.append(id1)
+            label_ids2.append(id2)
+
+    return max_ious1, max_ious2, label_ids1, label_ids2
+
+
+def _compute_multi(
+    sample_collection,
+    fields,
+    keys,
+    is_frame_field,
+    fcn,
+    args,
+    kwargs,
+    num_workers,
+):
+    # Only the required label fields are loaded, as raw BSON, so that label
+    # objects are only ever constructed in the worker processes
+    docs = fou.load_raw_labels(sample_collection, fields)
+
+    # Results are generated in order, so they are aligned with `values()`
+    results = []
+    for _, batch_results in fou.map_batches(
+        _do_compute_batch,
+        docs,
+        num_workers,
+        max_batch_size=_MAX_BATCH_SIZE,
+        total=len(docs),
+        progress=True,
+        initializer=_init_worker,
+        initargs=(fcn, args, kwargs, keys),
+    ):
+        results.extend(batch_results)
+
+    if not is_frame_field:
+        results = [sample_results[0] for sample_results in results]
+
+    return results
+
+
+def _init_worker(fcn, args, kwargs, keys):
+    global _worker_args
+    _worker_args = (fcn, args, kwargs, keys)
+
+
+def _do_compute_batch(batch):
+    fcn, args, kwargs, keys = _worker_args
+
+    results = []
+    for sample_docs in batch:
+        sample_results = []
+        for doc_values in sample_docs:
+            doc = fou.parse_raw_labels(keys, doc_values)
+            sample_results.append(fcn(doc, *args, **kwargs))
+
+        results.append(sample_results)
+
+    return results
+
+
 def _compute_max_ious(doc, field1, field2, **kwargs):
     if field1 != field2:
         labels1 = _get_labels(doc, field1)
@@ -456,10 +600,10 @@ def _compute_bbox_ious(preds, gts, iscrowd=None, classwise=False):
         else:
             gts = _polylines_to_detections(gts)
 
-    if _get_bbox_dim(gts[0]) == 3:
-        bbox_iou_fcn = _compute_cuboid_iou
-    else:
-        bbox_iou_fcn = _compute_bbox_iou
+    if _get_bbox_dim(gts[0]) != 3:
+        return _compute_bbox_ious_2d(
+            preds, gts, gt_crowds, is_symmetric, classwise=classwise
+        )
 
     ious = np.zeros((len(preds), len(gts)))
 
@@ -473,13 +617,68 @@ def _compute_bbox_ious(preds, gts, iscrowd=None, classwise=False):
             elif classwise and pred.label != gt.label:
                 continue
             else:
-                iou = bbox_iou_fcn(gt, pred, gt_crowd=gt_crowd)
+                iou = _compute_cuboid_iou(gt, pred, gt_crowd=gt_crowd)
 
             ious[i, j] = iou
 
     return ious
 
 
+def _compute_bbox_ious_2d(
+    preds, gts, gt_crowds, is_symmetric, classwise=False
+):
+    # Vectorized equivalent of calling `_compute_bbox_iou()` on all pairs
+    pred_boxes = _to_bbox_array(preds)
+    if is_symmetric:
+        gt_boxes = pred_boxes
+    else:
+        gt_boxes = _to_bbox_array(gts)
+
+    px, py, pw, ph = (pred_boxes[:, i, np.newaxis] for i in range(4))
+    gx, gy, gw, gh = (gt_boxes[np.newaxis, :, i] for i in range(4))
+
+    pred_area = ph * pw
+    gt_area = gh * gw
+
+    # Width and height of intersections
+    w = np.minimum(px + pw, gx + gw) - np.maximum(px, gx)
+    h = np.minimum(py + ph, gy + gh) - np.maximum(py, gy)
+    inter = h * w
+
+    gt_crowds = np.asarray(gt_crowds, dtype=bool)[np.newaxis, :]
+    union = np.where(gt_crowds, pred_area, pred_area + gt_area - inter)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ious = np.where(union != 0, inter / union, 0.0)
+
+    ious = np.minimum(ious, 1)
+    ious[(w <= 0) | (h <= 0)] = 0
+
+    if classwise:
+        pred_labels = np.array([p.label for p in preds], dtype=object)
+        if is_symmetric:
+            gt_labels = pred_labels
+        else:
+            gt_labels = np.array([g.label for g in gts], dtype=object)
+
+        ious[pred_labels[:, np.newaxis] != gt_labels[np.newaxis, :]] = 0
+
+    if is_symmetric:
+        # Crowds make IoUs asymmetric, so mirror the lower triangle to match
+        # the behavior of the pairwise implementations
+        lower = np.tril(ious, k=-1)
+        ious = lower + lower.T
+        np.fill_diagonal(ious, 1)
+
+    return ious
+
+
+def _to_bbox_array(labels):
+    return np.array(
+        [label.bounding_box for label in labels], dtype=float
+    ).reshape(-1, 4)
+
+
 def _compute_polyline_ious(
     preds, gts, error_level, iscrowd=None, classwise=False, gt_crowds=None
 ):
@@ -517,45 +716,88 @@ def _compute_polyline_ious(
 
         ious = np.zeros((num_pred, num_gt))
 
-        for j, (gt_poly, gt_label, gt_area, gt_crowd) in enumerate(
-            zip(gt_polys, gt_labels, gt_areas, gt_crowds)
-        ):
-            for i, (pred_poly, pred_label, pred_area) in enumerate(
-                zip(pred_polys, pred_labels, pred_areas)
-            ):
-                if is_symmetric and i < j:
-                    iou = ious[j, i]
-                elif is_symmetric and i == j:
-                    iou = 1
-                elif classwise and pred_label != gt_label:
-                    continue
-                else:
-                    try:
-                        inter = gt_poly.intersection(pred_poly).area
-                    except Exception as e:
-                        inter = 0.0
-                        fou.handle_error(
-                            ValueError(
-                                "Failed to compute intersection of predicted "
-                                "object '%s' and ground truth object '%s'"
-                                % (preds[i].id, gts[j].id)
-                            ),
-                            error_level,
-                            base_error=e,
-                        )
-
-                    if gt_crowd:
-                        union = pred_area
-                    else:
-                        union = pred_area + gt_area - inter
+        if is_symmetric:
+            np.fill_diagonal(ious, 1)
 
-                    iou = min(etan.safe_divide(inter, union), 1)
+        # Only pairs whose envelopes intersect can have nonzero IoU
+        for i, j in _get_candidate_pairs(pred_polys, gt_polys):
+            if is_symmetric and i <= j:
+                continue
+
+            if classwise and pred_labels[i] != gt_labels[j]:
+                continue
+
+            try:
+                inter = gt_polys[j].intersection(pred_polys[i]).area
+            except Exception as e:
+                inter = 0.0
+                fou.handle_error(
+                    ValueError(
+                        "Failed to compute intersection of predicted object "
+                        "'%s' and ground truth object '%s'"
+                        % (preds[i].id, gts[j].id)
+                    ),
+                    error_level,
+                    base_error=e,
+                )
+
+            if gt_crowds[j]:
+                union = pred_areas[i]
+            else:
+                union = pred_areas[i] + gt_areas[j] - inter
 
-                ious[i, j] = iou
+            ious[i, j] = min(etan.safe_divide(inter, union), 1)
+
+            if is_symmetric:
+                ious[j, i] = ious[i, j]
 
         return ious
 
 
+def _get_candidate_pairs(pred_polys, gt_polys):
+    if _has_bulk_strtree():
+        # Shapely 2.x supports vectorized queries, which return a
+        # `2 x num_pairs` array of (pred, gt) indices
+        tree = sst.STRtree(gt_polys)
+        inds = tree.query(pred_polys)
+        return zip(inds[0].tolist(), inds[1].tolist())
+
+    pred_bounds = _get_bounds(pred_polys)
+    if pred_polys is gt_polys:
+        gt_bounds = pred_bounds
+    else:
+        gt_bounds = _get_bounds(gt_polys)
+
+    # Comparisons involving the NaN bounds of empty geometries are False
+    px1, py1, px2, py2 = (pred_bounds[:, i, np.newaxis] for i in range(4))
+    gx1, gy1, gx2, gy2 = (gt_bounds[np.newaxis, :, i] for i in range(4))
+    overlaps = (px1 <= gx2) & (gx1 <= px2) & (py1 <= gy2) & (gy1 <= py2)
+
+    inds1, inds2 = np.nonzero(overlaps)
+    return zip(inds1.tolist(), inds2.tolist())
+
+
+def _get_bounds(polys):
+    bounds = np.full((len(polys), 4), np.nan)
+    for idx, poly in enumerate(polys):
+        if not poly.is_empty:
+            bounds[idx] = poly.bounds
+
+    return bounds
+
+
+_HAS_BULK_STRTREE = None
+
+
+def _has_bulk_strtree():
+    global _HAS_BULK_STRTREE
+
+    if _HAS_BULK_STRTREE is None:
+        _HAS_BULK_STRTREE = fou.ensure_import("shapely>=2", error_level=2)
+
+    return _HAS_BULK_STRTREE
+
+
 def _compute_mask_ious(
     preds, gts, tolerance, error_level, iscrowd=None, classwise=False
 ):
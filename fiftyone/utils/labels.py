@@ -5,6 +5,8 @@ Label utilities.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import multiprocessing
+
 import eta.core.utils as etau
 
 import fiftyone.core.labels as fol
@@ -12,6 +14,9 @@ import fiftyone.core.utils as fou
 import fiftyone.core.validation as fov
 
 
+_BATCH_SIZE = 1000
+
+
 def objects_to_segmentations(
     sample_collection,
     in_field,
@@ -23,6 +28,7 @@ def objects_to_segmentations(
     rel_dir=None,
     overwrite=False,
     save_mask_targets=False,
+    num_workers=None,
 ):
     """Converts the instance segmentations or polylines in the specified field
     of the collection into semantic segmentation masks.
@@ -61,6 +67,8 @@ def objects_to_segmentations(
             if it exists
         save_mask_targets (False): whether to store the ``mask_targets`` on the
             dataset
+        num_workers (None): the number of processes to use to render masks.
+            By default, ``multiprocessing.cpu_count()`` is used
     """
     fov.validate_collection_label_fields(
         sample_collection,
@@ -71,10 +79,6 @@ def objects_to_segmentations(
     if mask_size is None:
         sample_collection.compute_metadata()
 
-    samples = sample_collection.select_fields(in_field)
-    in_field, processing_frames = samples._handle_frame_field(in_field)
-    out_field, _ = samples._handle_frame_field(out_field)
-
     if overwrite and output_dir is not None:
         etau.delete_dir(output_dir)
 
@@ -83,12 +87,9 @@ def objects_to_segmentations(
             output_dir=output_dir, rel_dir=rel_dir, idempotent=False
         )
 
-    for sample in samples.iter_samples(autosave=True, progress=True):
-        if processing_frames:
-            images = sample.frames.values()
-        else:
-            images = [sample]
+    processing_frames = sample_collection._is_frame_field(in_field)
 
+    def get_args(sample, image):
         if mask_size is not None:
             frame_size = mask_size
         elif processing_frames:
@@ -99,41 +100,27 @@ def objects_to_segmentations(
         else:
             frame_size = (sample.metadata.width, sample.metadata.height)
 
-        for image in images:
-            label = image[in_field]
-            if label is None:
-                continue
-
-            segmentation = None
-
-            if isinstance(label, fol.Polyline):
-                label = fol.Polylines(polylines=[label])
-
-            if isinstance(label, fol.Detection):
-                label = fol.Detections(detections=[label])
-
-            if isinstance(label, fol.Polylines):
-                segmentation = label.to_segmentation(
-                    frame_size=frame_size,
-                    mask_targets=mask_targets,
-                    thickness=thickness,
-                )
-
-            if isinstance(label, fol.Detections):
-                segmentation = label.to_segmentation(
-                    frame_size=frame_size,
-                    mask_targets=mask_targets,
-                )
+        if output_dir is not None:
+            mask_path = filename_maker.get_output_path(
+                image.filepath, output_ext=".png"
+            )
+        else:
+            mask_path = None
 
-            if output_dir is not None:
-                mask_path = filename_maker.get_output_path(
-                    image.filepath, output_ext=".png"
-                )
-                segmentation.export_mask(mask_path, update=True)
+        return frame_size, mask_path
 
-            image[out_field] = segmentation
+    _map_labels(
+        sample_collection,
+        in_field,
+        out_field,
+        _to_segmentation,
+        kwargs=dict(mask_targets=mask_targets, thickness=thickness),
+        get_args=get_args,
+        num_workers=num_workers,
+    )
 
     if save_mask_targets and mask_targets is not None:
+        out_field, _ = sample_collection._handle_frame_field(out_field)
         if not sample_collection.default_mask_targets:
             sample_collection.default_mask_targets = mask_targets
         else:
@@ -365,6 +352,7 @@ def segmentations_to_detections(
     out_field,
     mask_targets=None,
     mask_types="stuff",
+    num_workers=None,
 ):
     """Converts the semantic segmentations masks in the specified field of the
     collection into :class:`fiftyone.core.labels.Detections` with instance
@@ -398,6 +386,8 @@ def segmentations_to_detections(
             -   ``"thing"`` if all classes are thing classes
             -   a dict mapping pixel values (2D masks) or RGB hex strings (3D
                 masks) to ``"stuff"`` or ``"thing"`` for each class
+        num_workers (None): the number of processes to use. By default,
+            ``multiprocessing.cpu_count()`` is used
     """
     fov.validate_collection_label_fields(
         sample_collection,
@@ -405,28 +395,23 @@ def segmentations_to_detections(
         fol.Segmentation,
     )
 
-    samples = sample_collection.select_fields(in_field)
-    in_field, processing_frames = samples._handle_frame_field(in_field)
-    out_field, _ = samples._handle_frame_field(out_field)
-
-    for sample in samples.iter_samples(autosave=True, progress=True):
-        if processing_frames:
-            images = sample.frames.values()
-        else:
-            images = [sample]
-
-        for image in images:
-            label = image[in_field]
-            if label is None:
-                continue
-
-            image[out_field] = label.to_detections(
-                mask_targets=mask_targets, mask_types=mask_types
-            )
+    _map_labels(
+        sample_collection,
+        in_field,
+        out_field,
+        _to_detections,
+        kwargs=dict(mask_targets=mask_targets, mask_types=mask_types),
+        num_workers=num_workers,
+    )
 
 
 def instances_to_polylines(
-    sample_collection, in_field, out_field, tolerance=2, filled=True
+    sample_collection,
+    in_field,
+    out_field,
+    tolerance=2,
+    filled=True,
+    num_workers=None,
 ):
     """Converts the instance segmentations in the specified field of the
     collection into :class:`fiftyone.core.labels.Polylines` instances.
@@ -445,6 +430,8 @@ def instances_to_polylines(
         tolerance (2): a tolerance, in pixels, when generating approximate
             polylines for each region. Typical values are 1-3 pixels
         filled (True): whether the polylines should be filled
+        num_workers (None): the number of processes to use. By default,
+            ``multiprocessing.cpu_count()`` is used
     """
     fov.validate_collection_label_fields(
         sample_collection,
@@ -452,24 +439,14 @@ def instances_to_polylines(
         fol.Detections,
     )
 
-    samples = sample_collection.select_fields(in_field)
-    in_field, processing_frames = samples._handle_frame_field(in_field)
-    out_field, _ = samples._handle_frame_field(out_field)
-
-    for sample in samples.iter_samples(autosave=True, progress=True):
-        if processing_frames:
-            images = sample.frames.values()
-        else:
-            images = [sample]
-
-        for image in images:
-            label = image[in_field]
-            if label is None:
-                continue
-
-            image[out_field] = label.to_polylines(
-                tolerance=tolerance, filled=filled
-            )
+    _map_labels(
+        sample_collection,
+        in_field,
+        out_field,
+        _to_polylines,
+        kwargs=dict(tolerance=tolerance, filled=filled),
+        num_workers=num_workers,
+    )
 
 
 def segmentations_to_polylines(
@@ -479,6 +456,7 @@ def segmentations_to_polylines(
     mask_targets=None,
     mask_types="stuff",
     tolerance=2,
+    num_workers=None,
 ):
     """Converts the semantic segmentations masks in the specified field of the
     collection into :class:`fiftyone.core.labels.Polylines` instances.
@@ -513,6 +491,8 @@ def segmentations_to_polylines(
                 masks) to ``"stuff"`` or ``"thing"`` for each class
         tolerance (2): a tolerance, in pixels, when generating approximate
                 polylines for each region. Typical values are 1-3 pixels
+        num_workers (None): the number of processes to use. By default,
+            ``multiprocessing.cpu_count()`` is used
     """
     fov.validate_collection_label_fields(
         sample_collection,
@@ -520,26 +500,18 @@ def segmentations_to_polylines(
         fol.Segmentation,
     )
 
-    samples = sample_collection.select_fields(in_field)
-    in_field, processing_frames = samples._handle_frame_field(in_field)
-    out_field, _ = samples._handle_frame_field(out_field)
-
-    for sample in samples.iter_samples(autosave=True, progress=True):
-        if processing_frames:
-            images = sample.frames.values()
-        else:
-            images = [sample]
-
-        for image in images:
-            label = image[in_field]
-            if label is None:
-                continue
-
-            image[out_field] = label.to_polylines(
-                mask_targets=mask_targets,
-                mask_types=mask_types,
-                tolerance=tolerance,
-            )
+    _map_labels(
+        sample_collection,
+        in_field,
+        out_field,
+        _to_polylines,
+        kwargs=dict(
+            mask_targets=mask_targets,
+            mask_types=mask_types,
+            tolerance=tolerance,
+        ),
+        num_workers=num_workers,
+    )
 
 
 def classification_to_detections(sample_collection, in_field, out_field):
@@ -628,3 +600,154 @@ def classifications_to_detections(sample_collection, in_field, out_field):
                 detections.append(detection)
 
             image[out_field] = fol.Detections(detections=detections)
+
+
+def _to_segmentation(
+    label, frame_size, mask_path, mask_targets=None, thickness=1
+):
+    if isinstance(label, fol.Polyline):
+        label = fol.Polylines(polylines=[label])
+
+    if isinstance(label, fol.Detection):
+        label = fol.Detections(detections=[label])
+
+    if isinstance(label, fol.Polylines):
+        segmentation = label.to_segmentation(
+            frame_size=frame_size,
+            mask_targets=mask_targets,
+            thickness=thickness,
+        )
+    else:
+        segmentation = label.to_segmentation(
+            frame_size=frame_size,
+            mask_targets=mask_targets,
+        )
+
+    if mask_path is not None:
+        segmentation.export_mask(mask_path, update=True)
+
+    return segmentation
+
+
+def _to_detections(label, **kwargs):
+    return label.to_detections(**kwargs)
+
+
+def _to_polylines(label, **kwargs):
+    return label.to_polylines(**kwargs)
+
+
+def _map_labels(
+    sample_collection,
+    in_field,
+    out_field,
+    map_fcn,
+    kwargs=None,
+    get_args=None,
+    num_workers=None,
+    batch_size=None,
+):
+    """Applies ``map_fcn(label, *args, **kwargs)`` to each non-None label in
+    the ``in_field`` of the collection and stores the outputs in
+    ``out_field``.
+
+    Only ``in_field`` is loaded from the database, and the outputs are written
+    back in batches via
+    :meth:`fiftyone.core.collections.SampleCollection.set_values`. When
+    multiple workers are used, ``map_fcn`` must be picklable, and the next
+    batches are read while earlier batches are processed by the pool.
+    """
+    if kwargs is None:
+        kwargs = {}
+
+    if num_workers is None:
+        num_workers = multiprocessing.cpu_count()
+
+    if batch_size is None:
+        batch_size = _BATCH_SIZE
+
+    samples = sample_collection.select_fields(in_field)
+    in_field, processing_frames = samples._handle_frame_field(in_field)
+    out_field, _ = samples._handle_frame_field(out_field)
+
+    if processing_frames:
+        out_path = samples._FRAMES_PREFIX + out_field
+    else:
+        out_path = out_field
+
+    tasks = _iter_label_tasks(samples, in_field, processing_frames, get_args)
+
+    if num_workers <= 1:
+        for batch in fou.iter_batches(tasks, batch_size):
+            results = [map_fcn(t[2], *t[3], **kwargs) for t in batch]
+            _write_labels(sample_collection, out_path, batch, results)
+
+        return
+
+    # Labels are sent to the workers as dicts. Batches are split across the
+    # workers so that roughly two batches' worth of labels are in flight
+    batch_size = max(1, batch_size // num_workers)
+    tasks = (
+        (sample_id, frame_number, label.to_dict(), args)
+        for sample_id, frame_number, label, args in tasks
+    )
+
+    for batch, result in fou.map_batches(
+        _do_map,
+        tasks,
+        num_workers,
+        batch_size=batch_size,
+        initializer=_init_worker,
+        initargs=(map_fcn, kwargs),
+    ):
+        results = [fol.Label.from_dict(d) for d in result]
+        _write_labels(sample_collection, out_path, batch, results)
+
+
+def _iter_label_tasks(samples, in_field, processing_frames, get_args):
+    for sample in samples.iter_samples(progress=True):
+        if processing_frames:
+            images = sample.frames.items()
+        else:
+            images = [(None, sample)]
+
+        for frame_number, image in images:
+            label = image[in_field]
+            if label is None:
+                continue
+
+            if get_args is not None:
+                args = get_args(sample, image)
+            else:
+                args = ()
+
+            yield sample.id, frame_number, label, args
+
+
+def _init_worker(map_fcn, kwargs):
+    global _worker_map_fcn
+    global _worker_kwargs
+
+    _worker_map_fcn = map_fcn
+    _worker_kwargs = kwargs
+
+
+def _do_map(batch):
+    results = []
+    for _, _, label_dict, args in batch:
+        label = fol.Label.from_dict(label_dict)
+        result = _worker_map_fcn(label, *args, **_worker_kwargs)
+        results.append(result.to_dict())
+
+    return results
+
+
+def _write_labels(sample_collection, out_path, batch, results):
+    values = {}
+    for (sample_id, frame_number, _, _), label in zip(batch, results):
+        if frame_number is not None:
+            values.setdefault(sample_id, {})[frame_number] = label
+        else:
+            values[sample_id] = label
+
+    sample_collection.set_values(out_path, values, key_field="id")
@@ -9,6 +9,7 @@ import contextlib
 import logging
 import multiprocessing
 import os
+import queue
 import warnings
 
 import cv2
@@ -16,6 +17,7 @@ import numpy as np
 from skimage.color import rgba2rgb
 
 import eta.core.image as etai
+import eta.core.serial as etas
 import eta.core.utils as etau
 
 import fiftyone as fo
@@ -30,6 +32,8 @@ import tensorflow as tf
 
 logger = logging.getLogger(__name__)
 
+_QUEUE_SIZE = 64
+
 
 def from_images_dir(
     images_dir, recursive=True, force_rgb=False, num_parallel_calls=None
@@ -244,16 +248,10 @@ class TFRecordsWriter(object):
 
         etau.ensure_basedir(self.tf_records_path)
 
-        if self.num_shards:
-            self._num_shards = self.num_shards
-            tf_records_patt = self.tf_records_path + "-%05d-of-%05d"
-            tf_records_paths = [
-                tf_records_patt % (i, self.num_shards)
-                for i in range(self.num_shards)
-            ]
-        else:
-            self._num_shards = 1
-            tf_records_paths = [self.tf_records_path]
+        tf_records_paths = _get_tf_records_paths(
+            self.tf_records_path, self.num_shards
+        )
+        self._num_shards = len(tf_records_paths)
 
         self._writers_context = contextlib.ExitStack()
         c = self._writers_context.__enter__()
@@ -280,6 +278,145 @@ class TFRecordsWriter(object):
         )
 
 
+class _ParallelTFRecordsWriter(object):
+    """Class for generating and writing ``tf.train.Example`` protos to sharded
+    TFRecords in a pool of worker processes.
+
+    Records are assigned to shards via the same round robin strategy as
+    :class:`TFRecordsWriter`, and shard ``i`` is written by worker
+    ``i % num_workers``, so the contents of each shard do not depend on the
+    number of workers.
+
+    Args:
+        tf_records_path: the path to write the ``.tfrecords`` files.
+            ``-%%05d-of-%%05d`` is appended to the path
+        example_generator: the :class:`TFExampleGenerator` to use
+        num_shards: the number of shards to split the records into
+        num_workers: the number of worker processes to use
+    """
+
+    def __init__(
+        self, tf_records_path, example_generator, num_shards, num_workers
+    ):
+        self.tf_records_path = tf_records_path
+        self.example_generator = example_generator
+        self.num_shards = num_shards
+        self.num_workers = num_workers
+
+        self._idx = None
+        self._queues = None
+        self._workers = None
+        self._classes = None
+        self._num_classes_sent = None
+
+    def __enter__(self):
+        self._idx = -1
+
+        etau.ensure_basedir(self.tf_records_path)
+
+        tf_records_paths = _get_tf_records_paths(
+            self.tf_records_path, self.num_shards
+        )
+        num_workers = min(self.num_workers, self.num_shards)
+
+        ctx = fou.get_multiprocessing_context()
+
+        self._queues = []
+        self._workers = []
+        for worker_idx in range(num_workers):
+            shard_paths = {
+                shard_idx: path
+                for shard_idx, path in enumerate(tf_records_paths)
+                if shard_idx % num_workers == worker_idx
+            }
+            _queue = ctx.Queue(maxsize=_QUEUE_SIZE)
+            worker = ctx.Process(
+                target=_write_tf_records_shards,
+                args=(shard_paths, self.example_generator, _queue),
+                daemon=True,
+            )
+            worker.start()
+
+            self._queues.append(_queue)
+            self._workers.append(worker)
+
+        if _has_dynamic_classes(self.example_generator):
+            self._classes = {}
+            self._num_classes_sent = [0] * num_workers
+
+        return self
+
+    def __exit__(self, *args):
+        if args and args[0] is not None:
+            for worker in self._workers:
+                worker.terminate()
+
+            return
+
+        for worker_idx in range(len(self._workers)):
+            self._put(worker_idx, None)
+
+        for worker in self._workers:
+            worker.join()
+
+        num_failed = sum(w.exitcode != 0 for w in self._workers)
+        if num_failed:
+            raise RuntimeError(
+                "%d worker(s) failed to write TFRecords to '%s'"
+                % (num_failed, self.tf_records_path)
+            )
+
+    def write(self, image_or_path, label, filename=None):
+        """Generates and writes a ``tf.train.Example`` proto for the given
+        data.
+
+        Args:
+            image_or_path: an image or the path to the image on disk
+            label: a :class:`fiftyone.core.labels.Label`, or ``None``
+            filename (None): an optional filename for the image
+        """
+        self._idx += 1
+        shard_idx = self._idx % self.num_shards
+        worker_idx = shard_idx % len(self._workers)
+
+        if label is not None:
+            new_classes = self._get_new_classes(worker_idx, label)
+            label = label.to_dict()
+        else:
+            new_classes = None
+
+        task = (shard_idx, image_or_path, label, filename, new_classes)
+        self._put(worker_idx, task)
+
+    def _get_new_classes(self, worker_idx, detections):
+        # Dynamic class IDs are assigned here, in sample order, so that they
+        # match the IDs that a serial export would have assigned
+        if self._classes is None:
+            return None
+
+        for detection in detections.detections:
+            if detection.label not in self._classes:
+                self._classes[detection.label] = len(self._classes)
+
+        classes = list(self._classes.keys())
+        new_classes = classes[self._num_classes_sent[worker_idx] :]
+        self._num_classes_sent[worker_idx] = len(classes)
+
+        return new_classes
+
+    def _put(self, worker_idx, task):
+        while True:
+            try:
+                self._queues[worker_idx].put(task, timeout=1)
+                return
+            except queue.Full:
+                if not self._workers[worker_idx].is_alive():
+                    raise RuntimeError(
+                        "Worker %d failed to write TFRecords to '%s'"
+                        % (worker_idx, self.tf_records_path)
+                    )
+
+
 class TFRecordSampleParser(foud.LabeledImageSampleParser):
     """Base class for sample parsers that ingest ``tf.train.Example`` protos
     containing labeled images.
@@ -716,6 +853,17 @@ class TFRecordsDatasetExporter(
             images to disk. By default, ``fiftyone.config.default_image_ext``
             is used
         force_rgb (False): whether to force convert all images to RGB
+        num_workers (None): an optional number of worker processes to use to
+            generate and write the records. Each worker writes one or more
+            whole shards, and the contents of each shard are the same for any
+            number of workers. If ``num_shards`` is not provided, one shard
+            per worker is written. By default, all records are generated in
+            the main process
+        index_path (None): an optional path to write a JSON index that lists
+            the record files and the number of records in each. Can be a
+            filename relative to ``export_dir`` or an absolute path. The
+            filename should not match the glob pattern used to load the
+            records, which is ``*record*`` by default
     """
 
     def __init__(
@@ -725,6 +873,8 @@ class TFRecordsDatasetExporter(
         num_shards=None,
         image_format=None,
         force_rgb=False,
+        num_workers=None,
+        index_path=None,
     ):
         tf_records_path = self._parse_labels_path(
             export_dir=export_dir,
@@ -732,6 +882,11 @@ class TFRecordsDatasetExporter(
             default="tf.records",
         )
 
+        if index_path is not None:
+            index_path = self._parse_labels_path(
+                export_dir=export_dir, labels_path=index_path
+            )
+
         if image_format is None:
             image_format = fo.config.default_image_ext
 
@@ -741,10 +896,14 @@ class TFRecordsDatasetExporter(
         self.num_shards = num_shards
         self.image_format = image_format
         self.force_rgb = force_rgb
+        self.num_workers = num_workers
+        self.index_path = index_path
 
         self._example_generator = None
         self._filename_maker = None
         self._tf_records_writer = None
+        self._parallel = None
+        self._num_records = None
 
     @property
     def requires_image_metadata(self):
@@ -755,9 +914,21 @@ class TFRecordsDatasetExporter(
         self._filename_maker = fou.UniqueFilenameMaker(
             default_ext=self.image_format
         )
-        self._tf_records_writer = TFRecordsWriter(
-            self.tf_records_path, num_shards=self.num_shards
-        )
+        self._parallel = self.num_workers is not None and self.num_workers > 1
+        self._num_records = 0
+
+        if self._parallel:
+            self._tf_records_writer = _ParallelTFRecordsWriter(
+                self.tf_records_path,
+                self._example_generator,
+                self.num_shards or self.num_workers,
+                self.num_workers,
+            )
+        else:
+            self._tf_records_writer = TFRecordsWriter(
+                self.tf_records_path, num_shards=self.num_shards
+            )
+
         self._tf_records_writer.__enter__()
 
     def export_sample(self, image_or_path, label, metadata=None):
@@ -766,14 +937,34 @@ class TFRecordsDatasetExporter(
         else:
             filename = self._filename_maker.get_output_path()
 
-        tf_example = self._example_generator.make_tf_example(
-            image_or_path, label, filename=filename
-        )
-        self._tf_records_writer.write(tf_example)
+        if self._parallel:
+            self._tf_records_writer.write(
+                image_or_path, label, filename=filename
+            )
+        else:
+            tf_example = self._example_generator.make_tf_example(
+                image_or_path, label, filename=filename
+            )
+            self._tf_records_writer.write(tf_example)
+
+        self._num_records += 1
 
     def close(self, *args):
         self._tf_records_writer.__exit__(*args)
 
+        if self.index_path is not None:
+            if self._parallel:
+                num_shards = self.num_shards or self.num_workers
+            else:
+                num_shards = self.num_shards
+
+            _write_tf_records_index(
+                self.index_path,
+                self.tf_records_path,
+                num_shards,
+                self._num_records,
+            )
+
     def _make_example_generator(self):
         """Returns a :class:`TFExampleGenerator` instance that will generate
         ``tf.train.Example`` protos for this exporter.
@@ -810,6 +1001,17 @@ class TFImageClassificationDatasetExporter(TFRecordsDatasetExporter):
             images to disk. By default, ``fiftyone.config.default_image_ext``
             is used
         force_rgb (False): whether to force convert all images to RGB
+        num_workers (None): an optional number of worker processes to use to
+            generate and write the records. Each worker writes one or more
+            whole shards, and the contents of each shard are the same for any
+            number of workers. If ``num_shards`` is not provided, one shard
+            per worker is written. By default, all records are generated in
+            the main process
+        index_path (None): an optional path to write a JSON index that lists
+            the record files and the number of records in each. Can be a
+            filename relative to ``export_dir`` or an absolute path. The
+            filename should not match the glob pattern used to load the
+            records, which is ``*record*`` by default
     """
 
     @property
@@ -847,6 +1049,17 @@ class TFObjectDetectionDatasetExporter(TFRecordsDatasetExporter):
             is used
         force_rgb (False): whether to force convert all images to RGB
         classes (None): the list of possible class labels
+        num_workers (None): an optional number of worker processes to use to
+            generate and write the records. Each worker writes one or more
+            whole shards, and the contents of each shard are the same for any
+            number of workers. If ``num_shards`` is not provided, one shard
+            per worker is written. By default, all records are generated in
+            the main process
+        index_path (None): an optional path to write a JSON index that lists
+            the record files and the number of records in each. Can be a
+            filename relative to ``export_dir`` or an absolute path. The
+            filename should not match the glob pattern used to load the
+            records, which is ``*record*`` by default
     """
 
     def __init__(
@@ -857,6 +1070,8 @@ class TFObjectDetectionDatasetExporter(TFRecordsDatasetExporter):
         image_format=None,
         force_rgb=False,
         classes=None,
+        num_workers=None,
+        index_path=None,
     ):
         super().__init__(
             export_dir=export_dir,
@@ -864,6 +1079,8 @@ class TFObjectDetectionDatasetExporter(TFRecordsDatasetExporter):
             num_shards=num_shards,
             image_format=image_format,
             force_rgb=force_rgb,
+            num_workers=num_workers,
+            index_path=index_path,
         )
 
         self.classes = classes
@@ -1100,6 +1317,70 @@ class TFObjectDetectionExampleGenerator(TFExampleGenerator):
         return tf.train.Example(features=tf.train.Features(feature=feature))
 
 
+def _get_tf_records_paths(tf_records_path, num_shards):
+    if not num_shards:
+        return [tf_records_path]
+
+    tf_records_patt = tf_records_path + "-%05d-of-%05d"
+    return [tf_records_patt % (i, num_shards) for i in range(num_shards)]
+
+
+def _write_tf_records_index(
+    index_path, tf_records_path, num_shards, num_records
+):
+    tf_records_paths = _get_tf_records_paths(tf_records_path, num_shards)
+    num_shards = len(tf_records_paths)
+
+    index_dir = os.path.dirname(index_path)
+    shards = []
+    for idx, path in enumerate(tf_records_paths):
+        shards.append(
+            {
+                "path": os.path.relpath(path, index_dir),
+                "num_records": (num_records // num_shards)
+                + int(idx < num_records % num_shards),
+            }
+        )
+
+    index = {"num_records": num_records, "shards": shards}
+    etas.write_json(index, index_path, pretty_print=True)
+
+
+def _has_dynamic_classes(example_generator):
+    return (
+        isinstance(example_generator, TFObjectDetectionExampleGenerator)
+        and example_generator._dynamic_classes
+    )
+
+
+def _write_tf_records_shards(shard_paths, example_generator, task_queue):
+    with contextlib.ExitStack() as context:
+        writers = {
+            shard_idx: context.enter_context(tf.io.TFRecordWriter(path))
+            for shard_idx, path in shard_paths.items()
+        }
+
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+
+            shard_idx, image_or_path, label, filename, new_classes = task
+
+            if new_classes:
+                labels_map_rev = example_generator._labels_map_rev
+                for text in new_classes:
+                    labels_map_rev[text] = len(labels_map_rev)
+
+            if label is not None:
+                label = fol.Label.from_dict(label)
+
+            tf_example = example_generator.make_tf_example(
+                image_or_path, label, filename=filename
+            )
+            writers[shard_idx].write(tf_example.SerializeToString())
+
+
 def _get_classes_for_detections(samples, label_field):
     classes = set()
     for sample in samples:
@@ -7,6 +7,7 @@
 """
 import itertools
 import logging
+import multiprocessing
 import warnings
 
 import numpy as np
@@ -95,6 +96,8 @@ _POINT_IN_FRONT_OF_PLANE = 1
 _POINT_ON_PLANE = 0
 _POINT_BEHIND_PLANE = -1
 
+_WRITE_BATCH_SIZE = 1000
+
 
 # References
 # https://github.com/google-research-datasets/Objectron/blob/master/objectron/dataset/box.py
@@ -446,6 +449,7 @@ def compute_orthographic_projection_images(
     subsampling_rate=None,
     projection_normal=None,
     bounds=None,
+    num_workers=None,
 ):
     """Computes orthographic projection images for the point clouds in the
     given collection.
@@ -509,6 +513,8 @@ def compute_orthographic_projection_images(
             to generate each map. Either element of the tuple or any/all of its
             values can be None, in which case a tight crop of the point cloud
             along the missing dimension(s) are used
+        num_workers (None): the number of processes to use. By default,
+            ``multiprocessing.cpu_count()`` is used
     """
     if in_group_slice is None and samples.media_type == fom.GROUP:
         in_group_slice = _get_point_cloud_slice(samples)
@@ -520,54 +526,72 @@ def compute_orthographic_projection_images(
         point_cloud_view = samples.select_group_slices(in_group_slice)
         fov.validate_collection(point_cloud_view, media_type=fom.POINT_CLOUD)
 
-        filepaths, groups = point_cloud_view.values(["filepath", group_field])
+        sample_ids, filepaths, groups = point_cloud_view.values(
+            ["id", "filepath", group_field]
+        )
     else:
         fov.validate_collection(samples, media_type=fom.POINT_CLOUD)
         point_cloud_view = samples
+        group_field = None
 
-        filepaths = point_cloud_view.values("filepath")
+        sample_ids, filepaths = point_cloud_view.values(["id", "filepath"])
         groups = itertools.repeat(None)
 
     filename_maker = fou.UniqueFilenameMaker(
         output_dir=output_dir, rel_dir=rel_dir
     )
+    image_paths = [
+        filename_maker.get_output_path(filepath, output_ext=".png")
+        for filepath in filepaths
+    ]
 
-    if out_group_slice is not None:
-        out_samples = []
-
-    all_metadata = []
-
-    with fou.ProgressBar(total=len(filepaths)) as pb:
-        for filepath, group in pb(zip(filepaths, groups)):
-            image_path = filename_maker.get_output_path(
-                filepath, output_ext=".png"
-            )
-
-            img, metadata = compute_orthographic_projection_image(
-                filepath,
-                size,
-                shading_mode=shading_mode,
-                colormap=colormap,
-                subsampling_rate=subsampling_rate,
-                projection_normal=projection_normal,
-                bounds=bounds,
-            )
+    kwargs = dict(
+        size=size,
+        shading_mode=shading_mode,
+        colormap=colormap,
+        subsampling_rate=subsampling_rate,
+        projection_normal=projection_normal,
+        bounds=bounds,
+    )
+    inputs = list(zip(filepaths, image_paths))
 
-            etai.write(img, image_path)
-            metadata.filepath = image_path
+    if num_workers is None:
+        num_workers = multiprocessing.cpu_count()
 
-            if out_group_slice is not None:
-                sample = Sample(filepath=image_path)
-                sample[group_field] = group.element(out_group_slice)
-                sample[metadata_field] = metadata
-                out_samples.append(sample)
+    num_workers = min(num_workers, len(inputs))
 
-            all_metadata.append(metadata)
+    writer = _ProjectionWriter(
+        samples,
+        point_cloud_view,
+        metadata_field,
+        group_field=group_field,
+        out_group_slice=out_group_slice,
+    )
 
-    if out_group_slice is not None:
-        samples.add_samples(out_samples)
+    with writer, fou.ProgressBar(total=len(inputs)) as pb:
+        if num_workers <= 1:
+            results = (_project(*args, kwargs) for args in inputs)
+        else:
+            ctx = fou.get_multiprocessing_context()
+            pool = ctx.Pool(
+                processes=num_workers,
+                initializer=_init_worker,
+                initargs=(kwargs,),
+            )
+            chunksize = max(1, min(len(inputs) // (4 * num_workers), 16))
+            results = map(
+                OrthographicProjectionMetadata.from_dict,
+                pool.imap(_do_project, inputs, chunksize=chunksize),
+            )
 
-    point_cloud_view.set_values(metadata_field, all_metadata)
+        try:
+            for sample_id, group, metadata in pb(
+                zip(sample_ids, groups, results)
+            ):
+                writer.add(sample_id, group, metadata)
+        finally:
+            if num_workers > 1:
+                pool.terminate()
 
 
 def compute_orthographic_projection_image(
@@ -662,10 +686,7 @@ def compute_orthographic_projection_image(
             )
 
             # map intensity value to RGB
-            rgb_refs = _clamp_to_discrete(
-                intensities_normalized_t, list(colormap.keys())
-            )
-            rgbs = np.array([colormap[v] for v in rgb_refs])
+            rgbs = _map_to_colormap(intensities_normalized_t, colormap)
             image[np.int_(points[:, 0]), np.int_(points[:, 1]), :] = rgbs
     elif shading_mode == "height":
         # color by height (z)
@@ -674,8 +695,7 @@ def compute_orthographic_projection_image(
         z_normalized = (points[:, 2] - min_z) / (max_z - min_z)
 
         # map z value to color
-        rgb_refs = _clamp_to_discrete(z_normalized, list(colormap.keys()))
-        rgbs = np.array([colormap[v] for v in rgb_refs])
+        rgbs = _map_to_colormap(z_normalized, colormap)
         image[np.int_(points[:, 0]), np.int_(points[:, 1]), :] = rgbs
     else:
         image[np.int_(points[:, 0]), np.int_(points[:, 1]), :] = 255.0
@@ -686,6 +706,81 @@ def compute_orthographic_projection_image(
     return image, metadata
 
 
+class _ProjectionWriter(object):
+    """Context manager that writes projection metadata and any new group
+    slice samples to the database in batches.
+    """
+
+    def __init__(
+        self,
+        samples,
+        point_cloud_view,
+        metadata_field,
+        group_field=None,
+        out_group_slice=None,
+        batch_size=None,
+    ):
+        if batch_size is None:
+            batch_size = _WRITE_BATCH_SIZE
+
+        self.samples = samples
+        self.point_cloud_view = point_cloud_view
+        self.metadata_field = metadata_field
+        self.group_field = group_field
+        self.out_group_slice = out_group_slice
+        self.batch_size = batch_size
+
+        self._metadata = {}
+        self._out_samples = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.flush()
+
+    def add(self, sample_id, group, metadata):
+        if self.out_group_slice is not None:
+            sample = Sample(filepath=metadata.filepath)
+            sample[self.group_field] = group.element(self.out_group_slice)
+            sample[self.metadata_field] = metadata
+            self._out_samples.append(sample)
+
+        self._metadata[sample_id] = metadata
+        if len(self._metadata) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self._out_samples:
+            self.samples.add_samples(self._out_samples)
+            self._out_samples = []
+
+        if self._metadata:
+            self.point_cloud_view.set_values(
+                self.metadata_field, self._metadata, key_field="id"
+            )
+            self._metadata = {}
+
+
+def _init_worker(kwargs):
+    global _worker_kwargs
+    _worker_kwargs = kwargs
+
+
+def _do_project(args):
+    filepath, image_path = args
+    return _project(filepath, image_path, _worker_kwargs).to_dict()
+
+
+def _project(filepath, image_path, kwargs):
+    img, metadata = compute_orthographic_projection_image(filepath, **kwargs)
+
+    etai.write(img, image_path)
+    metadata.filepath = image_path
+
+    return metadata
+
+
 def _parse_point_cloud(
     filepath,
     size=None,
@@ -761,13 +856,14 @@ def _get_point_cloud_slice(samples):
     return slice_name
 
 
-def _clamp_to_discrete(arr, discrete):
-    """Discretize by mapping each continuous value in ``arr`` to the closest
-    value in ``discrete``.
+def _map_to_colormap(arr, colormap):
+    """Maps each value in ``arr`` to the color of the closest value in
+    ``colormap``.
     """
-    clamp_list = np.sort(np.array(discrete))
-    idx = np.searchsorted(clamp_list, arr - 1e-8)
-    return clamp_list[np.clip(idx, 0, len(clamp_list) - 1)]
+    keys = np.sort(np.array(list(colormap.keys())))
+    colors = np.array([colormap[k] for k in keys])
+    idx = np.searchsorted(keys, arr - 1e-8)
+    return colors[np.clip(idx, 0, len(keys) - 1)]
 
 
 # Reference: https://math.stackexchange.com/q/180418
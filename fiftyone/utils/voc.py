@@ -129,6 +129,9 @@ class VOCDetectionDatasetImporter(
     def __len__(self):
         return self._num_samples
 
+    def _set_shard(self, start, stop):
+        self._uuids = self._uuids[start:stop]
+
     def __next__(self):
         uuid = next(self._iter_uuids)
 
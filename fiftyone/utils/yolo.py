@@ -267,6 +267,9 @@ class YOLOv4DatasetImporter(
     def __len__(self):
         return self._num_samples
 
+    def _set_shard(self, start, stop):
+        self._filepaths = self._filepaths[start:stop]
+
     def __next__(self):
         filepath = next(self._iter_filepaths)
 
@@ -442,6 +445,9 @@ class YOLOv5DatasetImporter(
     def __len__(self):
         return self._num_samples
 
+    def _set_shard(self, start, stop):
+        self._filepaths = self._filepaths[start:stop]
+
     def __next__(self):
         filepath = next(self._iter_filepaths)
 
@@ -9,6 +9,7 @@ Results are written to `add_samples_benchmark.log`.
 """
 import logging
 import os
+import time
 
 import eta.core.logging as etal
 
@@ -40,7 +41,15 @@ dataset = foz.load_zoo_dataset("cifar10", split="train")
 samples = [s.copy() for s in dataset]
 
 logger.info("\nStarting test")
-for batch_size in [1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048, None]:
-    logger.info("\nBatch size: %s" % batch_size)
+for attach in (True, False):
+    logger.info("\nAttach: %s" % attach)
     dataset2 = fo.Dataset()
-    dataset2.add_samples(samples, _batch_size=batch_size)
+    _samples = [s.copy() for s in samples]
+
+    start = time.time()
+    dataset2.add_samples(_samples, _attach=attach)
+    logger.info(
+        "Added %d samples in %.2fs" % (len(samples), time.time() - start)
+    )
+
+    dataset2.delete()
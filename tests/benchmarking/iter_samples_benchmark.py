@@ -0,0 +1,72 @@
+"""
+Benchmarking for ``iter_samples()``.
+
+Compares the default iterator, which constructs full sample documents, to the
+read-only ``lightweight=True`` iterator at various cursor batch sizes.
+
+Results are written to `iter_samples_benchmark.log`.
+
+| Copyright 2017-2023, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import logging
+import os
+import time
+
+import eta.core.logging as etal
+
+import fiftyone.zoo as foz
+
+
+logger = logging.getLogger(__name__)
+
+
+# Logs everything written by a `logger` in this benchmark
+etal.custom_setup(
+    etal.LoggingConfig(
+        dict(
+            filename=os.path.splitext(os.path.abspath(__file__))[0] + ".log",
+            file_format="%(message)s",
+        )
+    ),
+    verbose=False,
+)
+
+
+#
+# Iter samples benchmark
+#
+
+batch_sizes = [None, 1000, 10000]
+num_trials = 3
+
+dataset = foz.load_zoo_dataset("cifar10", split="train")
+
+
+def _iter(**kwargs):
+    start = time.time()
+    for sample in dataset.iter_samples(**kwargs):
+        sample.filepath
+        sample.ground_truth.label
+
+    return time.time() - start
+
+
+logger.info("\nStarting test")
+logger.info("Samples: %d" % len(dataset))
+
+default_time = min(_iter() for _ in range(num_trials))
+logger.info("\nDefault iterator: %.4fs" % default_time)
+
+for batch_size in batch_sizes:
+    lightweight_time = min(
+        _iter(lightweight=True, batch_size=batch_size)
+        for _ in range(num_trials)
+    )
+
+    logger.info("\nBatch size: %s" % batch_size)
+    logger.info(
+        "Lightweight iterator: %.4fs (%.1fx)"
+        % (lightweight_time, default_time / lightweight_time)
+    )
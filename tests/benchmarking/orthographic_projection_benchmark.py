@@ -0,0 +1,117 @@
+"""
+Benchmarking for ``compute_orthographic_projection_images()``.
+
+Generates synthetic point clouds and compares serial projection to projection
+with a pool of worker processes.
+
+Results are written to `orthographic_projection_benchmark.log`.
+
+| Copyright 2017-2023, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import logging
+import multiprocessing
+import os
+import tempfile
+import time
+
+import numpy as np
+import open3d as o3d
+
+import eta.core.logging as etal
+
+import fiftyone as fo
+import fiftyone.utils.utils3d as fou3d
+
+
+logger = logging.getLogger(__name__)
+
+
+# Logs everything written by a `logger` in this benchmark
+etal.custom_setup(
+    etal.LoggingConfig(
+        dict(
+            filename=os.path.splitext(os.path.abspath(__file__))[0] + ".log",
+            file_format="%(message)s",
+        )
+    ),
+    verbose=False,
+)
+
+
+#
+# Orthographic projection benchmark
+#
+
+num_samples = 200
+num_points = 100000
+size = (512, -1)
+shading_mode = "height"
+worker_counts = [1, 2, 4, multiprocessing.cpu_count()]
+
+
+def _make_point_cloud(pcd_path, seed):
+    rng = np.random.default_rng(seed)
+
+    points = rng.uniform((-50, -50, -2), (50, 50, 5), size=(num_points, 3))
+    colors = rng.random((num_points, 3))
+
+    pc = o3d.geometry.PointCloud()
+    pc.points = o3d.utility.Vector3dVector(points)
+    pc.colors = o3d.utility.Vector3dVector(colors)
+
+    o3d.io.write_point_cloud(pcd_path, pc)
+
+
+def _project(dataset, output_dir, num_workers):
+    start = time.time()
+    fou3d.compute_orthographic_projection_images(
+        dataset,
+        size,
+        output_dir,
+        shading_mode=shading_mode,
+        num_workers=num_workers,
+    )
+
+    return time.time() - start
+
+
+if __name__ == "__main__":
+    fo.config.show_progress_bars = False
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pcd_dir = os.path.join(tmp_dir, "pcd")
+        os.makedirs(pcd_dir)
+
+        samples = []
+        for idx in range(num_samples):
+            pcd_path = os.path.join(pcd_dir, "%06d.pcd" % idx)
+            _make_point_cloud(pcd_path, idx)
+            samples.append(fo.Sample(filepath=pcd_path))
+
+        dataset = fo.Dataset()
+        dataset.add_samples(samples)
+
+        logger.info("\nStarting test")
+        logger.info("Samples: %d" % num_samples)
+        logger.info("Points per sample: %d" % num_points)
+
+        baseline = None
+        for num_workers in worker_counts:
+            output_dir = os.path.join(tmp_dir, "proj-%d" % num_workers)
+            duration = _project(dataset, output_dir, num_workers)
+            if baseline is None:
+                baseline = duration
+
+            logger.info(
+                "num_workers=%d: %.2fs (%.1f samples/s, %.2fx)"
+                % (
+                    num_workers,
+                    duration,
+                    num_samples / duration,
+                    baseline / duration,
+                )
+            )
+
+        dataset.delete()
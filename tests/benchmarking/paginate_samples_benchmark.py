@@ -0,0 +1,119 @@
+"""
+Benchmarking for :func:`fiftyone.server.samples.paginate_samples`.
+
+Compares offset cursors, which are served via ``$skip``, to keyset cursors,
+which are served via a range query on the sort key, at various grid offsets
+of an unsorted view and of a view sorted by a field.
+
+Results are written to `paginate_samples_benchmark.log`.
+
+| Copyright 2017-2023, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import asyncio
+import logging
+import os
+import time
+
+from bson import json_util
+
+import eta.core.logging as etal
+
+import fiftyone as fo
+import fiftyone.core.stages as fosg
+from fiftyone.server.samples import paginate_samples
+
+
+logger = logging.getLogger(__name__)
+
+
+# Logs everything written by a `logger` in this benchmark
+etal.custom_setup(
+    etal.LoggingConfig(
+        dict(
+            filename=os.path.splitext(os.path.abspath(__file__))[0] + ".log",
+            file_format="%(message)s",
+        )
+    ),
+    verbose=False,
+)
+
+
+#
+# Paginate samples benchmark
+#
+
+num_samples = 1000000 + 1000
+page_length = 20
+offsets = [0, 100000, 1000000]
+num_trials = 5
+
+dataset = fo.Dataset()
+
+dataset.add_samples(
+    (
+        fo.Sample(filepath="/tmp/image%d.jpg" % i, i=i % 1000)
+        for i in range(num_samples)
+    ),
+    num_samples=num_samples,
+)
+
+# Keyset pagination breaks ties in the sort key by ID
+view = dataset.sort_by([("i", 1), ("_id", 1)])
+sorted_ids, sorted_values = view.values(["_id", "i"])
+
+views = [
+    ("Unsorted", [], dataset.values("_id"), None),
+    (
+        "Sorted by field",
+        [fosg.SortBy("i")._serialize()],
+        sorted_ids,
+        sorted_values,
+    ),
+]
+
+
+# The async database client is bound to the event loop that first uses it
+loop = asyncio.new_event_loop()
+
+
+def _paginate(stages, after):
+    start = time.time()
+    loop.run_until_complete(
+        paginate_samples(dataset.name, stages, {}, page_length, after)
+    )
+    return time.time() - start
+
+
+logger.info("\nStarting test")
+for name, stages, ids, values in views:
+    logger.info("\n%s" % name)
+    for offset in offsets:
+        if offset > 0:
+            idx = offset - 1
+            offset_cursor = str(idx)
+            if values is None:
+                keyset_cursor = "%d:%s" % (idx, ids[idx])
+            else:
+                keyset_cursor = "%d:%s:%s" % (
+                    idx,
+                    ids[idx],
+                    json_util.dumps(values[idx]),
+                )
+        else:
+            offset_cursor = None
+            keyset_cursor = None
+
+        offset_time = min(
+            _paginate(stages, offset_cursor) for _ in range(num_trials)
+        )
+        keyset_time = min(
+            _paginate(stages, keyset_cursor) for _ in range(num_trials)
+        )
+
+        logger.info("\nOffset: %d" % offset)
+        logger.info("Offset cursor: %.4fs" % offset_time)
+        logger.info("Keyset cursor: %.4fs" % keyset_time)
+
+dataset.delete()
@@ -7,12 +7,16 @@ FiftyOne aggregation-related unit tests.
 """
 from datetime import date, datetime, timedelta
 import math
+import os
 
 from bson import ObjectId
 import numpy as np
 import unittest
 
+import eta.core.utils as etau
+
 import fiftyone as fo
+import fiftyone.core.aggregations as foa
 import fiftyone.core.fields as fof
 from fiftyone import ViewField as F
 
@@ -572,6 +576,239 @@ class DatasetTests(unittest.TestCase):
         self.assertListEqual(values1, expected)
         self.assertListEqual(values2, expected)
 
+    @drop_datasets
+    def test_values_columnar(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image1.jpeg",
+                    float=1.0,
+                    ground_truth=fo.Detections(
+                        detections=[
+                            fo.Detection(bounding_box=[0.1, 0.1, 0.4, 0.4]),
+                            fo.Detection(bounding_box=[0.5, 0.5, 0.2, 0.2]),
+                        ]
+                    ),
+                ),
+                fo.Sample(
+                    filepath="image2.jpeg",
+                    float=None,
+                    ground_truth=fo.Detections(detections=[]),
+                ),
+                fo.Sample(
+                    filepath="image3.jpeg",
+                    float=2.0,
+                    ground_truth=fo.Detections(
+                        detections=[
+                            fo.Detection(bounding_box=[0.2, 0.2, 0.6, 0.6]),
+                        ]
+                    ),
+                ),
+            ]
+        )
+
+        values = dataset.values("float", columnar=True)
+        self.assertEqual(values.values.dtype, float)
+        self.assertListEqual(values.offsets, [])
+        self.assertTrue(np.isnan(values.values[1]))
+        self.assertListEqual(values.tolist(), dataset.values("float"))
+
+        path = "ground_truth.detections.bounding_box"
+        values = dataset.values(path, columnar=True)
+        self.assertEqual(len(values), 3)
+        self.assertTupleEqual(values.values.shape, (3, 4))
+        self.assertListEqual(values.offsets[0].tolist(), [0, 2, 2, 3])
+        self.assertListEqual(values.tolist(), dataset.values(path))
+
+        values = dataset.values(path, columnar="arrow")
+        self.assertListEqual(values.to_pylist(), dataset.values(path))
+
+        # Round trip
+        values = dataset.values(path, columnar=True)
+        values.values[:, 2:] *= 0.5
+        dataset.set_values(path, values)
+
+        self.assertListEqual(
+            dataset.values(path),
+            [
+                [[0.1, 0.1, 0.2, 0.2], [0.5, 0.5, 0.1, 0.1]],
+                [],
+                [[0.2, 0.2, 0.3, 0.3]],
+            ],
+        )
+
+    @drop_datasets
+    def test_values_columnar_round_trip(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image1.jpeg",
+                    int=1,
+                    bool=True,
+                    list=[1, 2],
+                    date=datetime(2023, 1, 1),
+                    classification=fo.Classification(label="cat"),
+                ),
+                fo.Sample(filepath="image2.jpeg"),
+                fo.Sample(
+                    filepath="image3.jpeg",
+                    int=3,
+                    bool=False,
+                    list=[3],
+                    date=datetime(2023, 1, 3),
+                    classification=fo.Classification(label="dog"),
+                ),
+            ]
+        )
+
+        for path in ("int", "bool", "list", "date", "classification"):
+            expected = dataset.values(path)
+            values = dataset.values(path, columnar=True)
+
+            self.assertEqual(len(values), 3)
+            self.assertListEqual(values.tolist(), expected)
+
+            dataset.set_values(path, values)
+            self.assertListEqual(dataset.values(path), expected)
+
+        values = dataset.values("int", columnar=True)
+        self.assertIsInstance(values.tolist()[0], int)
+        self.assertIsNone(values.tolist()[1])
+
+        values = dataset.values("classification", columnar=True)
+        self.assertIsInstance(values.values[0], fo.Classification)
+
+    @drop_datasets
+    def test_set_values_columnar(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image1.jpeg",
+                    int=1,
+                    float=1.0,
+                    ground_truth=fo.Detections(
+                        detections=[
+                            fo.Detection(label="cat", confidence=0.1),
+                            fo.Detection(label="dog", confidence=0.2),
+                        ]
+                    ),
+                ),
+                fo.Sample(
+                    filepath="image2.jpeg",
+                    int=2,
+                    float=None,
+                    ground_truth=fo.Detections(detections=[]),
+                ),
+                fo.Sample(
+                    filepath="image3.jpeg",
+                    int=2**40,
+                    float=3.0,
+                    ground_truth=fo.Detections(
+                        detections=[fo.Detection(label="cat", confidence=0.3)]
+                    ),
+                ),
+            ]
+        )
+
+        values = dataset.values("int", columnar=True)
+        self.assertEqual(values.values.dtype, np.int64)
+
+        values.values[:2] += 1
+        dataset.set_values("int", values.to_arrow())
+        self.assertListEqual(dataset.values("int"), [2, 3, 2**40])
+
+        values = dataset.values("float", columnar="arrow")
+        self.assertListEqual(values.to_pylist(), [1.0, None, 3.0])
+
+        values = foa.ColumnarValues.from_arrow(values)
+        values.values[0] = np.nan
+        dataset.set_values("float", values, skip_none=True)
+        self.assertListEqual(dataset.values("float"), [1.0, None, 3.0])
+
+        dataset.set_values("float", values)
+        self.assertListEqual(dataset.values("float"), [None, None, 3.0])
+
+        path = "ground_truth.detections.confidence"
+        view = dataset.filter_labels("ground_truth", F("label") == "cat")
+        values = view.values(path, columnar=True)
+        self.assertListEqual(values.offsets[0].tolist(), [0, 1, 2])
+
+        values.values *= 10
+        view.set_values(path, values)
+        self.assertListEqual(dataset.values(path), [[1.0, 0.2], [], [3.0]])
+
+        values = dataset.values(path, columnar="arrow")
+        values = foa.ColumnarValues.from_arrow(values)
+        self.assertListEqual(values.tolist(), [[1.0, 0.2], [], [3.0]])
+
+    @drop_datasets
+    def test_load_vectors(self):
+        vectors = np.random.randn(4, 8).astype(np.float32)
+
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(filepath="image1.png", vector=vectors[0]),
+                fo.Sample(filepath="image2.png", vector=vectors[1]),
+                fo.Sample(filepath="image3.png"),
+                fo.Sample(filepath="image4.png", vector=vectors[2]),
+                fo.Sample(filepath="image5.png", vector=vectors[3]),
+            ]
+        )
+        ids = dataset.exists("vector").values("id")
+
+        vectors2, ids2 = dataset.load_vectors("vector")
+        self.assertTupleEqual(vectors2.shape, (4, 8))
+        self.assertEqual(vectors2.dtype, np.float32)
+        self.assertTrue(np.array_equal(vectors2, vectors))
+        self.assertListEqual(ids2.tolist(), ids)
+
+        view = dataset.skip(3)
+        vectors2, ids2 = view.load_vectors("vector", dtype=np.float64)
+        self.assertEqual(vectors2.dtype, np.float64)
+        self.assertTrue(np.allclose(vectors2, vectors[2:]))
+        self.assertListEqual(ids2.tolist(), ids[2:])
+
+        with etau.TempDir() as tmp_dir:
+            mmap_path = os.path.join(tmp_dir, "vectors.npy")
+            vectors2, ids2 = dataset.load_vectors(
+                "vector", mmap_path=mmap_path, batch_size=2
+            )
+            self.assertIsInstance(vectors2, np.memmap)
+            self.assertTrue(np.array_equal(np.load(mmap_path), vectors))
+            self.assertListEqual(ids2.tolist(), ids)
+            del vectors2
+
+        vectors2, ids2 = dataset.limit(0).load_vectors("vector")
+        self.assertEqual(len(vectors2), 0)
+        self.assertEqual(len(ids2), 0)
+
+        # Vectors of different dimensions
+        dataset.set_values(
+            "vector", [np.ones(3), None, np.ones(8), None, None]
+        )
+        with self.assertRaises(ValueError):
+            dataset.load_vectors("vector")
+
+    @drop_datasets
+    def test_load_vectors_frames(self):
+        sample = fo.Sample(filepath="video.mp4")
+        sample.frames[1] = fo.Frame(vector=np.arange(4))
+        sample.frames[2] = fo.Frame()
+        sample.frames[3] = fo.Frame(vector=np.arange(4) + 1)
+
+        dataset = fo.Dataset()
+        dataset.add_sample(sample)
+
+        vectors, ids = dataset.load_vectors("frames.vector")
+        self.assertListEqual(vectors.tolist(), [[0, 1, 2, 3], [1, 2, 3, 4]])
+        self.assertListEqual(
+            ids.tolist(), [sample.frames[1].id, sample.frames[3].id]
+        )
+
     @drop_datasets
     def test_nan_inf(self):
         dataset = fo.Dataset()
@@ -21,6 +21,7 @@ import eta.core.utils as etau
 import fiftyone as fo
 import fiftyone.core.fields as fof
 import fiftyone.core.odm as foo
+import fiftyone.core.sample as fos
 import fiftyone.utils.data as foud
 from fiftyone import ViewField as F
 
@@ -514,6 +515,118 @@ class DatasetTests(unittest.TestCase):
 
         self.assertTupleEqual(dataset.bounds("int"), (4, 53))
 
+    @drop_datasets
+    def test_save_context(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.jpg" % i) for i in range(50)]
+        )
+
+        for async_writes in (True, False):
+            with fo.SaveContext(
+                dataset, batch_size=100, async_writes=async_writes
+            ) as context:
+                for idx, sample in enumerate(dataset):
+                    sample["int"] = idx % 2
+                    context.save(sample)
+
+                    # Saving the same sample twice in a batch
+                    sample["int"] = idx % 2 + 1
+                    context.save(sample)
+
+            self.assertListEqual(
+                dataset.values("int"), [idx % 2 + 1 for idx in range(50)]
+            )
+
+        # Flushes on every save
+        with fo.SaveContext(dataset, max_batch_bytes=1) as context:
+            for sample in dataset:
+                sample["int"] = 0
+                context.save(sample)
+
+                self.assertEqual(len(context._sample_updates), 0)
+
+        self.assertTupleEqual(dataset.bounds("int"), (0, 0))
+
+        with fo.SaveContext(dataset, batch_size=100) as context:
+            for idx, sample in enumerate(dataset):
+                sample.tags = ["even"] if idx % 2 == 0 else ["odd"]
+                context.save(sample)
+
+            self.assertEqual(len(context._sample_updates), 2)
+            self.assertEqual(len(context._sample_ops), 0)
+
+        self.assertDictEqual(
+            dataset.count_sample_tags(), {"even": 25, "odd": 25}
+        )
+
+        # Label updates are not coalesced
+        with fo.SaveContext(dataset, batch_size=100) as context:
+            for sample in dataset:
+                sample["label"] = fo.Classification(label="cat")
+                context.save(sample)
+
+            self.assertEqual(len(context._sample_updates), 0)
+            self.assertEqual(len(context._sample_ops), 50)
+
+        self.assertDictEqual(dataset.count_values("label.label"), {"cat": 50})
+
+        view = dataset.limit(10)
+        with view.save_context(batch_size=100) as context:
+            for sample in view:
+                sample["int"] = 3
+                context.save(sample)
+
+        self.assertEqual(dataset.count_values("int")[3], 10)
+        self.assertEqual(dataset.first()["int"], 3)
+
+    @drop_datasets
+    def test_iter_samples_lightweight(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image%d.jpg" % i,
+                    int=i,
+                    ground_truth=fo.Classification(label=str(i)),
+                )
+                for i in range(50)
+            ]
+        )
+
+        samples = list(dataset.iter_samples(lightweight=True, batch_size=7))
+
+        self.assertEqual(len(samples), 50)
+        self.assertIsInstance(samples[0], fos.LightweightSample)
+        self.assertListEqual([s.id for s in samples], dataset.values("id"))
+        self.assertListEqual([s["int"] for s in samples], list(range(50)))
+        self.assertIsInstance(samples[0].ground_truth, fo.Classification)
+        self.assertListEqual(
+            [s.ground_truth.label for s in samples],
+            dataset.values("ground_truth.label"),
+        )
+        self.assertEqual(samples[0].media_type, "image")
+        self.assertEqual(samples[0].filename, "image0.jpg")
+
+        with self.assertRaises(ValueError):
+            samples[0]["int"] = 1
+
+        with self.assertRaises(ValueError):
+            samples[0].ground_truth = None
+
+        with self.assertRaises(ValueError):
+            next(dataset.iter_samples(lightweight=True, autosave=True))
+
+        view = dataset.exclude_fields("ground_truth").match(F("int") > 39)
+        samples = list(view.iter_samples(lightweight=True))
+
+        self.assertEqual(len(samples), 10)
+        self.assertListEqual([s.int for s in samples], list(range(40, 50)))
+        self.assertFalse(samples[0].has_field("ground_truth"))
+
+        with self.assertRaises(AttributeError):
+            samples[0].ground_truth
+
     @drop_datasets
     def test_date_fields(self):
         dataset = fo.Dataset()
@@ -1622,6 +1735,27 @@ class DatasetTests(unittest.TestCase):
                 ],
             )
 
+    @drop_datasets
+    def test_add_samples_attach(self):
+        samples = [
+            fo.Sample(filepath="image%d.jpg" % i, i=i) for i in range(10)
+        ]
+
+        dataset1 = fo.Dataset()
+        ids1 = dataset1.add_samples(samples[:5])
+
+        self.assertListEqual(dataset1.values("id"), ids1)
+        self.assertTrue(all(s.in_dataset for s in samples[:5]))
+        self.assertListEqual([s.id for s in samples[:5]], ids1)
+
+        # Samples need not be attached
+        dataset2 = fo.Dataset()
+        ids2 = dataset2.add_samples(samples[5:], _attach=False)
+
+        self.assertListEqual(dataset2.values("id"), ids2)
+        self.assertListEqual(dataset2.values("i"), list(range(5, 10)))
+        self.assertFalse(any(s.in_dataset for s in samples[5:]))
+
     @drop_datasets
     def test_add_collection(self):
         sample1 = fo.Sample(filepath="image.jpg", foo="bar")
@@ -1594,6 +1594,103 @@ class DetectionsTests(unittest.TestCase):
 
         self._evaluate_open_images(dataset, kwargs)
 
+    @drop_datasets
+    def test_evaluate_detections_multi(self):
+        dataset = self._make_detections_dataset()
+
+        for method in ("coco", "open-images"):
+            results1 = dataset.evaluate_detections(
+                "predictions",
+                gt_field="ground_truth",
+                eval_key="eval1",
+                method=method,
+            )
+            results2 = dataset.evaluate_detections(
+                "predictions",
+                gt_field="ground_truth",
+                eval_key="eval2",
+                method=method,
+                num_workers=2,
+            )
+
+            self.assertListEqual(
+                results1.ytrue.tolist(), results2.ytrue.tolist()
+            )
+            self.assertListEqual(
+                results1.ypred.tolist(), results2.ypred.tolist()
+            )
+
+            for field in ("ground_truth", "predictions"):
+                for suffix in ("", "_id", "_iou"):
+                    self.assertListEqual(
+                        dataset.values(
+                            "%s.detections.eval1%s" % (field, suffix)
+                        ),
+                        dataset.values(
+                            "%s.detections.eval2%s" % (field, suffix)
+                        ),
+                    )
+
+            for suffix in ("_tp", "_fp", "_fn"):
+                self.assertListEqual(
+                    dataset.values("eval1" + suffix),
+                    dataset.values("eval2" + suffix),
+                )
+
+            dataset.delete_evaluations()
+
+    @drop_datasets
+    def test_compute_max_ious_multi(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image%d.jpg" % i,
+                    predictions=fo.Detections(
+                        detections=[
+                            fo.Detection(
+                                label="cat",
+                                bounding_box=[0.1, 0.1, 0.4, 0.4],
+                            ),
+                            fo.Detection(
+                                label="cat",
+                                bounding_box=[0.1 + 0.1 * i, 0.1, 0.4, 0.4],
+                            ),
+                            fo.Detection(
+                                label="dog",
+                                bounding_box=[0.6, 0.6, 0.3, 0.3],
+                            ),
+                        ]
+                    ),
+                )
+                for i in range(4)
+            ]
+        )
+
+        foui.compute_max_ious(
+            dataset, "predictions", iou_attr="iou1", id_attr="id1"
+        )
+        foui.compute_max_ious(
+            dataset,
+            "predictions",
+            iou_attr="iou2",
+            id_attr="id2",
+            num_workers=2,
+        )
+
+        for attr in ("iou", "id"):
+            self.assertListEqual(
+                dataset.values("predictions.detections.%s1" % attr),
+                dataset.values("predictions.detections.%s2" % attr),
+            )
+
+        dup_ids1 = foui.find_duplicates(dataset, "predictions", iou_thresh=0.5)
+        dup_ids2 = foui.find_duplicates(
+            dataset, "predictions", iou_thresh=0.5, num_workers=2
+        )
+
+        self.assertListEqual(dup_ids1, dup_ids2)
+
     @drop_datasets
     def test_load_evaluation_view_select_fields(self):
         dataset = self._make_detections_dataset()
@@ -2352,6 +2449,46 @@ class SegmentationTests(unittest.TestCase):
 
         return dataset
 
+    @drop_datasets
+    def test_evaluate_segmentations_multi(self):
+        dataset = self._make_segmentation_dataset()
+
+        for mask_targets in (None, {0: "background", 1: "cat", 2: "dog"}):
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")  # suppress missing masks
+
+                results1 = dataset.evaluate_segmentations(
+                    "predictions",
+                    gt_field="ground_truth",
+                    eval_key="eval1",
+                    mask_targets=mask_targets,
+                )
+                results2 = dataset.evaluate_segmentations(
+                    "predictions",
+                    gt_field="ground_truth",
+                    eval_key="eval2",
+                    mask_targets=mask_targets,
+                    num_workers=2,
+                )
+
+            self.assertListEqual(
+                list(results1.classes), list(results2.classes)
+            )
+            self.assertTrue(
+                (
+                    results1.pixel_confusion_matrix
+                    == results2.pixel_confusion_matrix
+                ).all()
+            )
+
+            for metric in ("accuracy", "precision", "recall"):
+                self.assertListEqual(
+                    dataset.values("eval1_%s" % metric),
+                    dataset.values("eval2_%s" % metric),
+                )
+
+            dataset.delete_evaluations()
+
     @drop_datasets
     def test_evaluate_segmentations_simple(self):
         dataset = self._make_segmentation_dataset()
@@ -2671,6 +2808,50 @@ class VideoSegmentationTests(unittest.TestCase):
 
         return dataset
 
+    @drop_datasets
+    def test_evaluate_video_segmentations_multi(self):
+        dataset = self._make_video_segmentation_dataset()
+
+        for average in ("micro", "macro"):
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")  # suppress missing masks
+
+                results1 = dataset.evaluate_segmentations(
+                    "frames.predictions",
+                    gt_field="frames.ground_truth",
+                    eval_key="eval1",
+                    average=average,
+                )
+                results2 = dataset.evaluate_segmentations(
+                    "frames.predictions",
+                    gt_field="frames.ground_truth",
+                    eval_key="eval2",
+                    average=average,
+                    num_workers=2,
+                )
+
+            self.assertListEqual(
+                list(results1.classes), list(results2.classes)
+            )
+            self.assertTrue(
+                (
+                    results1.pixel_confusion_matrix
+                    == results2.pixel_confusion_matrix
+                ).all()
+            )
+
+            for metric in ("accuracy", "precision", "recall"):
+                self.assertListEqual(
+                    dataset.values("eval1_%s" % metric),
+                    dataset.values("eval2_%s" % metric),
+                )
+                self.assertListEqual(
+                    dataset.values("frames.eval1_%s" % metric),
+                    dataset.values("frames.eval2_%s" % metric),
+                )
+
+            dataset.delete_evaluations()
+
     @drop_datasets
     def test_evaluate_video_segmentations_simple(self):
         dataset = self._make_video_segmentation_dataset()
@@ -15,11 +15,13 @@ import numpy as np
 import pytest
 
 import eta.core.image as etai
+import eta.core.serial as etas
 import eta.core.utils as etau
 import eta.core.video as etav
 
 import fiftyone as fo
 import fiftyone.utils.coco as fouc
+import fiftyone.utils.data as foud
 import fiftyone.utils.labels as foul
 import fiftyone.utils.yolo as fouy
 from fiftyone import ViewField as F
@@ -72,6 +74,46 @@ class ImageDatasetTests(unittest.TestCase):
         return os.path.join(self.root_dir, self._new_name())
 
 
+class MediaExporterTests(ImageDatasetTests):
+    def test_media_exporter(self):
+        image_paths = [self._new_image() for _ in range(10)]
+
+        for export_mode in (True, "symlink"):
+            for num_workers in (1, 4):
+                export_dir = self._new_dir()
+
+                media_exporter = foud.MediaExporter(
+                    export_mode,
+                    export_path=export_dir,
+                    num_workers=num_workers,
+                )
+                media_exporter.setup()
+
+                outpaths = []
+                for image_path in image_paths + image_paths[:3]:
+                    outpath, _ = media_exporter.export(image_path)
+                    outpaths.append(outpath)
+
+                media_exporter.close()
+
+                self.assertEqual(len(set(outpaths)), len(image_paths))
+                self.assertEqual(len(etau.list_files(export_dir)), 10)
+                for outpath in outpaths:
+                    self.assertTrue(os.path.isfile(outpath))
+
+        # Errors are raised
+        media_exporter = foud.MediaExporter(
+            True, export_path=self._new_dir(), num_workers=4
+        )
+        media_exporter.setup()
+
+        with self.assertRaises(Exception):
+            for image_path in image_paths:
+                media_exporter.export(image_path + ".missing")
+
+            media_exporter.close()
+
+
 class DuplicateImageExportTests(ImageDatasetTests):
     @skipwindows
     @drop_datasets
@@ -1019,6 +1061,55 @@ class ImageDetectionDatasetTests(ImageDatasetTests):
             dataset2.count("predictions.detections"),
         )
 
+        # Sharded export w/ multiple workers
+
+        export_dir2 = self._new_dir()
+        images_dir = self._new_dir()
+
+        dataset.export(
+            export_dir=export_dir2,
+            dataset_type=fo.types.TFObjectDetectionDataset,
+            num_shards=3,
+            num_workers=2,
+            index_path="index.json",
+        )
+
+        index = etas.read_json(os.path.join(export_dir2, "index.json"))
+        self.assertEqual(index["num_records"], len(dataset))
+        self.assertEqual(len(index["shards"]), 3)
+        self.assertEqual(
+            sum(s["num_records"] for s in index["shards"]), len(dataset)
+        )
+
+        dataset2 = fo.Dataset.from_dir(
+            dataset_dir=export_dir2,
+            dataset_type=fo.types.TFObjectDetectionDataset,
+            images_dir=images_dir,
+            label_field="predictions",
+        )
+
+        self.assertEqual(len(dataset), len(dataset2))
+        self.assertEqual(
+            dataset.count("predictions.detections"),
+            dataset2.count("predictions.detections"),
+        )
+
+        # Shard contents don't depend on the number of workers
+
+        export_dir3 = self._new_dir()
+
+        dataset.export(
+            export_dir=export_dir3,
+            dataset_type=fo.types.TFObjectDetectionDataset,
+            num_shards=3,
+        )
+
+        for shard in index["shards"]:
+            self.assertListEqual(
+                _read_tf_records(os.path.join(export_dir2, shard["path"])),
+                _read_tf_records(os.path.join(export_dir3, shard["path"])),
+            )
+
     @drop_datasets
     def test_coco_detection_dataset(self):
         dataset = self._make_dataset()
@@ -1652,6 +1743,47 @@ class ImageDetectionDatasetTests(ImageDatasetTests):
             dataset.count_values("coco.detections.label"),
         )
 
+    @drop_datasets
+    def test_import_num_workers(self):
+        dataset = self._make_dataset()
+
+        for dataset_type, kwargs in (
+            (fo.types.COCODetectionDataset, {"label_types": "detections"}),
+            (fo.types.VOCDetectionDataset, {}),
+            (fo.types.KITTIDetectionDataset, {}),
+            (fo.types.YOLOv5Dataset, {}),
+        ):
+            export_dir = self._new_dir()
+
+            dataset.export(
+                export_dir=export_dir,
+                dataset_type=dataset_type,
+                label_field="predictions",
+            )
+
+            dataset1 = fo.Dataset.from_dir(
+                dataset_dir=export_dir,
+                dataset_type=dataset_type,
+                label_field="predictions",
+                **kwargs,
+            )
+
+            dataset2 = fo.Dataset.from_dir(
+                dataset_dir=export_dir,
+                dataset_type=dataset_type,
+                label_field="predictions",
+                num_workers=2,
+                **kwargs,
+            )
+
+            self.assertListEqual(
+                dataset1.values("filepath"), dataset2.values("filepath")
+            )
+            self.assertListEqual(
+                dataset1.values("predictions.detections.label"),
+                dataset2.values("predictions.detections.label"),
+            )
+
 
 class ImageSegmentationDatasetTests(ImageDatasetTests):
     def _make_dataset(self):
@@ -2874,6 +3006,11 @@ class MultitaskImageDatasetTests(ImageDatasetTests):
             dataset_type=fo.types.FiftyOneDataset,
         )
 
+        self.assertEqual(
+            foud.FiftyOneDatasetImporter._get_num_samples(export_dir),
+            len(dataset),
+        )
+
         dataset2 = fo.Dataset.from_dir(
             dataset_dir=export_dir,
             dataset_type=fo.types.FiftyOneDataset,
@@ -2920,6 +3057,42 @@ class MultitaskImageDatasetTests(ImageDatasetTests):
             dataset3.count("predictions.detections"),
         )
 
+        # BSON format
+
+        for kwargs in ({}, {"compress": True, "max_shard_size": 2}):
+            export_dir = self._new_dir()
+
+            dataset.export(
+                export_dir=export_dir,
+                dataset_type=fo.types.FiftyOneDataset,
+                use_bson=True,
+                **kwargs,
+            )
+
+            self.assertEqual(
+                foud.FiftyOneDatasetImporter._get_num_samples(export_dir),
+                len(dataset),
+            )
+
+            dataset4 = fo.Dataset.from_dir(
+                dataset_dir=export_dir,
+                dataset_type=fo.types.FiftyOneDataset,
+            )
+
+            self.assertEqual(len(dataset), len(dataset4))
+            self.assertListEqual(
+                [os.path.basename(f) for f in dataset.values("filepath")],
+                [os.path.basename(f) for f in dataset4.values("filepath")],
+            )
+            self.assertListEqual(
+                dataset.values("weather.label"),
+                dataset4.values("weather.label"),
+            )
+            self.assertEqual(
+                dataset.count("predictions.detections"),
+                dataset4.count("predictions.detections"),
+            )
+
         # Labels-only (absolute paths)
 
         export_dir = self._new_dir()
@@ -3727,6 +3900,31 @@ class VideoExportCoersionTests(VideoDatasetTests):
             clips.values("support"), dataset3.values("support")
         )
 
+        export_dir = self._new_dir()
+
+        clips.export(
+            export_dir=export_dir,
+            dataset_type=fo.types.FiftyOneDataset,
+            use_bson=True,
+        )
+
+        dataset4 = fo.Dataset.from_dir(
+            dataset_dir=export_dir, dataset_type=fo.types.FiftyOneDataset
+        )
+
+        self.assertEqual(len(clips), len(dataset4))
+        self.assertEqual(clips.count("frames"), dataset4.count("frames"))
+        self.assertEqual(
+            dataset4._frame_collection.count_documents(
+                {"_dataset_id": dataset4._doc.id}
+            ),
+            dataset4.count("frames"),
+        )
+        self.assertEqual(
+            clips.count("frames.predictions.detections"),
+            dataset4.count("frames.predictions.detections"),
+        )
+
 
 class UnlabeledVideoDatasetTests(VideoDatasetTests):
     def _make_dataset(self):
@@ -4328,6 +4526,15 @@ def _relpath(path, start):
     return os.path.relpath(os.path.realpath(path), os.path.realpath(start))
 
 
+def _read_tf_records(tf_records_path):
+    import tensorflow as tf
+
+    return [
+        tf.train.Example.FromString(record.numpy())
+        for record in tf.data.TFRecordDataset(tf_records_path)
+    ]
+
+
 if __name__ == "__main__":
     fo.config.show_progress_bars = False
     unittest.main(verbosity=2)
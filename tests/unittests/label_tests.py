@@ -11,6 +11,7 @@ from bson import Binary, ObjectId
 import numpy as np
 
 import fiftyone as fo
+import fiftyone.utils.labels as foul
 
 from decorators import drop_datasets
 
@@ -88,6 +89,99 @@ class LabelTests(unittest.TestCase):
         self.assertEqual(detection2["custom_id"], detection["custom_id"])
 
 
+class LabelUtilsTests(unittest.TestCase):
+    def _make_detections(self):
+        mask = np.zeros((8, 8), dtype=bool)
+        mask[2:6, 2:6] = True
+
+        return fo.Detections(
+            detections=[
+                fo.Detection(
+                    label="cat", bounding_box=[0.1, 0.1, 0.4, 0.4], mask=mask
+                ),
+                fo.Detection(
+                    label="dog", bounding_box=[0.5, 0.5, 0.4, 0.4], mask=mask
+                ),
+            ]
+        )
+
+    @drop_datasets
+    def test_objects_to_segmentations(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image%d.jpg" % i,
+                    detections=self._make_detections(),
+                )
+                for i in range(5)
+            ]
+        )
+        dataset.add_sample(fo.Sample(filepath="empty.jpg"))
+
+        mask_targets = {1: "cat", 2: "dog"}
+
+        for num_workers in (1, 2):
+            out_field = "seg%d" % num_workers
+            foul.objects_to_segmentations(
+                dataset,
+                "detections",
+                out_field,
+                mask_size=(32, 24),
+                mask_targets=mask_targets,
+                num_workers=num_workers,
+            )
+
+            segs = dataset.values(out_field)
+            self.assertIsNone(segs[-1])
+            for seg in segs[:-1]:
+                self.assertEqual(seg.mask.shape, (24, 32))
+                self.assertSetEqual(set(np.unique(seg.mask)), {0, 1, 2})
+
+        for seg1, seg2 in zip(*dataset.values(["seg1", "seg2"])):
+            if seg1 is None:
+                self.assertIsNone(seg2)
+            else:
+                self.assertTrue(np.array_equal(seg1.mask, seg2.mask))
+
+        foul.segmentations_to_detections(
+            dataset,
+            "seg2",
+            "dets",
+            mask_targets=mask_targets,
+            num_workers=2,
+        )
+
+        labels = dataset.values("dets.detections.label")
+        self.assertIsNone(labels[-1])
+        for _labels in labels[:-1]:
+            self.assertListEqual(sorted(_labels), ["cat", "dog"])
+
+    @drop_datasets
+    def test_objects_to_segmentations_frames(self):
+        sample = fo.Sample(filepath="video.mp4")
+        sample.frames[1] = fo.Frame(detections=self._make_detections())
+        sample.frames[3] = fo.Frame(detections=self._make_detections())
+        sample.frames[4] = fo.Frame()
+
+        dataset = fo.Dataset()
+        dataset.add_sample(sample)
+
+        foul.objects_to_segmentations(
+            dataset,
+            "frames.detections",
+            "frames.seg",
+            mask_size=(32, 24),
+            num_workers=2,
+        )
+
+        segs = dataset.values("frames.seg")[0]
+        self.assertEqual(len(segs), 3)
+        self.assertEqual(segs[0].mask.shape, (24, 32))
+        self.assertEqual(segs[1].mask.shape, (24, 32))
+        self.assertIsNone(segs[2])
+
+
 if __name__ == "__main__":
     fo.config.show_progress_bars = False
     unittest.main(verbosity=2)
@@ -0,0 +1,201 @@
+"""
+FiftyOne model-related unit tests.
+
+| Copyright 2017-2023, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import os
+import unittest
+
+import numpy as np
+
+import eta.core.image as etai
+import eta.core.utils as etau
+
+import fiftyone as fo
+import fiftyone.core.models as fomo
+
+from decorators import drop_datasets
+
+
+class _BrightnessModel(fomo.Model):
+    """Classifies images by their mean pixel value."""
+
+    def __init__(self, use_transforms=False):
+        self._use_transforms = use_transforms
+        self._preprocess = True
+
+    @property
+    def media_type(self):
+        return "image"
+
+    @property
+    def ragged_batches(self):
+        return False
+
+    @property
+    def transforms(self):
+        if self._use_transforms:
+            return _to_grayscale
+
+        return None
+
+    @property
+    def preprocess(self):
+        return self._preprocess
+
+    @preprocess.setter
+    def preprocess(self, value):
+        self._preprocess = value
+
+    def predict(self, arg):
+        if self._use_transforms:
+            if self._preprocess:
+                arg = _to_grayscale(arg)
+            elif arg.ndim != 2:
+                raise ValueError("Expected preprocessed image")
+
+        mean = float(np.mean(arg))
+        label = "bright" if mean > 127 else "dark"
+        return fo.Classification(label=label, confidence=mean / 255)
+
+
+def _to_grayscale(img):
+    return img.astype(np.float32).mean(axis=2)
+
+
+class ApplyModelTests(unittest.TestCase):
+    def setUp(self):
+        temp_dir = etau.TempDir()
+        self.root_dir = temp_dir.__enter__()
+        self._temp_dir = temp_dir
+
+    def tearDown(self):
+        self._temp_dir.__exit__()
+
+    def _make_dataset(self, num_samples=10, missing=False):
+        samples = []
+        for idx in range(num_samples):
+            filepath = os.path.join(self.root_dir, "%06d.png" % idx)
+            img = np.full((16, 24, 3), 25 * idx, dtype=np.uint8)
+            etai.write(img, filepath)
+            samples.append(fo.Sample(filepath=filepath))
+
+        if missing:
+            filepath = os.path.join(self.root_dir, "missing.png")
+            samples.insert(num_samples // 2, fo.Sample(filepath=filepath))
+
+        dataset = fo.Dataset()
+        dataset.add_samples(samples)
+
+        return dataset
+
+    def _assert_same_predictions(self, dataset, field1, field2):
+        self.assertListEqual(
+            dataset.values(field1 + ".label"),
+            dataset.values(field2 + ".label"),
+        )
+        self.assertListEqual(
+            dataset.values(field1 + ".confidence"),
+            dataset.values(field2 + ".confidence"),
+        )
+
+    @drop_datasets
+    def test_apply_model_prefetch(self):
+        dataset = self._make_dataset()
+        model = _BrightnessModel()
+
+        for batch_size in (None, 3):
+            dataset.apply_model(
+                model, label_field="serial", batch_size=batch_size
+            )
+            dataset.apply_model(
+                model,
+                label_field="prefetch",
+                batch_size=batch_size,
+                num_workers=2,
+            )
+
+            self.assertEqual(dataset.count("prefetch"), len(dataset))
+            self._assert_same_predictions(dataset, "serial", "prefetch")
+
+    @drop_datasets
+    def test_apply_model_prefetch_transforms(self):
+        dataset = self._make_dataset()
+        model = _BrightnessModel(use_transforms=True)
+
+        self.assertIs(fomo._get_prefetch_transforms(model), _to_grayscale)
+
+        for batch_size in (None, 3):
+            dataset.apply_model(
+                model, label_field="serial", batch_size=batch_size
+            )
+            dataset.apply_model(
+                model,
+                label_field="prefetch",
+                batch_size=batch_size,
+                num_workers=2,
+            )
+
+            self.assertEqual(dataset.count("prefetch"), len(dataset))
+            self._assert_same_predictions(dataset, "serial", "prefetch")
+
+        # The model's preprocessing is restored afterwards
+        self.assertTrue(model.preprocess)
+
+    @drop_datasets
+    def test_apply_model_prefetch_failures(self):
+        dataset = self._make_dataset(missing=True)
+        model = _BrightnessModel()
+
+        for batch_size in (None, 3):
+            dataset.apply_model(
+                model,
+                label_field="serial",
+                batch_size=batch_size,
+                skip_failures=True,
+            )
+            dataset.apply_model(
+                model,
+                label_field="prefetch",
+                batch_size=batch_size,
+                num_workers=2,
+                skip_failures=True,
+            )
+
+            self.assertLess(dataset.count("prefetch"), len(dataset))
+            self._assert_same_predictions(dataset, "serial", "prefetch")
+
+            with self.assertRaises(Exception):
+                dataset.apply_model(
+                    model,
+                    label_field="prefetch",
+                    batch_size=batch_size,
+                    num_workers=2,
+                    skip_failures=False,
+                )
+
+    def test_load_image_batch(self):
+        filepaths = []
+        for idx in range(3):
+            filepath = os.path.join(self.root_dir, "%06d.png" % idx)
+            etai.write(np.full((16, 24, 3), idx, dtype=np.uint8), filepath)
+            filepaths.append(filepath)
+
+        imgs, _ = fomo._load_image_batch(filepaths, _to_grayscale, True)
+        self.assertIsInstance(imgs, np.ndarray)
+        self.assertTupleEqual(imgs.shape, (3, 16, 24))
+
+        imgs, _ = fomo._load_image_batch(filepaths, None, False)
+        self.assertIsInstance(imgs, list)
+        self.assertEqual(len(imgs), 3)
+
+        missing_path = os.path.join(self.root_dir, "missing.png")
+        imgs, _ = fomo._load_image_batch([missing_path], None, False)
+        self.assertIsInstance(imgs, Exception)
+
+
+if __name__ == "__main__":
+    fo.config.show_progress_bars = False
+    unittest.main(verbosity=2)
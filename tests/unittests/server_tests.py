@@ -5,16 +5,39 @@ FiftyOne server-related unit tests.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import asyncio
+import os
+import struct
 import unittest
 
+from PIL import Image
+
+import eta.core.utils as etau
+
+import fiftyone as fo
 import fiftyone.core.dataset as fod
 import fiftyone.core.fields as fof
 import fiftyone.core.labels as fol
+import fiftyone.core.odm as foo
+import fiftyone.core.stages as fosg
+from fiftyone.core.expressions import ViewField as F
+import fiftyone.server.aggregations as fosa
+import fiftyone.server.metadata as fosmd
+import fiftyone.server.samples as fosm
 import fiftyone.server.view as fosv
 
 from decorators import drop_datasets
 
 
+# The async database client is bound to the event loop on which it is first
+# used, so all coroutines are run on the same loop
+_loop = asyncio.new_event_loop()
+
+
+def _run(coro):
+    return _loop.run_until_complete(coro)
+
+
 class ServerViewTests(unittest.TestCase):
     @drop_datasets
     def test_extended_view_image_label_filters_samples(self):
@@ -913,3 +936,322 @@ class ServerViewTests(unittest.TestCase):
         ]
 
         self.assertEqual(expected, returned)
+
+
+class ServerAggregationsTests(unittest.TestCase):
+    @drop_datasets
+    def test_aggregation_cache(self):
+        dataset = fod.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.jpg" % i, i=i) for i in range(10)]
+        )
+
+        form = fosa.AggregationForm(
+            dataset=dataset.name,
+            extended_stages=[],
+            filters=None,
+            group_id=None,
+            hidden_labels=[],
+            index=None,
+            mixed=False,
+            paths=["i"],
+            sample_ids=[],
+            slice=None,
+            view=[fosg.Match(F("i") > 4)._serialize()],
+        )
+
+        def _aggregate():
+            (result,) = _run(fosa.aggregate_resolver(form))
+            return result.count, result.min, result.max
+
+        fosa.clear_cache()
+        stats = fosa.get_cache_stats()
+
+        self.assertTupleEqual(_aggregate(), (5, 5, 9))
+        self.assertTupleEqual(_aggregate(), (5, 5, 9))
+
+        stats2 = fosa.get_cache_stats()
+        self.assertEqual(stats2["misses"], stats["misses"] + 1)
+        self.assertEqual(stats2["hits"], stats["hits"] + 1)
+
+        # Adding samples invalidates the cache
+        dataset.add_sample(fo.Sample(filepath="image10.jpg", i=10))
+        self.assertTupleEqual(_aggregate(), (6, 5, 10))
+
+        # Other writes require the cache to be cleared
+        dataset.set_values("i", [i + 1 for i in range(11)])
+        self.assertTupleEqual(_aggregate(), (6, 5, 10))
+
+        fosa.clear_cache(dataset.name)
+        self.assertTupleEqual(_aggregate(), (7, 5, 11))
+
+
+class ServerSamplesTests(unittest.TestCase):
+    @drop_datasets
+    def test_paginate_samples_keyset(self):
+        dataset = fod.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image%d.jpg" % i,
+                    i=i,
+                    j=i // 3 if i < 8 else None,
+                    tags=["a"],
+                )
+                for i in range(10)
+            ]
+        )
+
+        def _paginate(stages, after=None, first=4):
+            results = _run(
+                fosm.paginate_samples(dataset.name, stages, {}, first, after)
+            )
+            return [e.node.sample["i"] for e in results.edges], results
+
+        def _paginate_all(stages, first=4):
+            all_values = []
+            after = None
+            while True:
+                values, results = _paginate(stages, after=after, first=first)
+                all_values.extend(values)
+                if not results.page_info.has_next_page:
+                    return all_values
+
+                after = results.edges[-1].cursor
+
+        # Unsorted views are paginated in `_id` order
+        view = dataset.match(F("i") % 2 == 0)
+        stages = [fosg.Match(F("i") % 2 == 0)._serialize()]
+        self.assertTupleEqual(fosm._get_keyset_sort(view), (None, "_id", 1))
+
+        values, results = _paginate(stages)
+        self.assertListEqual(values, [0, 2, 4, 6])
+        self.assertTrue(results.page_info.has_next_page)
+
+        cursor = results.edges[-1].cursor
+        self.assertEqual(cursor, "3:%s" % dataset.values("_id")[6])
+
+        values, results = _paginate(stages, after=cursor)
+        self.assertListEqual(values, [8])
+        self.assertFalse(results.page_info.has_next_page)
+
+        # Offset cursors are still supported
+        values, _ = _paginate(stages, after="3")
+        self.assertListEqual(values, [8])
+
+        # Views sorted by a scalar field use its values as the keyset, with
+        # ties broken by ID
+        view = dataset.sort_by("j", reverse=True)
+        self.assertTupleEqual(fosm._get_keyset_sort(view), (0, "j", -1))
+
+        stages = [fosg.SortBy("j", reverse=True)._serialize()]
+        values, results = _paginate(stages)
+        self.assertListEqual(values, [7, 6, 5, 4])
+        self.assertEqual(results.edges[-1].cursor.split(":", 2)[2], "1")
+        self.assertNotIn("_keyset_value", results.edges[0].node.sample)
+
+        self.assertListEqual(
+            _paginate_all(stages), [7, 6, 5, 4, 3, 2, 1, 0, 9, 8]
+        )
+        self.assertListEqual(
+            _paginate_all(stages, first=3), [7, 6, 5, 4, 3, 2, 1, 0, 9, 8]
+        )
+
+        stages = [
+            fosg.MatchTags("a")._serialize(),
+            fosg.SortBy("j")._serialize(),
+        ]
+        self.assertListEqual(
+            _paginate_all(stages), [8, 9, 0, 1, 2, 3, 4, 5, 6, 7]
+        )
+
+        # Offset cursors are used if the sort key is not in the view
+        stages = [
+            fosg.SortBy("j")._serialize(),
+            fosg.SelectFields("i")._serialize(),
+        ]
+        _, results = _paginate(stages)
+        self.assertEqual(results.edges[-1].cursor, "3")
+        self.assertListEqual(
+            _paginate_all(stages), [8, 9, 0, 1, 2, 3, 4, 5, 6, 7]
+        )
+
+        # Views that reorder samples in other ways use offset pagination
+        self.assertIsNone(fosm._get_keyset_sort(dataset.sort_by(F("i") * -1)))
+        self.assertIsNone(fosm._get_keyset_sort(dataset.sort_by("tags")))
+        self.assertIsNone(fosm._get_keyset_sort(dataset.sort_by("j").limit(5)))
+        self.assertIsNone(
+            fosm._get_keyset_sort(
+                dataset.mongo([{"$project": {"filepath": True}}])
+            )
+        )
+
+        stages = [fosg.SortBy(F("i") * -1)._serialize()]
+        values, results = _paginate(stages)
+        self.assertListEqual(values, [9, 8, 7, 6])
+
+        cursor = results.edges[-1].cursor
+        self.assertEqual(cursor, "3")
+
+        values, _ = _paginate(stages, after=cursor)
+        self.assertListEqual(values, [5, 4, 3, 2])
+
+    @drop_datasets
+    def test_paginate_samples_frames(self):
+        dataset = fod.Dataset()
+        sample = fo.Sample(filepath="video.mp4", i=1)
+        sample.frames[1] = fo.Frame(j=1)
+        sample.frames[2] = fo.Frame(j=2)
+        sample.frames[3] = fo.Frame(j=3)
+        dataset.add_sample(sample)
+
+        view = dataset.match(F("i") == 1)
+        self.assertTrue(view._can_limit_frames())
+        self.assertFalse(dataset.match_frames(F("j") > 1)._can_limit_frames())
+
+        pipeline = view._pipeline(attach_frames=True, frames_limit=1)
+        docs = list(foo.aggregate(dataset._sample_collection, pipeline))
+        self.assertEqual(len(docs), 1)
+        self.assertListEqual(
+            [f["frame_number"] for f in docs[0]["frames"]], [1]
+        )
+
+        clips = dataset.to_clips([[(2, 3)]])
+        pipeline = clips._pipeline(attach_frames=True, frames_limit=1)
+        docs = list(foo.aggregate(clips._dataset._sample_collection, pipeline))
+        self.assertListEqual(
+            [f["frame_number"] for f in docs[0]["frames"]], [2]
+        )
+
+        # Label tags are counted across all frames
+        sample.frames[2]["cls"] = fo.Classification(label="a", tags=["x"])
+        sample.frames[3]["cls"] = fo.Classification(label="b", tags=["x"])
+        sample.save()
+
+        view = fosv.get_view(dataset.name, count_label_tags=True)
+        self.assertFalse(view._can_limit_frames())
+
+        pipeline = view._pipeline(attach_frames=True)
+        docs = list(foo.aggregate(dataset._sample_collection, pipeline))
+        self.assertDictEqual(docs[0]["_label_tags"], {"x": 2})
+
+    @drop_datasets
+    def test_paginate_samples_filtered_frames(self):
+        dataset = fod.Dataset()
+
+        sample1 = fo.Sample(filepath="video1.mp4")
+        sample1.frames[1] = fo.Frame(
+            dets=fo.Detections(detections=[fo.Detection(label="cat")]),
+            cls=fo.Classification(label="cat"),
+        )
+        sample1.frames[2] = fo.Frame(
+            dets=fo.Detections(detections=[fo.Detection(label="dog")]),
+            cls=fo.Classification(label="dog"),
+        )
+
+        sample2 = fo.Sample(filepath="video2.mp4")
+        sample2.frames[1] = fo.Frame(
+            dets=fo.Detections(detections=[fo.Detection(label="cat")]),
+            cls=fo.Classification(label="cat"),
+        )
+
+        dataset.add_samples([sample1, sample2])
+
+        def _get_first_frames(view, frames_limit=None):
+            pipeline = view._pipeline(
+                attach_frames=True, frames_limit=frames_limit
+            )
+            docs = foo.aggregate(dataset._sample_collection, pipeline)
+            results = []
+            for d in docs:
+                frame = d["frames"][0]
+                dets = frame["dets"]["detections"]
+                cls = frame.get("cls", None) or {}
+                results.append(
+                    (
+                        d["filepath"],
+                        [det["label"] for det in dets],
+                        cls.get("label", None),
+                    )
+                )
+
+            return results
+
+        views = [
+            dataset.filter_labels("frames.dets", F("label") == "dog"),
+            dataset.filter_labels(
+                "frames.dets", F("label") == "dog", only_matches=False
+            ),
+            dataset.filter_labels("frames.cls", F("label") == "dog"),
+            dataset.filter_labels(
+                "frames.dets", F("label") == "cat"
+            ).filter_labels("frames.cls", F("label") == "dog"),
+        ]
+
+        for view in views:
+            self.assertTrue(view._can_limit_frames())
+            self.assertListEqual(
+                _get_first_frames(view, frames_limit=1),
+                _get_first_frames(view),
+            )
+
+        # Filtering a field that was filtered by a previous stage requires
+        # all frames
+        view = dataset.filter_labels(
+            "frames.dets", F("label") == "cat"
+        ).filter_labels("frames.dets", F("label") == "dog")
+        self.assertFalse(view._can_limit_frames())
+
+
+class ServerMetadataTests(unittest.TestCase):
+    @drop_datasets
+    def test_metadata_cache(self):
+        with etau.TempDir() as tmp_dir:
+            filepath = os.path.join(tmp_dir, "image.png")
+            Image.new("RGB", (640, 480)).save(filepath)
+
+            dataset = fod.Dataset()
+            dataset.add_sample(fo.Sample(filepath=filepath))
+
+            async def _paginate():
+                results = await fosm.paginate_samples(dataset.name, [], {}, 1)
+                await asyncio.gather(*fosmd._writeback_tasks)
+                return results.edges[0].node.aspect_ratio
+
+            fosmd.clear_cache()
+            stats = fosmd.get_cache_stats()
+
+            self.assertAlmostEqual(_run(_paginate()), 640 / 480)
+            self.assertAlmostEqual(_run(_paginate()), 640 / 480)
+
+            new_stats = fosmd.get_cache_stats()
+            self.assertEqual(new_stats["size"], 1)
+            self.assertEqual(new_stats["misses"] - stats["misses"], 1)
+            self.assertEqual(new_stats["hits"] - stats["hits"], 1)
+
+            # Computed metadata is only saved if requested
+            self.assertIsNone(dataset.first().metadata)
+
+            writeback = fo.config.app_metadata_writeback
+            fo.config.app_metadata_writeback = True
+            try:
+                _run(_paginate())
+            finally:
+                fo.config.app_metadata_writeback = writeback
+
+            dataset.reload()
+            metadata = dataset.first().metadata
+            self.assertIsInstance(metadata, fo.ImageMetadata)
+            self.assertEqual(metadata.width, 640)
+            self.assertEqual(metadata.height, 480)
+            self.assertEqual(metadata.num_channels, 3)
+            self.assertEqual(metadata.size_bytes, os.path.getsize(filepath))
+            self.assertEqual(metadata.mime_type, "image/png")
+
+            # Modified files are re-read
+            with open(filepath, "r+b") as f:
+                f.seek(16)
+                f.write(struct.pack(">LL", 320, 480) + b"\x00" * 16)
+
+            dataset.clear_sample_field("metadata")
+            self.assertAlmostEqual(_run(_paginate()), 320 / 480)
@@ -238,6 +238,28 @@ class OrthographicProjectionTests(BaseOrthographicProjectionTests):
             get_abs_path("specs/3d/100x100_seed_10_height.png"),
         )
 
+    @drop_datasets
+    def test_multiple_workers(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath=self.test_pcd_path) for _ in range(4)]
+        )
+
+        self.write_test_pcd(seed=42)
+        fou3d.compute_orthographic_projection_images(
+            dataset,
+            size=(30, 30),
+            output_dir=self.temp_dir.name,
+            num_workers=2,
+        )
+
+        metadata = dataset.values("orthographic_projection_metadata")
+        self.assertEqual(len(set(m.filepath for m in metadata)), 4)
+        for m in metadata:
+            self.assertValidProjection(
+                m, get_abs_path("specs/3d/30x30_seed_42_none.png")
+            )
+
 
 class DataModelTests(unittest.TestCase):
     @drop_datasets
@@ -270,14 +292,31 @@ class DataModelTests(unittest.TestCase):
 
 
 class HelperMethodTests(unittest.TestCase):
-    def test_clamp_to_discrete(self):
+    def test_map_to_colormap(self):
         discrete = [0.111, 0.222, 0.333, 0.444, 0.555, 1.0]
+        colormap = {v: v for v in discrete}
         arr = np.array([0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9])
 
         expected = np.array(
             [0.111, 0.111, 0.222, 0.333, 0.444, 0.555, 1.0, 1.0, 1.0, 1.0]
         )
-        actual = fou3d._clamp_to_discrete(arr, discrete)
+        actual = fou3d._map_to_colormap(arr, colormap)
+        self.assertTrue(np.array_equal(expected, actual))
+
+        colormap = {1.0: (255, 0, 0), 0.0: (0, 0, 255), 0.5: (0, 255, 0)}
+        arr = np.array([0.0, 0.2, 0.5, 0.6, 1.0, 1.5])
+
+        expected = np.array(
+            [
+                (0, 0, 255),
+                (0, 255, 0),
+                (0, 255, 0),
+                (255, 0, 0),
+                (255, 0, 0),
+                (255, 0, 0),
+            ]
+        )
+        actual = fou3d._map_to_colormap(arr, colormap)
         self.assertTrue(np.array_equal(expected, actual))
 
 
@@ -5,10 +5,14 @@ FiftyOne utilities unit tests.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import os
 import time
 import unittest
 
 import numpy as np
+from PIL import Image
+
+import eta.core.utils as etau
 
 import fiftyone as fo
 import fiftyone.constants as foc
@@ -62,6 +66,15 @@ class CoreUtilsTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             fou.to_slug("a" * 101)  # too long
 
+    def test_map_batches(self):
+        results = list(fou.map_batches(sum, range(100), 2, batch_size=7))
+
+        batches = [batch for batch, _ in results]
+        self.assertEqual(
+            [x for batch in batches for x in batch], list(range(100))
+        )
+        self.assertEqual([r for _, r in results], [sum(b) for b in batches])
+
 
 class LabelsTests(unittest.TestCase):
     @drop_datasets
@@ -196,6 +209,74 @@ class SerializationTests(unittest.TestCase):
 
         self.assertDictEqual(s1.to_dict(), s2.to_dict())
 
+    def test_serialize_array(self):
+        arrays = [
+            np.random.randn(512).astype(np.float32),
+            np.random.randint(0, 255, size=(4, 5, 3), dtype=np.uint8),
+            np.array(3.0),
+            np.zeros((0, 4), dtype=np.int64),
+            np.asfortranarray(np.arange(12).reshape(3, 4)),
+        ]
+
+        for array in arrays:
+            for compression in (None, "zlib"):
+                b = fou.serialize_array(array, compression=compression)
+                array2 = fou.deserialize_numpy_array(b)
+                self.assertEqual(array2.dtype, array.dtype)
+                self.assertTrue(np.array_equal(array2, array))
+                self.assertTrue(array2.flags.writeable)
+
+            # Legacy format is still supported
+            b = fou.serialize_numpy_array(array)
+            self.assertTrue(
+                np.array_equal(fou.deserialize_numpy_array(b), array)
+            )
+
+        vector = np.random.randn(16).astype(np.float32)
+        b = fou.serialize_array(vector)
+        vector2 = fou.deserialize_numpy_array(b, writable=False)
+        self.assertTrue(np.array_equal(vector2, vector))
+        self.assertFalse(vector2.flags.writeable)
+
+        with self.assertRaises(ValueError):
+            fou.serialize_array(vector, compression="foo")
+
+    @drop_datasets
+    def test_array_fields(self):
+        dataset = fo.Dataset()
+        dataset.add_sample_field("vector", fo.VectorField)
+        dataset.add_sample_field("array", fo.ArrayField)
+
+        vector = np.random.randn(8).astype(np.float32)
+        array = np.random.randint(0, 2, size=(6, 7), dtype=np.uint8)
+
+        sample = fo.Sample(filepath="image.png", vector=vector, array=array)
+        dataset.add_sample(sample)
+
+        # Write a legacy-encoded array directly to the database
+        dataset._sample_collection.update_one(
+            {"_id": sample._id},
+            {"$set": {"legacy": fou.serialize_numpy_array(array)}},
+        )
+        dataset.add_sample_field("legacy", fo.ArrayField)
+
+        dataset.reload()
+        sample = dataset.first()
+
+        self.assertTrue(np.array_equal(sample.vector, vector))
+        self.assertTrue(np.array_equal(sample.array, array))
+        self.assertTrue(np.array_equal(sample.legacy, array))
+
+        # Decoded arrays are writable
+        array = sample.array
+        array[0, 0] = 5
+        sample.array = array
+        sample.save()
+        self.assertEqual(dataset.values("array")[0][0, 0], 5)
+
+        vectors = dataset.values("vector")
+        self.assertTrue(np.array_equal(vectors[0], vector))
+
 
 class MediaTypeTests(unittest.TestCase):
     @drop_datasets
@@ -225,6 +306,47 @@ class MediaTypeTests(unittest.TestCase):
             self.vid_sample.filepath = "image.png"
 
 
+class MetadataTests(unittest.TestCase):
+    @drop_datasets
+    def test_compute_metadata(self):
+        with etau.TempDir() as tmp_dir:
+            filepaths = []
+            for i in range(4):
+                filepath = os.path.join(tmp_dir, "image%d.png" % i)
+                Image.new("RGB", (32 + i, 16)).save(filepath)
+                filepaths.append(filepath)
+
+            dataset = fo.Dataset()
+            dataset.add_samples(
+                [fo.Sample(filepath=filepath) for filepath in filepaths]
+            )
+
+            dataset.compute_metadata(num_workers=1)
+            self.assertListEqual(
+                dataset.values("metadata.width"), [32, 33, 34, 35]
+            )
+
+            dataset.clear_sample_field("metadata")
+            dataset.compute_metadata(num_workers=2)
+            self.assertListEqual(
+                dataset.values("metadata.width"), [32, 33, 34, 35]
+            )
+
+            # Metadata of unmodified media is not recomputed
+            dataset.set_values("metadata.width", [0, 0, 0, 0])
+            Image.new("RGB", (64, 64)).save(filepaths[0])
+
+            dataset.compute_metadata(num_workers=1, refresh_stale=True)
+            self.assertListEqual(
+                dataset.values("metadata.width"), [64, 0, 0, 0]
+            )
+
+            dataset.compute_metadata(num_workers=1, overwrite=True)
+            self.assertListEqual(
+                dataset.values("metadata.width"), [64, 33, 34, 35]
+            )
+
+
 class MigrationTests(unittest.TestCase):
     def test_runner(self):
         def revs(versions):
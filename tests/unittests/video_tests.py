@@ -206,6 +206,43 @@ class VideoTests(unittest.TestCase):
 
         self.assertListEqual(frame_numbers2, [2, 4])
 
+    @drop_datasets
+    def test_iter_frames(self):
+        sample = fo.Sample(filepath="video.mp4")
+        sample.frames[1] = fo.Frame(i=1)
+        sample.frames[1000] = fo.Frame(i=1000)
+        sample.frames[1000000] = fo.Frame(i=1000000)
+
+        dataset = fo.Dataset()
+        dataset.add_sample(sample)
+
+        # Sparse frame numbers are merged with pending replacements, and
+        # pending deletions are respected
+        sample.frames[500] = fo.Frame(i=500)
+        del sample.frames[1000]
+
+        frame_numbers = [f.frame_number for f in sample.frames.iter_frames()]
+        self.assertListEqual(frame_numbers, [1, 500, 1000000])
+        self.assertListEqual(list(sample.frames.keys()), [1, 500, 1000000])
+        self.assertSetEqual(set(sample.frames._replacements.keys()), {500})
+
+        sample.save()
+
+        # Frames are not retained after iteration
+        for frame in sample.frames.iter_frames(autosave=True, batch_size=2):
+            frame["j"] = frame["i"] + 1
+
+        self.assertDictEqual(sample.frames._replacements, {})
+        self.assertListEqual(dataset.values("frames.j"), [[2, 501, 1000001]])
+
+        view = dataset.select_fields("frames.i")
+        sample_view = view.first()
+        for frame in sample_view.frames.iter_frames(autosave=True):
+            frame["i"] += 1
+
+        self.assertListEqual(dataset.values("frames.i"), [[2, 501, 1000001]])
+        self.assertListEqual(dataset.values("frames.j"), [[2, 501, 1000001]])
+
     @drop_datasets
     def test_expand_schema(self):
         # None-valued new frame fields are ignored for schema expansion
@@ -45,6 +45,35 @@ class DatasetViewTests(unittest.TestCase):
         self.assertEqual(view1, view2)
         self.assertEqual(view1, view3)
 
+    @drop_datasets
+    def test_pipeline_cache(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.jpg" % i, i=i) for i in range(5)]
+        )
+
+        view = dataset.match(F("i") > 1).exclude_fields("i")
+
+        compiled = view._compile_stages()
+        self.assertIs(view._compile_stages(), compiled)
+        self.assertListEqual(view._pipeline(), view._pipeline())
+        self.assertEqual(len(view), 3)
+
+        # Modifying the view's stages invalidates the cache
+        view._stages.append(fosg.Limit(2))
+        self.assertIsNot(view._compile_stages(), compiled)
+        self.assertEqual(len(view), 2)
+
+        # Modifying the dataset's schema invalidates the cache
+        compiled = view._compile_stages()
+        dataset.add_sample_field("j", fo.IntField)
+        self.assertIsNot(view._compile_stages(), compiled)
+
+        schema = view.get_field_schema()
+        self.assertIn("j", schema)
+        self.assertNotIn("i", schema)
+        self.assertEqual(len(view), 2)
+
     @drop_datasets
     def test_iter_samples(self):
         dataset = fo.Dataset()
@@ -3072,6 +3101,35 @@ class ViewStageTests(unittest.TestCase):
         for sample, _id in zip(view, ids):
             self.assertEqual(sample.id, _id)
 
+        ids = self.dataset.values("id")
+        missing_id = str(ObjectId())
+
+        # Duplicate and missing IDs
+        values = ids[::-1] + [missing_id] + ids
+        view = self.dataset.select(values, ordered=True)
+        self.assertListEqual(view.values("id"), ids[::-1])
+
+        values = [ids[1], missing_id, ids[0]]
+        view = self.dataset.select_by("id", values, ordered=True)
+        self.assertListEqual(view.values("id"), [ids[1], ids[0]])
+
+        # Lists whose sorted copy does not fit in the pipeline are ordered via
+        # `$indexOfArray`
+        max_bytes = fosg._MAX_SELECT_ORDER_BYTES
+        oids = [ObjectId(_id) for _id in ids]
+        fosg._MAX_SELECT_ORDER_BYTES = 2 * fosg._get_bson_size(oids) + 1
+        try:
+            view = self.dataset.select(ids[::-1], ordered=True)
+            self.assertIn("$indexOfArray", str(view._pipeline()))
+            self.assertListEqual(view.values("id"), ids[::-1])
+
+            # Lists that cannot be ordered within the limit
+            with self.assertRaises(ValueError):
+                view = self.dataset.select(ids * 2, ordered=True)
+                view._pipeline()
+        finally:
+            fosg._MAX_SELECT_ORDER_BYTES = max_bytes
+
     def test_select_by(self):
         filepaths = self.dataset.values("filepath")
 
@@ -3166,6 +3224,29 @@ class ViewStageTests(unittest.TestCase):
         result = list(self.dataset.take(1))
         self.assertIs(len(result), 1)
 
+        ids = self.dataset.values("id")
+
+        for size in range(len(ids) + 2):
+            view = self.dataset.take(size, seed=51)
+            take_ids = view.values("id")
+
+            self.assertEqual(len(take_ids), min(size, len(ids)))
+            self.assertEqual(len(set(take_ids)), len(take_ids))
+            self.assertListEqual(
+                self.dataset.take(size, seed=51).values("id"), take_ids
+            )
+
+    def test_shuffle(self):
+        ids = self.dataset.values("id")
+
+        shuffle_ids = self.dataset.shuffle(seed=51).values("id")
+
+        self.assertEqual(len(shuffle_ids), len(ids))
+        self.assertSetEqual(set(shuffle_ids), set(ids))
+        self.assertListEqual(
+            self.dataset.shuffle(seed=51).values("id"), shuffle_ids
+        )
+
     def test_uuids(self):
         stage = fosg.Take(1)
         stage_dict = stage._serialize()